@@ -0,0 +1,78 @@
+# Launch-date parsing: the original to_datetime + .apply path vs
+# space_missions.dates, on the real Datum strings resampled to N rows.
+#
+#   python benchmarks/bench_dates.py --rows 1000000
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from space_missions.data import DATASET_PATH
+from space_missions.dates import add_date_parts, parse_launch_dates
+
+
+def original(datum):
+    df = pd.DataFrame({'Datum': datum})
+    df['date'] = pd.to_datetime(df['Datum'], infer_datetime_format=True)
+    df['year'] = df['date'].apply(lambda datetime: datetime.year)
+    df['month'] = df['date'].apply(lambda datetime: datetime.month)
+    df['weekday'] = df['date'].apply(lambda datetime: datetime.weekday())
+    return df
+
+
+def dedicated(datum):
+    df = pd.DataFrame({'Datum': datum})
+    dates, unparsed = parse_launch_dates(df['Datum'])
+    assert not len(unparsed)
+    return add_date_parts(df, dates)
+
+
+def make_datum(rows, distinct, seed=0):
+    # 'resampled' reuses the dataset's ~4.3k strings, 'distinct' draws
+    # random minutes between 1957 and 2020 so nearly every row is unique
+    rng = np.random.default_rng(seed)
+    if not distinct:
+        datum = pd.read_csv(DATASET_PATH, usecols=['Datum'])['Datum']
+        return pd.Series(rng.choice(datum.to_numpy(), rows))
+    start = pd.Timestamp('1957-10-04').value // 60_000_000_000
+    end = pd.Timestamp('2020-08-07').value // 60_000_000_000
+    minutes = rng.integers(start, end, rows)
+    stamps = pd.to_datetime(minutes, unit='m')
+    with_time = pd.Series(stamps.strftime('%a %b %d, %Y %H:%M UTC'))
+    without_time = pd.Series(stamps.strftime('%a %b %d, %Y'))
+    return with_time.where(rng.random(rows) > 0.03, without_time)
+
+
+def timed(fn, datum):
+    start = time.perf_counter()
+    df = fn(datum)
+    return time.perf_counter() - start, df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--distinct', action='store_true')
+    args = parser.parse_args()
+
+    datum = make_datum(args.rows, args.distinct)
+    print('%d rows, %d distinct Datum strings' % (len(datum), datum.nunique()))
+
+    warnings.filterwarnings('ignore')
+    t_old, old = timed(original, datum)
+    t_new, new = timed(dedicated, datum)
+    for col in ['year', 'month', 'weekday']:
+        assert (old[col].to_numpy() == new[col].to_numpy()).all(), col
+
+    print('original  %8.2fs' % t_old)
+    print('dedicated %8.2fs  (%.1fx)' % (t_new, t_old / t_new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# Global filter selection: the bitmap index (space_missions.filters) against
+# boolean masks over the launch columns, for a few filter states at several
+# multiples of the dataset size. That both select the same rows is checked in
+# tests/test_filters.py.
+#
+#   python benchmarks/bench_filters.py --scales 1 10 100
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_pages import scaled_launches
+from space_missions.filters import FILTER_COLUMNS, build_index, select_rows
+
+
+STATES = {
+    'years': {'year': (1970, 1991)},
+    'countries': {'country': ['USA', 'China', 'India']},
+    'cold war': {'year': (None, 1991), 'country': ['USA', 'Kazakhstan', 'Russian Federation']},
+    'all five': {
+        'year': (1990, 2020),
+        'country': ['USA', 'China', 'France'],
+        'Company Name': ['SpaceX', 'CASC', 'Arianespace', 'ULA'],
+        'Status Mission': ['Success', 'Partial Failure'],
+        'Status Rocket': ['StatusActive'],
+    },
+}
+
+
+def mask_rows(df, where):
+    # the same selection with one boolean mask per condition
+    mask = np.ones(len(df), dtype=bool)
+    for col, cond in where.items():
+        if col == 'year':
+            lo, hi = cond
+            if lo is not None:
+                mask &= (df['year'] >= lo).to_numpy()
+            if hi is not None:
+                mask &= (df['year'] <= hi).to_numpy()
+        else:
+            mask &= df[col].isin(cond).to_numpy()
+    return np.flatnonzero(mask)
+
+
+def best_of(fn, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    for scale in args.scales:
+        df = scaled_launches(scale)[FILTER_COLUMNS]
+        seconds, index = best_of(lambda: build_index(df), args.repeat)
+        print('%4dx %9d rows  index build %8.1f ms' % (scale, len(df), seconds * 1000))
+        for name, where in STATES.items():
+            mask_seconds, _ = best_of(lambda: mask_rows(df, where), args.repeat)
+            index_seconds, rows = best_of(lambda: select_rows(index, where), args.repeat)
+            print('      %-10s %9d rows  masks %8.2f ms  bitmaps %8.2f ms' % (
+                name, len(rows), mask_seconds * 1000, index_seconds * 1000
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# Cold-start import cost measured with `python -X importtime`: the imports the
+# monolithic app.py used to run on every start, the page registry app.py runs
+# now, and the registry plus each page module as it is first selected.
+#
+#   python benchmarks/bench_importtime.py [--repeat 5] [--top 10]
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from space_missions.navigation import PAGES
+
+
+MONOLITHIC = [
+    'import numpy',
+    'import pandas',
+    'import streamlit',
+    'import plotly.express',
+    'import plotly.graph_objects',
+    'from plotly.subplots import make_subplots',
+    'import matplotlib',
+    'import matplotlib.pyplot',
+    'from PIL import Image',
+    'import space_missions.companies',
+    'import space_missions.cube',
+    'import space_missions.data',
+    'import space_missions.figures',
+    'import space_missions.ranking',
+]
+REGISTRY = ['import streamlit', 'import space_missions.navigation']
+
+
+def import_times(statements):
+    # (self us, cumulative us, module) for every module the statements import
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', '; '.join(statements)],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, module = line[len('import time:'):].split('|')
+        rows.append((int(own), int(cumulative), module.rstrip()))
+    return rows
+
+
+def best_of(statements, repeat):
+    # the run with the lowest total, so OS file caching doesn't count
+    runs = [import_times(statements) for _ in range(repeat)]
+    return min(runs, key=lambda rows: sum(r[0] for r in rows))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    import_times(MONOLITHIC)  # warm the file cache
+    scenarios = [('monolithic app.py', MONOLITHIC), ('page registry', REGISTRY)]
+    scenarios += [
+        ('registry + %s' % label, REGISTRY + ['import space_missions.views.%s' % module])
+        for label, module in PAGES
+    ]
+
+    results = dict()
+    print('%-36s %10s %8s' % ('scenario', 'ms', 'modules'))
+    for name, statements in scenarios:
+        rows = best_of(statements, args.repeat)
+        results[name] = rows
+        print('%-36s %10.1f %8d' % (name, sum(r[0] for r in rows) / 1000, len(rows)))
+
+    for name in ['monolithic app.py', 'page registry']:
+        # top-level imports are the rows whose module name is not indented
+        top = sorted(
+            [r for r in results[name] if not r[2].startswith('  ')],
+            key=lambda r: r[1], reverse=True
+        )[:args.top]
+        print('\nslowest top-level imports, %s' % name)
+        for own, cumulative, module in top:
+            print('  %-40s %10.1f ms' % (module.strip(), cumulative / 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# Incremental ingestion vs a full rebuild, at several multiples of the dataset
+# size. The existing launches are those before a date, synthetic ones at
+# scales above 1; the delta is the real launches from that date on plus rows
+# re-sent from the existing ones. A rebuild cleans and aggregates every row,
+# while an append only cleans the delta and merges aggregates whose size
+# follows the number of cells, not of launches, so it costs about the same at
+# every scale. At 1x, with a delta of a twentieth of the launches, the two
+# take about as long; from 10x on the append is several times faster. That
+# the appended state matches a rebuild is checked in tests/test_ingest.py.
+#
+#   python benchmarks/bench_ingest.py [--split 2019-01-01] [--scales 1 10 100]
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from space_missions.companies import build_company_profile
+from space_missions.cube import build_cube
+from space_missions.data import RAW_COLUMNS, clean_launches, read_raw
+from space_missions.dates import parse_launch_dates
+from space_missions.ingest import LaunchState
+from space_missions.sketches import build_cost_sketches
+from space_missions.synthetic import generate
+
+
+def split_launches(raw, split):
+    dates, _ = parse_launch_dates(raw['Datum'])
+    newer = (dates >= pd.Timestamp(split, tz='UTC')).to_numpy()
+    return raw[~newer], raw[newer]
+
+
+def existing_launches(old, scale, split):
+    # the real launches before split at 1x, as many synthetic ones otherwise
+    if scale == 1:
+        return old
+    rows = pd.concat(generate(len(old) * scale), ignore_index=True).set_axis(RAW_COLUMNS, axis=1)
+    return split_launches(rows, split)[0]
+
+
+def full_rebuild(raw):
+    launches = clean_launches(raw.copy())
+    return build_cube(launches), build_company_profile(launches), build_cost_sketches(launches)
+
+
+def best_of(fn, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--split', default='2019-01-01')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    old, new = split_launches(read_raw().set_axis(RAW_COLUMNS, axis=1), args.split)
+    for scale in args.scales:
+        existing = existing_launches(old, scale, args.split)
+        delta = pd.concat([new, existing.sample(20, random_state=0)])
+        t_full, _ = best_of(lambda: full_rebuild(pd.concat([existing, new])), args.repeat)
+
+        base = clean_launches(existing.copy())
+        t_inc = []
+        for _ in range(args.repeat):
+            state = LaunchState(base)
+            start = time.perf_counter()
+            report, _ = state.append(delta.copy())
+            t_inc.append(time.perf_counter() - start)
+
+        print('%4dx %9d existing rows, delta of %d: %s' % (scale, len(existing), len(delta), report))
+        print('      full rebuild %8.1f ms  (clean + aggregate)' % (t_full * 1000))
+        print('      incremental  %8.1f ms  %.1fx' % (min(t_inc) * 1000, t_full / min(t_inc)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# Headless timings of every chart's data preparation, without Streamlit: the
+# inputs of space_missions.analytics (cube, company profile, daily counts,
+# cost sketches, rocket cube) built from the launches, then each dataset
+# computed from them, at several multiples of the dataset size, synthetic
+# above 1x. Each step is timed (best of --repeat) and run once more under
+# tracemalloc for its peak memory.
+#
+#   python benchmarks/bench_pages.py --scales 1 10 100 --out bench_pages.json
+import argparse
+import inspect
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from space_missions import analytics
+from space_missions.cadence import daily_counts
+from space_missions.companies import build_company_profile
+from space_missions.cube import build_cube
+from space_missions.data import clean_launches, load_launches
+from space_missions.rockets import build_rocket_cube, build_rocket_index
+from space_missions.sketches import build_cost_sketches
+from space_missions.synthetic import generate
+
+
+def scaled_launches(scale, seed=0):
+    # the real launches at 1x, synthetic ones at other scales
+    if scale == 1:
+        return load_launches()
+    rows = len(load_launches(['year'])) * scale
+    return clean_launches(pd.concat(generate(rows, seed), ignore_index=True))
+
+
+def chart_steps(inputs):
+    # (dataset name, function, kwargs) for every chart of every page, in page order
+    steps = []
+    for name, function in analytics.datasets().items():
+        params = inspect.signature(function).parameters
+        kwargs = {arg: inputs[arg] for arg in params if arg in inputs}
+        steps.append((name, function, kwargs))
+    return steps
+
+
+def measure(fn, kwargs, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(**kwargs)
+        seconds.append(time.perf_counter() - start)
+    tracemalloc.start()
+    result = fn(**kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(seconds), peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--k', type=int, default=1, help='Best Every Year leaders per year')
+    parser.add_argument('--out', default='bench_pages.json')
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    results = []
+    for scale in args.scales:
+        df = scaled_launches(scale)
+        print('scale %dx, %d rows' % (scale, len(df)))
+
+        seconds, peak, cube = measure(build_cube, {'df': df}, args.repeat)
+        results.append({'scale': scale, 'rows': len(df), 'step': 'cube', 'seconds': seconds, 'peak_bytes': peak})
+        seconds, peak, profile = measure(build_company_profile, {'df': df}, args.repeat)
+        results.append({'scale': scale, 'rows': len(df), 'step': 'company_profile', 'seconds': seconds, 'peak_bytes': peak})
+
+        seconds, peak, daily = measure(daily_counts, {'dates': df['date']}, args.repeat)
+        results.append({'scale': scale, 'rows': len(df), 'step': 'daily_counts', 'seconds': seconds, 'peak_bytes': peak})
+
+        seconds, peak, costs = measure(build_cost_sketches, {'df': df}, args.repeat)
+        results.append({'scale': scale, 'rows': len(df), 'step': 'cost_sketches', 'seconds': seconds, 'peak_bytes': peak})
+
+        seconds, peak, rockets = measure(lambda df: build_rocket_cube(df, build_rocket_index(df['Detail'])), {'df': df}, args.repeat)
+        results.append({'scale': scale, 'rows': len(df), 'step': 'rocket_cube', 'seconds': seconds, 'peak_bytes': peak})
+
+        inputs = {'cube': cube, 'profile': profile, 'daily': daily, 'costs': costs, 'rockets': rockets, 'k': args.k}
+        for chart_id, prep, kwargs in chart_steps(inputs):
+            seconds, peak, _ = measure(prep, kwargs, args.repeat)
+            results.append({'scale': scale, 'rows': len(df), 'step': chart_id, 'seconds': seconds, 'peak_bytes': peak})
+
+    report = pd.DataFrame(results)
+    table = report.pivot(index='step', columns='scale', values='seconds') * 1000
+    table = table.reindex(report['step'].drop_duplicates())
+    print('\nms per step')
+    print(table.round(2).to_string())
+    peak = report.pivot(index='step', columns='scale', values='peak_bytes') / 2 ** 20
+    print('\npeak MiB per step')
+    print(peak.reindex(table.index).round(2).to_string())
+
+    with open(args.out, 'w') as f:
+        json.dump({
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'repeat': args.repeat,
+            'k': args.k,
+            'results': results,
+        }, f, indent=1)
+    print('\nwrote %s' % args.out)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# Rocket families from Detail: parsing the distinct values once and grouping on
+# codes (space_missions.rockets) against regular expressions over every row,
+# at several multiples of the dataset size. Checks that both count the same
+# launches and successes per family, and select the same rows for one family.
+#
+#   python benchmarks/bench_rockets.py --scales 1 10 100
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_pages import scaled_launches
+from space_missions import rockets
+from space_missions.cube import rollup
+
+
+FAMILY = 'Soyuz'
+
+
+def row_families(df):
+    # the family of every row, parsed row by row
+    variants = df['Detail'].str.extract(rockets.DETAIL_PATTERN)['variant']
+    families = variants.str.extract(rockets.FAMILY_PATTERN)['family']
+    return families.replace(rockets.FAMILY_ALIASES).fillna(rockets.UNKNOWN)
+
+
+def row_stats(df):
+    families = row_families(df)
+    success = df['Status Mission'] == 'Success'
+    return success.groupby(families).agg(['size', 'sum']).sort_index()
+
+
+def best_of(fn, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    for scale in args.scales:
+        df = scaled_launches(scale)[rockets.ROCKET_COLUMNS]
+
+        def index_build():
+            # from an empty memo, so the distinct values are parsed every time
+            rockets._parsed.clear()
+            return rockets.build_rocket_index(df['Detail'])
+
+        seconds, index = best_of(index_build, args.repeat)
+        print('%4dx %9d rows  index build %8.1f ms, %d distinct details, %d families' % (
+            scale, len(df), seconds * 1000, len(index['payloads']), len(index['families'])
+        ))
+        row_seconds, expected = best_of(lambda: row_stats(df), args.repeat)
+        cube_seconds, cube = best_of(lambda: rockets.build_rocket_cube(df, index), args.repeat)
+        assert np.array_equal(rollup(cube, ['family']).to_numpy(), expected['size'].to_numpy())
+        assert np.array_equal(rollup(cube, ['family'], measure='successes').to_numpy(), expected['sum'].to_numpy())
+        print('      family stats   per row %8.1f ms  rocket cube %8.1f ms' % (row_seconds * 1000, cube_seconds * 1000))
+
+        row_seconds, expected = best_of(lambda: np.flatnonzero((row_families(df) == FAMILY).to_numpy()), args.repeat)
+        index_seconds, rows = best_of(lambda: rockets.family_rows(index, FAMILY), args.repeat)
+        assert np.array_equal(rows, expected)
+        print('      %-14s per row %8.1f ms  index       %8.3f ms  %d rows' % (
+            FAMILY + ' rows', row_seconds * 1000, index_seconds * 1000, len(rows)
+        ))
+    print('the index and rocket cube match the row-by-row parse')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# The launch-site map's data: one point per launch, joined to its site's
+# coordinates, against the sites and hexagons rolled up from the cube
+# (space_missions.sitemap), at several multiples of the dataset size. Prints
+# the time to build each and the size of the deck JSON sent to the browser,
+# and checks that sites and hexagons count the same launches and successes as
+# the rows.
+#
+#   python benchmarks/bench_sites.py --scales 1 10 100
+import argparse
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_pages import scaled_launches
+from space_missions.cube import build_cube
+from space_missions.sitemap import build_site_table, hex_bins, site_deck
+from space_missions.sites import site_coordinates
+
+
+HEX_SIZE = 5
+
+
+def launch_points(df):
+    # every launch as a point of its own, as a map without binning draws it
+    points = df[['launch_site', 'Status Mission']].join(site_coordinates(), on='launch_site')
+    return points.assign(launches=1, success_rate=(points['Status Mission'] == 'Success') * 100.0)
+
+
+def best_of(fn, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    for scale in args.scales:
+        df = scaled_launches(scale)
+        cube = build_cube(df)
+        launches = len(df)
+        successes = int((df['Status Mission'] == 'Success').sum())
+        print('%4dx %9d rows' % (scale, launches))
+
+        seconds, points = best_of(lambda: launch_points(df), args.repeat)
+        payload = len(site_deck(points).to_json()) if scale == 1 else None
+        print('      per launch  %8.1f ms  %8d points  deck %s' % (
+            seconds * 1000, len(points), '%d bytes' % payload if payload else 'not serialized'
+        ))
+
+        seconds, sites = best_of(lambda: build_site_table(cube), args.repeat)
+        assert (sites['launches'].sum(), sites['successes'].sum()) == (launches, successes), 'site totals differ'
+        print('      per site    %8.1f ms  %8d points  deck %d bytes' % (seconds * 1000, len(sites), len(site_deck(sites).to_json())))
+
+        seconds, hexes = best_of(lambda: hex_bins(sites, HEX_SIZE), args.repeat)
+        assert (hexes['launches'].sum(), hexes['successes'].sum()) == (launches, successes), 'hexagon totals differ'
+        print('      per hexagon %8.1f ms  %8d points  deck %d bytes' % (seconds * 1000, len(hexes), len(site_deck(hexes).to_json())))
+    print('sites and hexagons count the same launches as the rows')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# Cost quantiles per year, company and country from the bucket sketches
+# (space_missions.sketches) against an exact groupby quantile, which sorts the
+# costs of each group, at several multiples of the dataset size. Checks that
+# every sketch quantile is within ALPHA of the exact one, and that sketches
+# built chunk by chunk and merged equal the one built in a single pass.
+#
+#   python benchmarks/bench_sketches.py --scales 1 10 100
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_pages import scaled_launches
+from space_missions.sketches import ALPHA, DIMENSIONS, QUANTILES, build_cost_sketches, cost_quantiles, merge_cost_sketches
+
+
+GROUPS = [['year'], ['Company Name'], ['country']]
+
+
+def exact_quantiles(df, by):
+    # the same ranks as cost_quantiles: the 'lower' interpolation
+    grouped = df['Rocket'].astype('float64').groupby([df[col] for col in by], observed=True)
+    return {column: grouped.quantile(q, interpolation='lower').dropna() for q, column in QUANTILES.items()}
+
+
+def best_of(fn, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--chunks', type=int, default=8, help='pieces to build and merge sketches from')
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    for scale in args.scales:
+        df = scaled_launches(scale)[DIMENSIONS + ['Rocket']]
+        seconds, sketches = best_of(lambda: build_cost_sketches(df), args.repeat)
+        print('%4dx %9d rows  sketch build %8.1f ms, %d cells' % (scale, len(df), seconds * 1000, len(sketches)))
+
+        bounds = np.linspace(0, len(df), args.chunks + 1).astype(int)
+        pieces = [build_cost_sketches(df.iloc[lo:hi]) for lo, hi in zip(bounds[:-1], bounds[1:])]
+        seconds, merged = best_of(lambda: merge_cost_sketches(*pieces), args.repeat)
+        assert merged.equals(sketches), 'merged sketches differ'
+        print('      merge of %d    %8.1f ms' % (args.chunks, seconds * 1000))
+
+        for by in GROUPS:
+            exact_seconds, expected = best_of(lambda: exact_quantiles(df, by), args.repeat)
+            sketch_seconds, result = best_of(lambda: cost_quantiles(sketches, by), args.repeat)
+            error = 0.0
+            for column, values in expected.items():
+                values = values.rename_axis(by)
+                estimate = result[column].reindex(values.index)
+                error = max(error, float(((estimate - values).abs() / values).max()))
+            assert error <= ALPHA, (by, error)
+            print('      %-14s exact %8.2f ms  sketch %8.2f ms  max relative error %.4f' % (
+                ', '.join(by), exact_seconds * 1000, sketch_seconds * 1000, error
+            ))
+    print('sketch quantiles are within %g of the exact ones' % ALPHA)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# Chunked ingestion vs the eager load on a synthetic CSV of N x the launches:
+# time and peak RSS of building the cube, company profile and cost sketches
+# each way, each in a fresh process, and a check that both produce the same
+# aggregates.
+#
+#   python benchmarks/bench_stream.py --scale 100 --chunk-rows 100000 50000
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import warnings
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from space_missions.companies import build_company_profile
+from space_missions.cube import build_cube
+from space_missions.data import clean_launches, read_raw
+from space_missions.sketches import build_cost_sketches
+from space_missions.stream import AGGREGATE_COLUMNS, aggregate_launches, iter_launches
+from space_missions.synthetic import write_synthetic
+
+
+def eager(path, rows):
+    launches = clean_launches(read_raw(path))
+    return build_cube(launches), build_company_profile(launches), build_cost_sketches(launches)
+
+
+def chunked(path, rows):
+    # no snapshot next to the synthetic file, so this reads the CSV
+    chunks = iter_launches(path, os.path.join(os.path.dirname(path), 'none'), rows, AGGREGATE_COLUMNS)
+    return aggregate_launches(chunks)
+
+
+def peak_rss():
+    # MB; VmHWM belongs to this process image, while ru_maxrss on Linux keeps
+    # the parent's peak across the exec that spawned it
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(mode, path, rows):
+    warnings.filterwarnings('ignore')
+    start = time.perf_counter()
+    aggregates = {'eager': eager, 'chunked': chunked}[mode](path, rows)
+    seconds = time.perf_counter() - start
+    return (seconds, peak_rss()) + aggregates
+
+
+def in_fresh_process(*args):
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        return pool.apply(run, args)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=100)
+    parser.add_argument('--chunk-rows', type=int, nargs='+', default=[100_000])
+    parser.add_argument('--csv', help='use this CSV instead of generating one')
+    args = parser.parse_args()
+
+    path = args.csv
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), 'synthetic.csv')
+        rows = int(round(len(read_raw()) * args.scale))
+        write_synthetic(path, rows)
+    print('%s: %.1f MB' % (path, os.path.getsize(path) / 1e6))
+
+    seconds, peak, cube, profile, costs = in_fresh_process('eager', path, None)
+    print('eager                  %8.1fs  peak RSS %7.0f MB' % (seconds, peak))
+    for rows in args.chunk_rows:
+        seconds, peak, chunk_cube, chunk_profile, chunk_costs = in_fresh_process('chunked', path, rows)
+        pd.testing.assert_frame_equal(chunk_cube, cube)
+        pd.testing.assert_frame_equal(chunk_profile, profile)
+        pd.testing.assert_frame_equal(chunk_costs, costs)
+        print('chunked %8d rows %8.1fs  peak RSS %7.0f MB' % (rows, seconds, peak))
+    print('chunked aggregates match the eager load')
+    if not args.csv:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
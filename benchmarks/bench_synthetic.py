@@ -0,0 +1,76 @@
+# Synthetic dataset generation: throughput and peak RSS of streaming N x the
+# launches to disk, then how far the generated launches' distributions are
+# from the real ones (total variation distance, 0 = identical shares).
+#
+#   python benchmarks/bench_synthetic.py --scale 1000 [--out /tmp/synthetic.csv]
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from space_missions.data import clean_launches, read_raw
+from space_missions.synthetic import CHUNK_ROWS, write_synthetic
+
+
+# single columns and the pairs whose correlation the generator must keep
+COMPARED = [
+    ['Company Name'],
+    ['Location'],
+    ['Status Mission'],
+    ['Status Rocket'],
+    ['costed'],
+    ['year'],
+    ['Company Name', 'Status Mission'],
+    ['Company Name', 'year'],
+    ['Company Name', 'costed'],
+    ['country', 'year'],
+]
+
+
+def shares(df, columns):
+    return df.assign(costed=df['Rocket'] > 0).groupby(columns, observed=True).size() / len(df)
+
+
+def total_variation(real, synthetic, columns):
+    a, b = shares(real, columns).align(shares(synthetic, columns), fill_value=0)
+    return (a - b).abs().sum() / 2
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--sample-rows', type=int, default=1_000_000,
+                        help='generated rows read back for the distribution check')
+    parser.add_argument('--out', help='keep the generated file here')
+    args = parser.parse_args()
+
+    real = clean_launches(read_raw())
+    rows = int(round(len(real) * args.scale))
+    out = args.out or os.path.join(tempfile.mkdtemp(), 'synthetic.csv')
+
+    start = time.perf_counter()
+    write_synthetic(out, rows, args.seed, args.chunk_rows)
+    seconds = time.perf_counter() - start
+    size = os.path.getsize(out)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print('%d rows, %.1f MB in %.1fs: %.0f rows/s, %.1f MB/s, peak RSS %.0f MB'
+          % (rows, size / 1e6, seconds, rows / seconds, size / 1e6 / seconds, peak))
+
+    synthetic = clean_launches(pd.read_csv(out, nrows=args.sample_rows))
+    print('\ntotal variation distance over the first %d rows' % len(synthetic))
+    for columns in COMPARED:
+        print('  %-32s %.4f' % (' x '.join(columns), total_variation(real, synthetic, columns)))
+    if not args.out:
+        os.remove(out)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+# The space-missions command line: the chart datasets of space_missions.analytics
+# without a Streamlit server.
+#
+#   python -m space_missions list
+#   python -m space_missions show best.countries --param k=3 --years 1990 2020
+#   python -m space_missions show rockets.families --param top=None
+#   python -m space_missions export --all --format parquet --out exports
+#   python -m space_missions export geo.map --country USA --country China --format json
+#   python -m space_missions report --out report --workers 4
+import argparse
+import os
+import sys
+import time
+
+from space_missions import analytics
+
+
+# parameters where None means no limit, e.g. rockets.families top=None for
+# every family
+UNLIMITED = ['top']
+
+
+def parse_value(value):
+    # None, an integer or a number, else the text itself
+    if value == 'None':
+        return None
+    for kind in (int, float):
+        try:
+            return kind(value)
+        except ValueError:
+            pass
+    return value
+
+
+def parse_param(text):
+    # name=value, with the value read by parse_value
+    name, sep, value = text.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError('expected name=value, not %r' % text)
+    return name, parse_value(value)
+
+
+def fits(name, value, default):
+    # whether value can stand in for a parameter's default: of its type, an
+    # integer for a number, anything for a None default, and None where it
+    # means no limit
+    if value is None:
+        return default is None or name in UNLIMITED
+    if default is None:
+        return True
+    if isinstance(default, float):
+        return isinstance(value, (int, float))
+    return type(value) is type(default)
+
+
+def filters(args):
+    # the where of space_missions.filters from the filter options
+    where = dict()
+    if args.years:
+        where['year'] = tuple(args.years)
+    for col, values in [
+        ('country', args.country),
+        ('Company Name', args.company),
+        ('Status Mission', args.mission_status),
+        ('Status Rocket', args.rocket_status),
+    ]:
+        if values:
+            where[col] = values
+    return where
+
+
+def params_for(name, params):
+    # the --param values this dataset takes; the others are for other datasets
+    accepted = analytics.dataset_params(name)
+    return {p: v for p, v in params.items() if p in accepted}
+
+
+def bad_values(name, params):
+    # 'param=value' for each --param value this dataset cannot take
+    defaults = analytics.dataset_params(name)
+    return ['%s=%s' % (p, v) for p, v in params_for(name, params).items() if not fits(p, v, defaults[p])]
+
+
+def unknown_params(names, params):
+    # the --param names none of the datasets takes
+    accepted = set()
+    for name in names:
+        accepted.update(analytics.dataset_params(name))
+    return sorted(set(params) - accepted)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='space-missions', description='Space missions datasets.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help='list the datasets and their parameters')
+
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument('--years', type=int, nargs=2, metavar=('FIRST', 'LAST'))
+    options.add_argument('--country', action='append')
+    options.add_argument('--company', action='append')
+    options.add_argument('--mission-status', action='append')
+    options.add_argument('--rocket-status', action='append')
+
+    param_options = argparse.ArgumentParser(add_help=False)
+    param_options.add_argument('--param', type=parse_param, action='append', default=[], metavar='NAME=VALUE')
+
+    show = commands.add_parser('show', parents=[options, param_options], help='print one dataset')
+    show.add_argument('name')
+
+    export = commands.add_parser('export', parents=[options, param_options], help='write datasets to files')
+    export.add_argument('names', nargs='*')
+    export.add_argument('--all', action='store_true')
+    export.add_argument('--format', choices=analytics.FORMATS, default='csv')
+    export.add_argument('--out', default='exports')
+
+    report = commands.add_parser('report', parents=[options], help='write every chart as static HTML and figure JSON')
+    report.add_argument('--out', default='report')
+    report.add_argument('--workers', type=int, help='processes building charts, 0 to build them here; one per CPU by default')
+    report.add_argument('--topojson', help="local copy of plotly's topojson files for the maps")
+    args = parser.parse_args()
+
+    names = list(analytics.datasets())
+    if args.command == 'list':
+        for name in names:
+            params = analytics.dataset_params(name)
+            print(name, ' '.join('%s=%s' % item for item in params.items()))
+        return
+
+    if args.command == 'report':
+        from space_missions.report import write_report
+
+        start = time.perf_counter()
+        timings = write_report(args.out, filters(args), args.workers, args.topojson)
+        print((timings * 1000).round(1).to_string())
+        print('%d charts in %.1fs, written to %s' % (len(timings), time.perf_counter() - start, args.out))
+        if not args.topojson:
+            print('no --topojson given: the maps stay blank offline', file=sys.stderr)
+        return
+
+    params = dict(args.param)
+    if args.command == 'show':
+        if args.name not in names:
+            parser.error('no dataset %s; see list' % args.name)
+        unknown = unknown_params([args.name], params)
+        if unknown:
+            parser.error('%s takes no parameter %s; see list' % (args.name, ', '.join(unknown)))
+        bad = bad_values(args.name, params)
+        if bad:
+            parser.error('%s cannot take %s; see list for the defaults' % (args.name, ', '.join(bad)))
+        df = analytics.dataset(args.name, filters(args), **params_for(args.name, params))
+        print(df.to_string(index=False))
+        return
+
+    if args.all:
+        args.names = names
+    if not args.names:
+        parser.error('export needs dataset names or --all')
+    unknown = sorted(set(args.names) - set(names))
+    if unknown:
+        parser.error('no dataset %s; see list' % ', '.join(unknown))
+    unknown = unknown_params(args.names, params)
+    if unknown:
+        parser.error('no dataset exported takes parameter %s; see list' % ', '.join(unknown))
+    for name in args.names:
+        bad = bad_values(name, params)
+        if bad:
+            parser.error('%s cannot take %s; see list for the defaults' % (name, ', '.join(bad)))
+    os.makedirs(args.out, exist_ok=True)
+    for name in args.names:
+        df = analytics.dataset(name, filters(args), **params_for(name, params))
+        path = os.path.join(args.out, '%s.%s' % (name, args.format))
+        analytics.write(df, path, args.format)
+        print('%s: %d rows' % (path, len(df)), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
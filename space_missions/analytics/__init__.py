@@ -0,0 +1,96 @@
+# Every chart's dataset as a plain DataFrame, without Streamlit or plotly, for
+# batch jobs and other services as much as for the pages:
+#
+#   from space_missions import analytics
+#   analytics.dataset('overview.mission_status')
+#   analytics.dataset('best.countries', where={'year': (1990, None)}, k=3)
+#   analytics.write(df, 'leaders.parquet')
+#
+# The functions themselves live in one module per page, e.g.
+# analytics.overview.mission_status_data(cube); the views only draw them.
+#
+#   python -m space_missions list
+#   python -m space_missions export --all --format parquet --out exports
+import importlib
+import inspect
+import os
+
+from space_missions.cadence import load_daily_counts
+from space_missions.companies import load_company_profile
+from space_missions.cube import load_cube
+from space_missions.data import DATASET_PATH
+from space_missions.rockets import load_rocket_cube
+from space_missions.sketches import load_cost_sketches
+
+
+# in page order
+MODULES = ['overview', 'factors', 'cadence', 'cold_war', 'best_every_year', 'rockets', 'geo', 'india', 'decomposition']
+
+# what the dataset functions aggregate, by argument name; each loader takes
+# (path, snapshot_path, where)
+INPUTS = {
+    'cube': load_cube,
+    'profile': load_company_profile,
+    'daily': load_daily_counts,
+    'costs': load_cost_sketches,
+    'rockets': load_rocket_cube,
+}
+
+FORMATS = ['csv', 'parquet', 'json']
+
+
+def datasets():
+    # dataset name -> function, for every page
+    functions = dict()
+    for module in MODULES:
+        functions.update(importlib.import_module('space_missions.analytics.' + module).DATASETS)
+    return functions
+
+
+def _function(name):
+    functions = datasets()
+    if name not in functions:
+        raise KeyError('no dataset %r, expected one of %s' % (name, sorted(functions)))
+    return functions[name]
+
+
+def dataset_params(name):
+    # the parameters of a dataset other than its inputs, with their defaults
+    params = inspect.signature(_function(name)).parameters
+    return {p: params[p].default for p in params if p not in INPUTS}
+
+
+def dataset_inputs(name):
+    return [arg for arg in inspect.signature(_function(name)).parameters if arg in INPUTS]
+
+
+def load_inputs(names=None, where=None, path=DATASET_PATH, snapshot_path=None):
+    # the INPUTS, or those named, over the launches matching where (see
+    # space_missions.filters)
+    return {arg: INPUTS[arg](path, snapshot_path, where) for arg in names or INPUTS}
+
+
+def compute(name, inputs, **params):
+    # one dataset from already loaded inputs
+    unknown = set(params) - set(dataset_params(name))
+    if unknown:
+        raise TypeError('%s takes no parameter %s' % (name, ', '.join(sorted(unknown))))
+    return _function(name)(**{arg: inputs[arg] for arg in dataset_inputs(name)}, **params)
+
+
+def dataset(name, where=None, path=DATASET_PATH, snapshot_path=None, **params):
+    # one dataset, over the launches matching where
+    return compute(name, load_inputs(dataset_inputs(name), where, path, snapshot_path), **params)
+
+
+def write(df, path, fmt=None):
+    # fmt is one of FORMATS, by default taken from the file extension
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt == 'csv':
+        df.to_csv(path, index=False)
+    elif fmt == 'parquet':
+        df.reset_index(drop=True).to_parquet(path, index=False)
+    elif fmt == 'json':
+        df.to_json(path, orient='records', date_format='iso')
+    else:
+        raise ValueError('cannot write %r, expected one of %s' % (fmt, FORMATS))
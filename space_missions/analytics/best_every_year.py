@@ -0,0 +1,39 @@
+# Datasets behind the Best Every Year page: the k leading countries and
+# companies of each year.
+from space_missions.cube import rollup
+from space_missions.ranking import top_k_per_group
+
+
+def countries_data(cube, k=1):
+    ds = rollup(cube, ['year', 'country']).reset_index()
+    ds = top_k_per_group(ds, 'year', 'launches', k=k, ties='label', label='country')
+    return ds
+
+
+def countries_success_data(cube, k=1):
+    ds = rollup(cube, ['year', 'country'], where={'Status Mission': 'Success'}).reset_index()
+    ds = top_k_per_group(ds, 'year', 'launches', k=k, ties='label', label='country')
+    return ds
+
+
+def companies_data(cube, k=1):
+    ds = rollup(cube, ['year', 'Company Name']).reset_index()
+    ds = top_k_per_group(ds, 'year', 'launches', k=k, ties='label', label='Company Name')
+    ds.columns = ['year', 'company', 'launches', 'rank']
+    return ds
+
+
+def companies_success_data(cube, k=1):
+    ds = rollup(cube, ['year', 'Company Name'], where={'Status Mission': 'Success'}).reset_index()
+    ds = top_k_per_group(ds, 'year', 'launches', k=k, ties='label', label='Company Name')
+    ds.columns = ['year', 'company', 'launches', 'rank']
+    return ds
+
+
+# dataset name -> function
+DATASETS = {
+    'best.countries': countries_data,
+    'best.countries_success': countries_success_data,
+    'best.companies': companies_data,
+    'best.companies_success': companies_success_data,
+}
@@ -0,0 +1,17 @@
+# Datasets behind the Launch Cadence page, downsampled to a point budget.
+from space_missions.cadence import cadence
+
+
+def daily_data(daily, budget=1000):
+    return cadence(daily, 'D', budget=budget).reset_index()
+
+
+def weekly_data(daily, budget=1000):
+    return cadence(daily, 'W', budget=budget).reset_index()
+
+
+# dataset name -> function
+DATASETS = {
+    'cadence.daily': daily_data,
+    'cadence.weekly': weekly_data,
+}
@@ -0,0 +1,48 @@
+# Datasets behind The Cold war page: the USA against the USSR up to 1991.
+from space_missions.cube import rollup, select
+
+
+def cold_war_cube(cube):
+    # USA against the USSR, counting launches from Kazakhstan and Russia up
+    # to 1991 as Soviet
+    cold = select(cube, {'year': (None, 1991), 'country': ['USA', 'Kazakhstan', 'Russian Federation']}).copy()
+    cold['country'] = cold['country'].replace({'Kazakhstan': 'USSR', 'Russian Federation': 'USSR'})
+    cold['country'] = cold['country'].cat.set_categories(['USA', 'USSR'])
+    return cold
+
+
+def launches_pie_data(cube):
+    cold = cold_war_cube(cube)
+    ds = rollup(cold, ['country']).sort_values(ascending=False).reset_index()
+    ds.columns = ['country', 'count']
+    return ds
+
+
+def launches_by_year_data(cube):
+    cold = cold_war_cube(cube)
+    ds = rollup(cold, ['year', 'country']).reset_index()
+    ds.columns = ['Year', 'Country', 'Launches']
+    return ds
+
+
+def companies_by_year_data(cube):
+    cold = cold_war_cube(cube)
+    ds = rollup(cold, ['year', 'country'], measure=('nunique', 'Company Name')).reset_index()
+    ds.columns = ['Year', 'Country', 'Companies']
+    return ds
+
+
+def failures_by_year_data(cube):
+    cold = cold_war_cube(cube)
+    ds = rollup(cold, ['year', 'country'], where={'Status Mission': 'Failure'}).reset_index()
+    ds.columns = ['Year', 'Country', 'Failures']
+    return ds
+
+
+# dataset name -> function
+DATASETS = {
+    'coldwar.launches_pie': launches_pie_data,
+    'coldwar.launches_by_year': launches_by_year_data,
+    'coldwar.companies_by_year': companies_by_year_data,
+    'coldwar.failures_by_year': failures_by_year_data,
+}
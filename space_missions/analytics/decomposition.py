@@ -0,0 +1,23 @@
+# Datasets behind the Time Series Decomposition page. Here the fits run in
+# the calling process; the page runs them in the background.
+from space_missions.decomposition import decompose, forecast, monthly_counts
+
+
+def monthly_data(daily):
+    return monthly_counts(daily).reset_index()
+
+
+def components_data(daily):
+    return decompose(monthly_counts(daily))
+
+
+def forecast_data(daily):
+    return forecast(monthly_counts(daily))
+
+
+# dataset name -> function
+DATASETS = {
+    'decomposition.monthly': monthly_data,
+    'decomposition.components': components_data,
+    'decomposition.forecast': forecast_data,
+}
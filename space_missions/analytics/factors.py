@@ -0,0 +1,110 @@
+# Datasets behind the Interesting Factors page: money per company and per
+# year, launches per year and month, and how long companies have been active.
+from space_missions.cube import rollup
+from space_missions.sketches import BOX, cost_quantiles
+
+
+def money_total_data(profile):
+    data = profile['cost_sum'].reset_index()
+    data = data[data['cost_sum'] > 0]
+    data.columns = [
+        'company', 
+        'money'
+    ]
+    return data
+
+
+def money_avg_data(profile):
+    av_money_df = profile['cost_mean'].rename('avg').dropna().reset_index()
+    return av_money_df
+
+
+def launches_by_year_data(cube):
+    ds = rollup(cube, ['year']).sort_values(ascending=False).reset_index()
+    ds.columns = ['year', 'count']
+    return ds
+
+
+def launches_by_month_data(cube):
+    ds = rollup(cube, ['month']).sort_values(ascending=False).reset_index()
+    ds.columns = [
+        'month', 
+        'count'
+    ]
+    return ds
+
+
+def years_since_last_data(profile):
+    # with each company's last launch year, for the chart title
+    data = profile['years_since_last'].rename('year').reset_index()
+    data['last_launch'] = profile['last_launch'].dt.year.to_numpy()
+    data = data.sort_values('year', ascending=False, kind='stable')
+    return data
+
+
+def money_by_year_data(cube):
+    money = rollup(cube, ['year'], measure='cost') / rollup(cube, ['year'], measure='costed')
+    money = money.dropna().rename('Rocket').reset_index()
+    return money
+
+
+def cost_by_year_data(costs):
+    # median and 90th percentile of the known costs per year
+    return cost_quantiles(costs, ['year']).reset_index()
+
+
+def cost_by_company_data(costs):
+    data = cost_quantiles(costs, ['Company Name'], BOX).reset_index()
+    return data.sort_values('median', ascending=False, kind='stable')
+
+
+def cost_by_country_data(costs):
+    data = cost_quantiles(costs, ['country'], BOX).reset_index()
+    return data.sort_values('median', ascending=False, kind='stable')
+
+
+def experience_data(profile):
+    ds = profile['active_years'].reset_index()
+    ds.columns = ['company','count']
+    ds = ds.sort_values(by='count', ascending=False)
+    return ds
+
+
+def top5_companies_data(cube):
+    data = rollup(cube, ['Company Name', 'year']).reset_index()
+    data.columns = [
+        'company', 
+        'year', 
+        'starts'
+    ]
+    top5 = data.groupby(['company'], observed=True)['starts'].sum().sort_index().reset_index().sort_values('starts', ascending=False).head(5)['company'].tolist()
+    data = data[data['company'].isin(top5)]
+    return data
+
+
+def starts_2020_data(cube):
+    data = rollup(cube, ['Company Name', 'year']).reset_index()
+    data.columns = [
+        'company', 
+        'year', 
+        'starts'
+    ]
+    data = data[data['year']==2020]
+    return data
+
+
+# dataset name -> function
+DATASETS = {
+    'factors.money_total': money_total_data,
+    'factors.money_avg': money_avg_data,
+    'factors.launches_by_year': launches_by_year_data,
+    'factors.launches_by_month': launches_by_month_data,
+    'factors.years_since_last': years_since_last_data,
+    'factors.money_by_year': money_by_year_data,
+    'factors.cost_by_year': cost_by_year_data,
+    'factors.cost_by_company': cost_by_company_data,
+    'factors.cost_by_country': cost_by_country_data,
+    'factors.experience': experience_data,
+    'factors.top5_companies': top5_companies_data,
+    'factors.starts_2020': starts_2020_data,
+}
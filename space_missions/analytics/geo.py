@@ -0,0 +1,23 @@
+# Datasets behind the Geo Analysis page: per-country counts for the map, the
+# country -> company -> status sunburst and the launch sites, one row per site
+# or per hexagon.
+from space_missions.choropleth import build_country_status
+from space_missions.sitemap import build_site_table, hex_bins
+from space_missions.sunburst import build_sunburst_counts, sunburst_nodes
+
+
+def sunburst_data(cube, top=5):
+    return sunburst_nodes(build_sunburst_counts(cube), top)
+
+
+def site_hexes_data(cube, size=2):
+    return hex_bins(build_site_table(cube), size).drop(columns='polygon')
+
+
+# dataset name -> function
+DATASETS = {
+    'geo.sunburst': sunburst_data,
+    'geo.map': build_country_status,
+    'geo.sites': build_site_table,
+    'geo.site_hexes': site_hexes_data,
+}
@@ -0,0 +1,42 @@
+# Datasets behind the India`s Place page: India against the USA since 1979.
+import pandas as pd
+
+from space_missions.cube import rollup, select
+
+
+def india_usa(cube):
+    return select(cube, {'year': (1979, None), 'country': ['India', 'USA']})
+
+
+def launches_pie_data(cube):
+    compare = india_usa(cube)
+    ds = rollup(compare, ['country']).sort_values(ascending=False).reset_index()
+    ds.columns = ['country', 'count']
+    return ds
+
+
+def launches_by_year_data(cube):
+    compare = india_usa(cube)
+    ds = rollup(compare, ['year', 'country']).reset_index()
+    ds.columns = ['year', 'country', 'Launches']
+    return ds
+
+
+def success_pct_data(cube):
+    compare = india_usa(cube)
+    ds_total = rollup(compare, ['year', 'country']).reset_index()
+    ds_total.columns = ['year', 'country', 'Total']
+    ds_success = rollup(compare, ['year', 'country'], where={'Status Mission': 'Success'}).reset_index()
+    ds_success.columns = ['year', 'country', 'Success']
+    ds_f = pd.merge(ds_total, ds_success, on=['year', 'country'], how='outer').fillna(0)
+    ds_f['Success_pct'] = ds_f['Success'] / ds_f['Total'] * 100
+    ds_mean = ds_f.groupby('country', observed=True)['Success_pct'].mean().sort_index().reset_index()
+    return ds_mean
+
+
+# dataset name -> function
+DATASETS = {
+    'india.launches_pie': launches_pie_data,
+    'india.launches_by_year': launches_by_year_data,
+    'india.success_pct': success_pct_data,
+}
@@ -0,0 +1,32 @@
+# Datasets behind the Dataset Overview page: launches per company and the
+# rocket and mission status distributions.
+from space_missions.cube import rollup
+
+
+def treemap_company_data(cube):
+    ds = rollup(cube, ['Company Name']).reset_index()
+    ds.columns = ['Company', 'Number of Launches']
+    ds = ds.sort_values(['Number of Launches'], ascending=False)
+    return ds
+
+
+def rocket_status_data(cube):
+    ds = rollup(cube, ['Status Rocket']).reset_index()
+    ds.columns = ['status', 'count']
+    ds = ds.sort_values('count', ascending=False)
+    return ds
+
+
+def mission_status_data(cube):
+    ds = rollup(cube, ['Status Mission']).reset_index()
+    ds.columns = ['mission_status', 'count']
+    ds = ds.sort_values('count', ascending=False)
+    return ds
+
+
+# dataset name -> function
+DATASETS = {
+    'overview.treemap_company': treemap_company_data,
+    'overview.rocket_status': rocket_status_data,
+    'overview.mission_status': mission_status_data,
+}
@@ -0,0 +1,52 @@
+# Datasets behind the Rocket Families page: launches, success rate and cost
+# per family and per variant, from the rocket cube of space_missions.rockets.
+from space_missions.cube import rollup
+
+
+def _stats(rockets, by, where=None):
+    data = rollup(rockets, by, where).rename('launches').to_frame()
+    for measure in ['successes', 'costed', 'cost_sum']:
+        data[measure] = rollup(rockets, by, where, measure)
+    data['success_rate'] = data['successes'] / data['launches']
+    data['cost_mean'] = data['cost_sum'] / data['costed'].where(data['costed'] > 0)
+    data['first_year'] = rollup(rockets, by, where, ('min', 'year'))
+    data['last_year'] = rollup(rockets, by, where, ('max', 'year'))
+    return data
+
+
+def families_data(rockets, top=20):
+    # the top families by launches, all of them for top=None, with how many
+    # variants each flew
+    data = _stats(rockets, ['family'])
+    data['variants'] = rollup(rockets, ['family'], measure=('nunique', 'variant'))
+    data = data.sort_values('launches', ascending=False, kind='stable')
+    if top is not None:
+        data = data.head(top)
+    return data.reset_index()
+
+
+def family_years_data(rockets, top=8):
+    # launches per year of the top families
+    leaders = families_data(rockets, top)['family'].tolist()
+    data = rollup(rockets, ['family', 'year'], where={'family': leaders}).reset_index()
+    return data
+
+
+def variants_data(rockets, family=None):
+    # the variants of one family, by default the most launched one; none
+    # without a launch
+    if family is None:
+        leaders = families_data(rockets, 1)['family']
+        family = leaders.iloc[0] if len(leaders) else None
+    data = _stats(rockets, ['variant'], {'family': family})
+    data = data.sort_values('launches', ascending=False, kind='stable').reset_index()
+    data.insert(0, 'family', family)
+    return data
+
+
+# dataset name -> function
+DATASETS = {
+    'rockets.families': families_data,
+    'rockets.family_years': family_years_data,
+    'rockets.variants': variants_data,
+}
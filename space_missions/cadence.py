@@ -0,0 +1,101 @@
+# Launch cadence at daily and weekly resolution, downsampled to a point budget
+# so a chart never sends more points than that, whatever the date range or
+# dataset size:
+#
+#   daily = load_daily_counts()
+#   series = window(daily, 'W', '1960-01-01', '1970-12-31')
+#   points = series.iloc[lttb(series, 1000)]
+import numpy as np
+import pandas as pd
+
+from space_missions.data import DATASET_PATH, RAW_COLUMNS, clean_launches, current_source
+from space_missions.filters import FILTER_COLUMNS, cached_for, filter_chunks, filter_key, filtered_launches
+
+
+DAY = pd.Timedelta(days=1).value
+FREQUENCIES = {'D': 'Daily', 'W': 'Weekly'}
+POINT_BUDGETS = [250, 500, 1000, 2000]
+
+
+def daily_counts(dates):
+    # launches per UTC day over every day from the first launch to the last,
+    # zeros included, from one bincount over day numbers; no days without
+    # launches
+    days = dates.dt.tz_convert(None).to_numpy().astype('datetime64[D]').astype('int64')
+    first = days.min() if len(days) else 0
+    counts = np.bincount(days - first)
+    index = pd.date_range(pd.Timestamp(first * DAY), periods=len(counts), freq='D', name='date')
+    return pd.Series(counts, index=index, name='launches')
+
+
+def load_daily_counts(path=DATASET_PATH, snapshot_path=None, where=None):
+    # from the launch dates, or summed chunk by chunk in the chunked ingest mode
+    from space_missions import stream
+
+    source, _ = current_source(path, snapshot_path)
+    if stream.ingest_mode() == 'chunked':
+        def build():
+            columns = ['date'] + FILTER_COLUMNS if filter_key(where) is not None else ['date']
+            chunks = filter_chunks(stream.iter_launches(path, snapshot_path, columns=columns), where)
+            total = None
+            for df in chunks:
+                counts = daily_counts(df['date'])
+                total = counts if total is None else total.add(counts, fill_value=0)
+            if total is None:
+                # no chunks at all, e.g. from an empty CSV
+                total = daily_counts(clean_launches(pd.DataFrame(columns=RAW_COLUMNS))['date'])
+            return total.asfreq('D', fill_value=0).astype('int64')
+        return cached_for(source, 'daily_counts', where, build)
+    return cached_for(
+        source, 'daily_counts', where,
+        lambda: daily_counts(filtered_launches(where, ['date'], path, snapshot_path)['date'])
+    )
+
+
+def window(daily, freq='D', start=None, end=None):
+    # the daily counts between start and end, inclusive, or for 'W' summed to
+    # Monday-to-Sunday weeks labelled by their Monday
+    series = daily.loc[start:end]
+    if freq == 'W' and len(series):
+        # day 0, 1970-01-01, is a Thursday, so (day + 3) // 7 numbers the weeks
+        # from Monday; summed with one bincount rather than a resample
+        weeks = (series.index.asi8 // DAY + 3) // 7
+        sums = np.bincount(weeks - weeks[0], weights=series.to_numpy())
+        mondays = (weeks[0] + np.arange(len(sums))) * 7 - 3
+        index = pd.DatetimeIndex(mondays * DAY, name='date')
+        series = pd.Series(sums.astype('int64'), index=index, name='launches')
+    return series
+
+
+def lttb(series, budget):
+    # Positions of the points Largest-Triangle-Three-Buckets keeps: the first
+    # and last, and from each of budget - 2 equal buckets in between the one
+    # spanning the largest triangle with the previous kept point and the
+    # next bucket's average. Peaks and gaps survive, unlike with striding.
+    n = len(series)
+    if budget >= n or budget < 3:
+        return np.arange(n)
+    x = series.index.asi8.astype('float64')
+    y = series.to_numpy(dtype='float64')
+    edges = np.linspace(1, n - 1, budget - 1).astype('int64')
+
+    keep = np.empty(budget, dtype='int64')
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(budget - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+            x_avg, y_avg = x[nxt].mean(), y[nxt].mean()
+        else:
+            x_avg, y_avg = x[n - 1], y[n - 1]
+        area = np.abs((x[a] - x_avg) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (y_avg - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def cadence(daily, freq='D', start=None, end=None, budget=1000):
+    # the window at the given resolution, downsampled to at most budget points
+    series = window(daily, freq, start, end)
+    return series.iloc[lttb(series, budget)]
@@ -0,0 +1,88 @@
+# One country x mission-status table behind the Geo Analysis map. The base
+# figure is built and cached once; switching the metric only swaps its color
+# array (and title) in the serialized figure, without regrouping anything.
+#
+#   table = load_country_status()
+#   spec = cached_figure('geo.map', lambda: base_figure(table))
+#   st.plotly_chart(color_by(spec, table, 'Failure'))
+import plotly.graph_objects as go
+
+from space_missions.cube import load_cube, rollup
+from space_missions.data import DATASET_PATH, current_source
+from space_missions.filters import cached_for
+
+
+STATUSES = ['Success', 'Failure', 'Partial Failure', 'Prelaunch Failure']
+METRICS = ['All'] + STATUSES + ['Success rate']
+
+TITLES = {
+    'All': 'Number of launches per country',
+    'Failure': 'Number of Fails per country',
+    'Success rate': 'Success rate per country (%)',
+}
+COLOR_SCALES = {'Success rate': 'RdYlGn'}
+
+
+def build_country_status(cube):
+    # one row per (country, alpha3) with a launch count per status, the total
+    # and the success rate in percent; countries without an ISO code are left
+    # out, as a map cannot place them
+    counts = rollup(cube, ['country', 'alpha3', 'Status Mission'])
+    table = counts.unstack('Status Mission', fill_value=0)
+    table = table.reindex(columns=STATUSES, fill_value=0)
+    table['All'] = table[STATUSES].sum(axis=1)
+    table['Success rate'] = table['Success'] / table['All'] * 100
+    table.columns.name = None
+    return table.reset_index()
+
+
+def load_country_status(path=DATASET_PATH, snapshot_path=None, where=None):
+    source, _ = current_source(path, snapshot_path)
+    return cached_for(
+        source, 'country_status', where,
+        lambda: build_country_status(load_cube(path, snapshot_path, where))
+    )
+
+
+def base_figure(table, width=800, height=600):
+    fig = go.Figure(go.Choropleth(
+        locations=table['alpha3'],
+        z=table['All'],
+        text=table['country'],
+        hovertemplate='%{text}<br>%{z}<extra></extra>',
+        colorscale='YlOrRd',
+        zmin=0,
+        zmax=table['All'].max(),
+    ))
+    fig.update_layout(
+        title=TITLES['All'],
+        template='plotly_dark',
+        width=width,
+        height=height
+    )
+    fig.update_geos(
+        projection_type='natural earth',
+        showcountries=True,
+        countrycolor="white",
+        showocean=True,
+        oceancolor="MidnightBlue",
+        showcoastlines=True,
+        coastlinecolor="white",
+        showland=True,
+        landcolor="LightGrey"
+    )
+    return fig
+
+
+def color_by(spec, table, metric):
+    # spec is a serialized base figure (a dict, as cached_figure returns it)
+    # and is modified in place
+    values = table[metric]
+    trace = spec['data'][0]
+    trace['z'] = values.tolist()
+    trace['zmax'] = 100 if metric == 'Success rate' else int(values.max())
+    trace['colorscale'] = COLOR_SCALES.get(metric, 'YlOrRd')
+    if metric == 'Success rate':
+        trace['hovertemplate'] = '%{text}<br>%{z:.1f}%<extra></extra>'
+    spec['layout']['title'] = {'text': TITLES.get(metric, 'Number of %s launches per country' % metric)}
+    return spec
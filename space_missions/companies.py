@@ -0,0 +1,85 @@
+# One row per company, from a single grouped aggregation over the launches.
+# Nothing here depends on the CSV's row order.
+import pandas as pd
+
+from space_missions.data import DATASET_PATH, current_source
+from space_missions.filters import cached_for, filtered_launches
+from space_missions.schema import decode
+
+
+PROFILE_COLUMNS = ['Company Name', 'date', 'year', 'Status Mission', 'Rocket']
+
+
+def build_company_profile(df):
+    # years_since_last counts calendar years back from the latest launch in
+    # the dataset; cost_mean only averages the `costed` launches whose cost
+    # is known, free ones included
+    cost = df['Rocket'].astype('float64')
+    values = pd.DataFrame({
+        'date': df['date'],
+        'year': df['year'],
+        'success': df['Status Mission'] == 'Success',
+        'cost': cost,
+    })
+    profile = values.groupby(df['Company Name'], observed=True).agg(
+        first_launch=('date', 'min'),
+        last_launch=('date', 'max'),
+        active_years=('year', 'nunique'),
+        launches=('date', 'size'),
+        successes=('success', 'sum'),
+        cost_sum=('cost', 'sum'),
+        costed=('cost', 'count'),
+    ).sort_index()
+    # unknown costs are left out of cost_sum, so this averages the known
+    # ones; as a ratio of two sums it comes out the same when profiles are merged
+    profile['cost_mean'] = profile['cost_sum'] / profile['costed'].where(profile['costed'] > 0)
+    profile['failures'] = profile['launches'] - profile['successes']
+    profile['years_since_last'] = (
+        df['date'].max().year - profile['last_launch'].dt.year
+    ).astype('int64')
+    profile = decode(profile.reset_index()).set_index('Company Name')
+    return profile[[
+        'first_launch',
+        'last_launch',
+        'active_years',
+        'launches',
+        'successes',
+        'failures',
+        'cost_sum',
+        'cost_mean',
+        'costed',
+        'years_since_last',
+    ]]
+
+
+def merge_company_profiles(profile, delta, cube):
+    # Folds the profile of newly ingested launches into an existing one.
+    # active_years is not additive, so it is recounted from the merged cube.
+    from space_missions.cube import rollup
+
+    both = pd.concat([profile, delta])
+    grouped = both.groupby(level=0)
+    merged = grouped[['launches', 'successes', 'failures', 'cost_sum', 'costed']].sum()
+    merged['first_launch'] = grouped['first_launch'].min()
+    merged['last_launch'] = grouped['last_launch'].max()
+    merged['cost_mean'] = merged['cost_sum'] / merged['costed'].where(merged['costed'] > 0)
+    merged['active_years'] = rollup(cube, ['Company Name'], measure=('nunique', 'year'))
+    merged['years_since_last'] = (
+        merged['last_launch'].max().year - merged['last_launch'].dt.year
+    ).astype('int64')
+    merged.index.name = 'Company Name'
+    return merged[profile.columns]
+
+
+def load_company_profile(path=DATASET_PATH, snapshot_path=None, where=None):
+    # first and last launch dates are not in the cube, so a filtered profile
+    # is rebuilt from the matching launches
+    from space_missions import stream
+
+    if stream.ingest_mode() == 'chunked':
+        return stream.load_aggregates(path, snapshot_path, where)[1]
+    source, _ = current_source(path, snapshot_path)
+    return cached_for(
+        source, 'company_profile', where,
+        lambda: build_company_profile(filtered_launches(where, PROFILE_COLUMNS, path, snapshot_path))
+    )
@@ -0,0 +1,118 @@
+# Launch counts and cost sums pre-aggregated over the dimensions the pages
+# group on. Charts roll the cube up instead of scanning launches:
+#
+#   cube = load_cube()
+#   rollup(cube, ['year', 'country'], where={'Status Mission': 'Success'})
+#   rollup(cube, ['Company Name'], measure='cost')
+#   rollup(cube, ['Company Name'], measure=('nunique', 'year'))
+import pandas as pd
+
+from space_missions.data import DATASET_PATH, cached, current_source, load_launches
+from space_missions.schema import compact, decode
+
+
+DIMENSIONS = [
+    'year',
+    'month',
+    'country',
+    'alpha3',
+    'launch_site',
+    'Company Name',
+    'Status Mission',
+    'Status Rocket',
+]
+
+# launches: number of launches, cost: sum of the known Rocket costs,
+# costed: launches with a known cost
+MEASURES = ['launches', 'cost', 'costed']
+
+
+def _group_keys(df):
+    # group on category codes: cheaper than the labels, and unlike
+    # groupby(dropna=False) on categoricals it keeps rows with a missing alpha3
+    return [
+        df[d].cat.codes.rename(d) if isinstance(df[d].dtype, pd.CategoricalDtype) else df[d]
+        for d in DIMENSIONS
+    ]
+
+
+def _restore_dimensions(cells, df):
+    for d in DIMENSIONS:
+        if isinstance(df[d].dtype, pd.CategoricalDtype):
+            cells[d] = pd.Categorical.from_codes(cells[d], df[d].cat.categories)
+        else:
+            cells[d] = cells[d].astype(df[d].dtype)
+    return cells
+
+
+def build_cube(df):
+    cost = df['Rocket'].astype('float64')
+    values = pd.DataFrame({'cost': cost, 'costed': cost.notna()})
+    cells = values.groupby(_group_keys(df)).agg(
+        launches=('cost', 'size'),
+        cost=('cost', 'sum'),
+        costed=('costed', 'sum'),
+    ).reset_index()
+    return _restore_dimensions(cells, df)
+
+
+def merge_cubes(*cubes):
+    # Cubes built over different launches add up cell by cell, so a cube for
+    # newly ingested rows can be folded into the existing one.
+    cells = compact(pd.concat(cubes, ignore_index=True))
+    merged = cells[MEASURES].groupby(_group_keys(cells)).sum().reset_index()
+    return _restore_dimensions(merged, cells)
+
+
+def load_cube(path=DATASET_PATH, snapshot_path=None, where=None):
+    # built once per dataset version, alongside the cached launch table, or
+    # chunk by chunk without it in the chunked ingest mode; where is a filter
+    # state as in space_missions.filters
+    from space_missions import filters, stream
+
+    if filters.filter_key(where) is not None:
+        return filters.filtered_cube(where, path, snapshot_path)
+    if stream.ingest_mode() == 'chunked':
+        return stream.load_aggregates(path, snapshot_path)[0]
+    source, _ = current_source(path, snapshot_path)
+    return cached(
+        source, 'cube',
+        lambda: build_cube(load_launches(DIMENSIONS + ['Rocket'], None, path, snapshot_path))
+    )
+
+
+def select(cube, where=None):
+    # where maps a dimension to a value, a list of values, or for ordered
+    # dimensions such as year an inclusive (min, max) tuple with None for open
+    if not where:
+        return cube
+    mask = pd.Series(True, index=cube.index)
+    for dim, cond in where.items():
+        col = cube[dim]
+        if isinstance(cond, tuple):
+            lo, hi = cond
+            if lo is not None:
+                mask &= col >= lo
+            if hi is not None:
+                mask &= col <= hi
+        elif isinstance(cond, (list, set)):
+            mask &= col.isin(cond)
+        else:
+            mask &= col == cond
+    return cube[mask]
+
+
+def rollup(cube, by, where=None, measure='launches'):
+    # Series indexed by the `by` dimensions, sorted on them, with plain labels
+    # rather than categories so it can go straight to plotly. measure is one of
+    # MEASURES, or an (aggregation, dimension) pair such as ('nunique', 'year')
+    # evaluated over the cells with at least one launch.
+    cells = select(cube, where)
+    grouped = cells.groupby(by, observed=True)
+    if isinstance(measure, tuple):
+        agg, dim = measure
+        result = grouped[dim].agg(agg)
+    else:
+        result = grouped[measure].sum()
+    result = decode(result.sort_index().reset_index())
+    return result.set_index(by)[result.columns[-1]]
@@ -0,0 +1,138 @@
+import hashlib
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from space_missions.dates import add_date_parts, parse_launch_dates
+from space_missions.locations import add_location_parts
+from space_missions.schema import compact
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATASET_PATH = os.path.join(ROOT_DIR, 'dataset', 'Space_Corrected.csv')
+
+RAW_COLUMNS = [
+    'Unnamed: 0', 
+    'Unnamed: 0.1', 
+    'Company Name', 
+    'Location', 
+    'Datum', 
+    'Detail', 
+    'Status Rocket', 
+    'Rocket', 
+    'Status Mission'
+]
+
+_cache = dict()
+_lock = threading.RLock()
+
+
+def dataset_key(path=DATASET_PATH):
+    # identifies one version of the dataset file on disk
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+
+def dataset_version(source):
+    # short, stable label for a source key, e.g. to tag derived artifacts
+    return hashlib.sha1(repr(source).encode()).hexdigest()[:12]
+
+
+def clean_launches(df, compact_schema=True):
+    df.columns = RAW_COLUMNS
+    df = df.drop(['Unnamed: 0', 'Unnamed: 0.1'], axis=1)
+
+    # read as text when any cost has a thousands separator ('1,160.0 '),
+    # otherwise as floats, e.g. in a small delta file; an unknown cost stays
+    # missing rather than becoming a free launch
+    rocket = df['Rocket']
+    if rocket.dtype == object:
+        rocket = rocket.str.replace(',', '')
+    df['Rocket'] = rocket.astype(np.float64)
+    df['Rocket'] = df['Rocket'] * 1000000
+
+    dates, unparsed = parse_launch_dates(df['Datum'])
+    if len(unparsed):
+        raise ValueError(
+            '%d launch dates could not be parsed, e.g. rows %s: %s'
+            % (len(unparsed), list(unparsed.index[:5]), list(unparsed.iloc[:5]))
+        )
+    df = add_date_parts(df, dates)
+
+    df = add_location_parts(df)
+    if compact_schema:
+        df = compact(df)
+    return df
+
+
+def read_raw(path=DATASET_PATH):
+    return pd.read_csv(path)
+
+
+def project(df, columns=None, years=None):
+    # in-memory equivalent of the snapshot's column projection and year filter
+    if years is not None:
+        lo, hi = years
+        mask = pd.Series(True, index=df.index)
+        if lo is not None:
+            mask &= df['year'] >= lo
+        if hi is not None:
+            mask &= df['year'] <= hi
+        df = df[mask]
+    if columns is not None:
+        df = df[[c for c in df.columns if c in columns]]
+    return compact(df)
+
+
+def cached(source, key, build):
+    # Per-process cache of anything derived from one dataset version. Entries
+    # for an older version of the same file are dropped when a new one is built.
+    key = (source, key)
+    value = _cache.get(key)
+    if value is not None:
+        return value
+    with _lock:
+        value = _cache.get(key)
+        if value is None:
+            value = build()
+            for stale in [k for k in _cache if k[0][0] == source[0] and k[0] != source]:
+                del _cache[stale]
+            _cache[key] = value
+    return value
+
+
+def current_source(path=DATASET_PATH, snapshot_path=None):
+    # The (path, size, mtime) key of what load_launches reads, and the
+    # snapshot manifest when that is the Parquet snapshot rather than the CSV.
+    from space_missions import snapshot
+
+    snapshot_path = snapshot_path or snapshot.SNAPSHOT_PATH
+    manifest = snapshot.read_manifest(snapshot_path)
+    if snapshot.is_fresh(manifest, path):
+        return dataset_key(os.path.join(snapshot_path, snapshot.MANIFEST)), manifest
+    return dataset_key(path), None
+
+
+def load_launches(columns=None, years=None, path=DATASET_PATH, snapshot_path=None):
+    # The cleaned table is built once per process and reused on every rerun.
+    # It comes from the Parquet snapshot when one matches the CSV, otherwise
+    # from the CSV itself. Entries are keyed on the source's (path, size, mtime)
+    # plus the requested columns and (min, max) year range, so editing the file
+    # rebuilds them. Returned frames are shared: copy before mutating.
+    from space_missions import snapshot
+
+    snapshot_path = snapshot_path or snapshot.SNAPSHOT_PATH
+    source, manifest = current_source(path, snapshot_path)
+    key = ('launches', None if columns is None else tuple(columns), years)
+    if manifest is not None:
+        return cached(
+            source, key,
+            lambda: snapshot.read_snapshot(snapshot_path, columns, years, manifest)
+        )
+
+    full = cached(source, ('launches', None, None), lambda: clean_launches(read_raw(path)))
+    if columns is None and years is None:
+        return full
+    return cached(source, key, lambda: project(full, columns, years))
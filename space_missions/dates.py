@@ -0,0 +1,35 @@
+import pandas as pd
+
+
+# 'Fri Aug 07, 2020 05:12 UTC', and the same without a time for launches
+# whose hour is unknown
+LAUNCH_DATE_FORMATS = [
+    '%a %b %d, %Y %H:%M UTC',
+    '%a %b %d, %Y',
+]
+
+
+def parse_launch_dates(datum, formats=LAUNCH_DATE_FORMATS):
+    # Every distinct string is parsed once, trying the explicit formats in
+    # order, and the result is broadcast back to the rows via factorize codes.
+    # Returns the UTC timestamps and the raw strings that matched no format.
+    codes, uniques = pd.factorize(datum)
+    uniques = pd.Series(uniques, dtype=object)
+    parsed = pd.Series(pd.NaT, index=uniques.index, dtype='datetime64[ns, UTC]')
+    for fmt in formats:
+        todo = parsed.isna()
+        if not todo.any():
+            break
+        parsed[todo] = pd.to_datetime(uniques[todo], format=fmt, errors='coerce', utc=True)
+
+    dates = pd.Series(parsed.array.take(codes, allow_fill=True), index=datum.index, name='date')
+    unparsed = datum[dates.isna()]
+    return dates, unparsed
+
+
+def add_date_parts(df, dates):
+    df['date'] = dates
+    df['year'] = dates.dt.year.astype('int16')
+    df['month'] = dates.dt.month.astype('int8')
+    df['weekday'] = dates.dt.weekday.astype('int8')
+    return df
@@ -0,0 +1,134 @@
+# Monthly launch series, its seasonal decomposition and an ARIMA forecast.
+# The month grid is the daily counts resampled, zeros included. The fits run
+# in a background process, once per dataset version and filter state, and
+# their results are kept, so a page can draw whatever has finished and a
+# placeholder for the rest:
+#
+#   monthly = load_monthly_counts()
+#   job = submit_fit('forecast', monthly, key)
+#   if job.done():
+#       table = job.result()
+import multiprocessing
+import threading
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+from space_missions.cadence import load_daily_counts
+from space_missions.data import DATASET_PATH, current_source
+from space_missions.filters import cached_for
+
+
+PERIOD = 12
+ORDER = (10, 1, 2)
+STEPS = 16
+# seasonal_decompose needs two full periods
+MIN_MONTHS = 2 * PERIOD
+COMPONENTS = ['observed', 'trend', 'seasonal', 'resid']
+# fit results kept, least recently used dropped first
+MAX_FITS = 16
+# what a fit fails with on a series it cannot model: too short for
+# seasonal_decompose, an ARIMA that does not converge, or a crashed worker
+FIT_ERRORS = (ValueError, np.linalg.LinAlgError, BrokenProcessPool)
+# seconds a page waits for its fits before giving up on them
+FIT_TIMEOUT = 120
+
+_executor = None
+_jobs = OrderedDict()
+_lock = threading.Lock()
+
+
+def monthly_counts(daily):
+    # launches per calendar month, labelled by its first day
+    monthly = daily.resample('MS').sum()
+    monthly.index.name = 'month'
+    return monthly.rename('launches')
+
+
+def load_monthly_counts(path=DATASET_PATH, snapshot_path=None, where=None):
+    source, _ = current_source(path, snapshot_path)
+    return cached_for(
+        source, 'monthly_counts', where,
+        lambda: monthly_counts(load_daily_counts(path, snapshot_path, where))
+    )
+
+
+def check_length(monthly):
+    if len(monthly) < MIN_MONTHS:
+        raise ValueError('%d months of launches, at least %d are needed' % (len(monthly), MIN_MONTHS))
+
+
+def decompose(monthly, period=PERIOD):
+    # observed, trend, seasonal and residual per month, additive; empty
+    # when there are no months
+    from statsmodels.tsa.seasonal import seasonal_decompose
+
+    if not len(monthly):
+        return pd.DataFrame(columns=COMPONENTS, index=monthly.index, dtype='float64')
+    check_length(monthly)
+    result = seasonal_decompose(monthly.astype('float64'), model='additive', period=period)
+    return pd.DataFrame({component: getattr(result, component) for component in COMPONENTS})
+
+
+def forecast(monthly, order=ORDER, steps=STEPS):
+    # the observed months followed by steps forecast ones, rounded to whole
+    # launches, with kind telling them apart; empty when there are no months
+    from statsmodels.tsa.arima.model import ARIMA
+
+    if not len(monthly):
+        return pd.DataFrame({
+            'month': pd.Series(dtype='datetime64[ns]'),
+            'launches': pd.Series(dtype='int64'),
+            'kind': pd.Series(dtype=object),
+        })
+    check_length(monthly)
+    with warnings.catch_warnings():
+        # the long AR order rarely converges fully; the forecast is still usable
+        warnings.simplefilter('ignore')
+        fit = ARIMA(monthly.astype('float64').to_numpy(), order=order).fit()
+        predicted = fit.forecast(steps)
+    months = pd.date_range(monthly.index[-1], periods=steps + 1, freq='MS')[1:]
+    return pd.DataFrame({
+        'month': np.concatenate([monthly.index.to_numpy(), months.to_numpy()]),
+        'launches': np.concatenate([monthly.to_numpy(), np.clip(np.round(predicted), 0, None)]).astype('int64'),
+        'kind': ['observed'] * len(monthly) + ['forecast'] * steps,
+    })
+
+
+FITS = {
+    'decomposition': decompose,
+    'forecast': forecast,
+}
+
+
+def _pool():
+    # one worker, started lazily; spawned rather than forked, as the
+    # Streamlit server that calls this runs threads of its own
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+    return _executor
+
+
+def submit_fit(kind, monthly, key):
+    # The future of FITS[kind] over monthly, submitted on the first call for
+    # key, e.g. (dataset source, filter key), and reused after that. A fit
+    # lost with a crashed worker is submitted again to a fresh one.
+    global _executor
+    key = (kind, key)
+    with _lock:
+        job = _jobs.get(key)
+        if job is not None and job.done() and isinstance(job.exception(), BrokenProcessPool):
+            _executor = None
+            job = None
+        if job is None:
+            job = _pool().submit(FITS[kind], monthly)
+            _jobs[key] = job
+        _jobs.move_to_end(key)
+        while len(_jobs) > MAX_FITS:
+            _jobs.popitem(last=False)
+    return job
@@ -0,0 +1,73 @@
+# Serialized Plotly figures cached per chart, dataset version and parameters.
+#
+#   st.plotly_chart(cached_figure('geo.map_failures', build), use_container_width=True)
+#   st.plotly_chart(cached_figure('best.countries', build, k=k), use_container_width=True)
+#
+# A rerun that lands on an already rendered chart skips both the data prep and
+# the plotly build: the stored figure JSON is handed to Streamlit as a dict.
+import json
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from space_missions.data import DATASET_PATH, current_source, dataset_version
+
+
+# figures kept, least recently used dropped first; every chart of every page
+# under a few filter states and slider positions
+MAX_ENTRIES = 256
+
+_figures = OrderedDict()
+_stats = dict()
+_lock = threading.RLock()
+
+
+def _count(chart_id, outcome):
+    with _lock:
+        counts = _stats.setdefault(chart_id, {'hits': 0, 'misses': 0})
+        counts[outcome] += 1
+
+
+def cached_figure(chart_id, build, version=None, **params):
+    # build() returns a plotly Figure, or None when there is nothing to draw,
+    # which is cached and returned as None too; params are the chart's own
+    # inputs (slider values, filters) and must be hashable
+    if version is None:
+        version = dataset_version(current_source(DATASET_PATH)[0])
+    key = (version, chart_id, tuple(sorted(params.items())))
+    with _lock:
+        spec = _figures.get(key)
+        if spec is not None:
+            _figures.move_to_end(key)
+    if spec is not None:
+        _count(chart_id, 'hits')
+        return json.loads(spec)
+
+    figure = build()
+    spec = 'null' if figure is None else figure.to_json()
+    with _lock:
+        for stale in [k for k in _figures if k[0] != version]:
+            del _figures[stale]
+        _figures[key] = spec
+        while len(_figures) > MAX_ENTRIES:
+            _figures.popitem(last=False)
+    _count(chart_id, 'misses')
+    return json.loads(spec)
+
+
+def figure_stats():
+    # hits, misses and cached bytes per chart id
+    sizes = dict()
+    for (_, chart_id, _), spec in list(_figures.items()):
+        sizes[chart_id] = sizes.get(chart_id, 0) + len(spec)
+    stats = pd.DataFrame.from_dict(_stats, orient='index', columns=['hits', 'misses'])
+    stats['bytes'] = pd.Series(sizes, dtype='int64').reindex(stats.index).fillna(0).astype('int64')
+    stats.index.name = 'chart'
+    return stats.sort_index()
+
+
+def clear_figures():
+    with _lock:
+        _figures.clear()
+        _stats.clear()
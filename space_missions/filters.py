@@ -0,0 +1,195 @@
+# Global filters shared by every page: a year range plus value lists over a few
+# dimensions, e.g.
+#
+#   where = {'year': (1970, 1991), 'country': ['USA', 'Kazakhstan']}
+#   cube = load_cube(where=where)
+#   profile = load_company_profile(where=where)
+#
+# An index is built once per dataset version, over the cube cells and over the
+# launch rows: one packed bitmap per value of each filter column and the rows
+# sorted by year. A filter state then resolves to its rows with a couple of
+# binary searches and bitwise ORs/ANDs over the bitmaps, instead of comparing
+# strings over the whole table, and the selection and whatever is derived from
+# it are cached per filter state.
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from space_missions.data import DATASET_PATH, cached, current_source, load_launches
+
+
+FILTER_COLUMNS = ['year', 'country', 'Company Name', 'Status Mission', 'Status Rocket']
+VALUE_COLUMNS = FILTER_COLUMNS[1:]
+# entries derived from filter states kept, least recently used dropped first
+MAX_ENTRIES = 64
+
+_states = OrderedDict()
+_lock = threading.RLock()
+
+
+def filter_key(where):
+    # Canonical, hashable form of where, e.g. for cached_figure; None when it
+    # filters nothing. where maps 'year' to an inclusive (min, max) tuple with
+    # None for open, and the other FILTER_COLUMNS to lists of values.
+    if not where:
+        return None
+    unknown = set(where) - set(FILTER_COLUMNS)
+    if unknown:
+        raise ValueError('cannot filter on %s, only on %s' % (sorted(unknown), FILTER_COLUMNS))
+    items = []
+    years = where.get('year')
+    if years is not None and tuple(years) != (None, None):
+        items.append(('year', tuple(years)))
+    for col in VALUE_COLUMNS:
+        values = where.get(col)
+        if values:
+            items.append((col, tuple(sorted(values))))
+    return tuple(items) or None
+
+
+def build_index(df):
+    # rows sorted by year, and per value column its values with one bitmap
+    # each, packed 8 rows to a byte: bit i of a value's bitmap is row i
+    n = len(df)
+    year = df['year'].to_numpy()
+    order = np.argsort(year, kind='stable')
+    index = {'rows': n, 'year': (year[order], order)}
+    for col in VALUE_COLUMNS:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes, categories = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            codes, categories = pd.factorize(values)
+        bitmaps = np.empty((len(categories), (n + 7) // 8), dtype=np.uint8)
+        for code in range(len(categories)):
+            bitmaps[code] = np.packbits(codes == code)
+        index[col] = (pd.Index(categories), bitmaps)
+    return index
+
+
+def select_rows(index, where):
+    # positions of the rows matching all of where, in row order; values that
+    # do not occur match no rows
+    n = index['rows']
+    bits = None
+    years = where.get('year')
+    if years is not None:
+        lo, hi = years
+        sorted_years, order = index['year']
+        start = 0 if lo is None else np.searchsorted(sorted_years, lo, side='left')
+        stop = n if hi is None else np.searchsorted(sorted_years, hi, side='right')
+        in_range = np.zeros(n, dtype=bool)
+        in_range[order[start:stop]] = True
+        if not any(where.get(col) for col in VALUE_COLUMNS):
+            return np.flatnonzero(in_range)
+        bits = np.packbits(in_range)
+    for col in VALUE_COLUMNS:
+        values = where.get(col)
+        if not values:
+            continue
+        categories, bitmaps = index[col]
+        codes = categories.get_indexer(list(values))
+        matches = np.bitwise_or.reduce(bitmaps[codes[codes >= 0]], axis=0)
+        bits = matches if bits is None else bits & matches
+    if bits is None:
+        return np.arange(n)
+    return np.flatnonzero(np.unpackbits(bits, count=n))
+
+
+def filter_chunks(chunks, where):
+    # the rows of each chunk matching where, for the chunked ingest mode,
+    # which never holds the whole launch table to index; when no row matches,
+    # one empty chunk still comes out, so what is folded from the chunks has
+    # its columns and dtypes
+    matched = False
+    empty = None
+    for df in chunks:
+        if filter_key(where) is not None:
+            df = df.iloc[select_rows(build_index(df), where)]
+        if len(df):
+            matched = True
+            yield df
+        elif empty is None:
+            empty = df
+    if not matched and empty is not None:
+        yield empty
+
+
+def cached_for(source, name, where, build):
+    # data.cached for the unfiltered state; anything derived from a filter
+    # state goes to a small LRU instead, so browsing filters does not grow the
+    # process without bound
+    key = filter_key(where)
+    if key is None:
+        return cached(source, name, build)
+    key = (source, name, key)
+    with _lock:
+        if key in _states:
+            _states.move_to_end(key)
+            return _states[key]
+    value = build()
+    with _lock:
+        for stale in [k for k in _states if k[0][0] == source[0] and k[0] != source]:
+            del _states[stale]
+        _states[key] = value
+        while len(_states) > MAX_ENTRIES:
+            _states.popitem(last=False)
+    return value
+
+
+def filtered_cube(where, path=DATASET_PATH, snapshot_path=None):
+    # The filter columns are all cube dimensions, so the matching cells add
+    # up to exactly what the matching launches would.
+    from space_missions.cube import load_cube
+
+    source, _ = current_source(path, snapshot_path)
+    cube = load_cube(path, snapshot_path)
+    index = cached(source, 'cube_index', lambda: build_index(cube))
+    return cached_for(
+        source, 'cube', where,
+        lambda: cube.iloc[select_rows(index, where)].reset_index(drop=True)
+    )
+
+
+def filtered_rows(where, path=DATASET_PATH, snapshot_path=None):
+    # positions in the launch table of the rows matching where, None when it
+    # filters nothing; every projection of the table keeps its row order, so
+    # one index serves them all
+    if filter_key(where) is None:
+        return None
+    source, _ = current_source(path, snapshot_path)
+    index = cached(
+        source, 'launch_index',
+        lambda: build_index(load_launches(FILTER_COLUMNS, None, path, snapshot_path))
+    )
+    return cached_for(source, 'launch_rows', where, lambda: select_rows(index, where))
+
+
+def filtered_launches(where, columns=None, path=DATASET_PATH, snapshot_path=None):
+    # the cleaned launches, or some columns of them, matching where
+    df = load_launches(columns, None, path, snapshot_path)
+    rows = filtered_rows(where, path, snapshot_path)
+    return df if rows is None else df.iloc[rows]
+
+
+def count_launches(where, path=DATASET_PATH, snapshot_path=None):
+    from space_missions.cube import load_cube
+
+    return int(load_cube(path, snapshot_path, where)['launches'].sum())
+
+
+def load_filter_options(path=DATASET_PATH, snapshot_path=None):
+    # the full year range and the sorted values of each value column
+    from space_missions.cube import load_cube
+
+    def build():
+        cube = load_cube(path, snapshot_path)
+        options = {'year': (int(cube['year'].min()), int(cube['year'].max()))}
+        for col in VALUE_COLUMNS:
+            options[col] = sorted(cube[col].dropna().unique().tolist())
+        return options
+
+    source, _ = current_source(path, snapshot_path)
+    return cached(source, 'filter_options', build)
@@ -0,0 +1,186 @@
+# Launch-count forecasts per entity: every country and the busiest companies,
+# one statsmodels ARIMA per monthly series, fitted across a process pool.
+#
+#   python -m space_missions.forecasting --top 12 --order 2 1 1 --steps 12
+#   python -m space_missions.forecasting --budget 2 --workers 4 --out forecasts.csv
+#
+# The series come from the cube's year and month, from each entity's first
+# launch to the last month of the data, zeros included. A fit gets a time
+# budget, checked at every optimizer iteration; past it, or for series too
+# short or sparse to fit, the forecast falls back to the mean of the last
+# twelve months. Each result is stored on disk under a hash of (entity,
+# series, order, steps), so only entities whose history changed are refitted;
+# a fit that ran out of time is not stored, and is tried again next run.
+import argparse
+import hashlib
+import json
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from space_missions.cube import load_cube, rollup
+from space_missions.data import DATASET_PATH, ROOT_DIR
+
+
+FORECAST_DIR = os.path.join(ROOT_DIR, 'dataset', 'forecasts')
+ORDER = (2, 1, 1)
+STEPS = 12
+BUDGET = 5.0
+# enough to take in SpaceX, eleventh by launches
+TOP_COMPANIES = 12
+# series shorter than this, or with fewer months that have a launch, get the baseline
+MIN_MONTHS = 36
+MIN_ACTIVE_MONTHS = 24
+BASELINE_MONTHS = 12
+
+ENTITY_COLUMNS = {'country': 'country', 'company': 'Company Name'}
+
+
+class FitTimeout(Exception):
+    pass
+
+
+def entity_series(cube, top=TOP_COMPANIES):
+    # {entity: (first month, monthly counts)} for every country and the top
+    # companies by launches; entities are 'country:USA', 'company:SpaceX', ...
+    last = int(cube['year'].max()) * 12 + int(cube.loc[cube['year'] == cube['year'].max(), 'month'].max()) - 1
+    companies = rollup(cube, ['Company Name']).sort_values(ascending=False, kind='stable').index[:top]
+    series = dict()
+    for kind, col in ENTITY_COLUMNS.items():
+        counts = rollup(cube, [col, 'year', 'month']).reset_index()
+        if kind == 'company':
+            counts = counts[counts[col].isin(companies)]
+        months = counts['year'].to_numpy('int64') * 12 + counts['month'].to_numpy('int64') - 1
+        for name, rows in counts.groupby(col, sort=True).indices.items():
+            first = months[rows].min()
+            values = np.zeros(last - first + 1, dtype='int64')
+            np.add.at(values, months[rows] - first, counts['launches'].to_numpy()[rows])
+            series['%s:%s' % (kind, name)] = (pd.Period(year=first // 12, month=first % 12 + 1, freq='M'), values)
+    return series
+
+
+def series_hash(start, values):
+    return hashlib.sha1(str(start).encode() + np.asarray(values, dtype='int64').tobytes()).hexdigest()[:16]
+
+
+def cache_path(entity, digest, order, steps, directory=FORECAST_DIR):
+    key = json.dumps([entity, digest, list(order), steps])
+    return os.path.join(directory, hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+
+def baseline(values, steps, reason):
+    level = float(np.mean(values[-BASELINE_MONTHS:])) if len(values) else 0.0
+    return {'model': 'baseline', 'reason': reason, 'params': {'level': level}, 'forecast': [level] * steps}
+
+
+def fit_series(values, order, steps, budget):
+    # runs in a pool worker; the ARIMA result, or the baseline with why
+    values = np.asarray(values, dtype='float64')
+    start = time.perf_counter()
+    if len(values) < MIN_MONTHS:
+        result = baseline(values, steps, 'short')
+    elif np.count_nonzero(values) < MIN_ACTIVE_MONTHS:
+        result = baseline(values, steps, 'sparse')
+    else:
+        from statsmodels.tsa.arima.model import ARIMA
+
+        deadline = start + budget
+
+        def check(params):
+            if time.perf_counter() > deadline:
+                raise FitTimeout()
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                fit = ARIMA(values, order=tuple(order)).fit(method_kwargs={'callback': check})
+            result = {
+                'model': 'arima',
+                'reason': '',
+                'params': dict(zip(fit.param_names, fit.params.tolist())),
+                'aic': float(fit.aic),
+                'forecast': np.clip(fit.forecast(steps), 0, None).tolist(),
+            }
+        except FitTimeout:
+            result = baseline(values, steps, 'timeout')
+        except (ValueError, np.linalg.LinAlgError) as e:
+            result = baseline(values, steps, 'failed: %s' % e)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def forecast_entities(series, order=ORDER, steps=STEPS, budget=BUDGET, workers=None, directory=FORECAST_DIR):
+    # (forecasts, fits): one row per entity and forecast month, and one per
+    # entity with its model, the reason for a baseline, fit time and whether
+    # it came from the disk cache
+    os.makedirs(directory, exist_ok=True)
+    results, misses = dict(), dict()
+    for entity, (start, values) in series.items():
+        path = cache_path(entity, series_hash(start, values), order, steps, directory)
+        if os.path.exists(path):
+            with open(path) as f:
+                results[entity] = dict(json.load(f), cached=True)
+        else:
+            misses[entity] = path
+
+    if misses:
+        with ProcessPoolExecutor(workers) as pool:
+            jobs = {
+                entity: pool.submit(fit_series, series[entity][1], order, steps, budget)
+                for entity in misses
+            }
+            for entity, job in jobs.items():
+                result = job.result()
+                if result['reason'] != 'timeout':
+                    with open(misses[entity], 'w') as f:
+                        json.dump(result, f)
+                results[entity] = dict(result, cached=False)
+
+    forecasts, fits = [], []
+    for entity, (start, values) in series.items():
+        result = results[entity]
+        kind, name = entity.split(':', 1)
+        months = pd.period_range(start + len(values), periods=steps, freq='M').to_timestamp()
+        forecasts.append(pd.DataFrame({
+            'entity': entity, 'kind': kind, 'name': name,
+            'month': months, 'launches': result['forecast'], 'model': result['model'],
+        }))
+        fits.append({
+            'entity': entity, 'kind': kind, 'name': name, 'months': len(values),
+            'model': result['model'], 'reason': result['reason'], 'aic': result.get('aic'),
+            'seconds': result['seconds'], 'cached': result['cached'],
+        })
+    return pd.concat(forecasts, ignore_index=True), pd.DataFrame(fits)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fit launch-count forecasts per country and company.')
+    parser.add_argument('--csv', default=DATASET_PATH)
+    parser.add_argument('--top', type=int, default=TOP_COMPANIES, help='companies to forecast, by launches')
+    parser.add_argument('--order', type=int, nargs=3, default=list(ORDER), metavar=('P', 'D', 'Q'))
+    parser.add_argument('--steps', type=int, default=STEPS, help='months to forecast')
+    parser.add_argument('--budget', type=float, default=BUDGET, help='seconds per fit')
+    parser.add_argument('--workers', type=int, help='fitting processes, one per CPU by default')
+    parser.add_argument('--cache', default=FORECAST_DIR)
+    parser.add_argument('--out', help='write the forecasts to this CSV')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    series = entity_series(load_cube(args.csv), args.top)
+    forecasts, fits = forecast_entities(series, tuple(args.order), args.steps, args.budget, args.workers, args.cache)
+    print(fits.round(3).to_string(index=False))
+    print('%d entities, %d fitted, %d from cache, %d baselines in %.1fs' % (
+        len(fits), (~fits['cached']).sum(), fits['cached'].sum(),
+        (fits['model'] == 'baseline').sum(), time.perf_counter() - start
+    ))
+    if args.out:
+        forecasts.to_csv(args.out, index=False)
+        print('wrote %s' % args.out)
+
+
+if __name__ == '__main__':
+    main()
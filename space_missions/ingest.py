@@ -0,0 +1,132 @@
+# Incremental ingestion of newly reported launches.
+#
+#   python -m space_missions.ingest new_launches.csv [--after-high-water]
+#
+# The delta CSV has the same layout as Space_Corrected.csv. Only its rows are
+# parsed and resolved. Launches already present, by LAUNCH_KEY, are rejected.
+# With --after-high-water so is anything not newer than the latest launch
+# loaded, which lets a grown copy of the full CSV be passed as the delta.
+# Accepted rows are appended to the dataset CSV. The Parquet snapshot, when
+# current, has only the year partitions they fall in rewritten.
+import argparse
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from space_missions.companies import build_company_profile, merge_company_profiles
+from space_missions.cube import build_cube, merge_cubes
+from space_missions.data import DATASET_PATH, RAW_COLUMNS, clean_launches, load_launches, read_raw
+from space_missions.dates import parse_launch_dates
+from space_missions.sketches import build_cost_sketches, merge_cost_sketches
+
+
+# what identifies one launch; a re-sent row matches on all of these
+LAUNCH_KEY = ['Company Name', 'Location', 'Datum', 'Detail']
+
+
+def launch_keys(df):
+    # 64-bit hash per row, the same for category and plain string columns
+    return pd.Index(pd.util.hash_pandas_object(df[LAUNCH_KEY], index=False))
+
+
+def concat_launches(launches, delta):
+    # Appends cleaned rows without decoding the categoricals: categories are
+    # unioned (and kept sorted, as compact() leaves them) and codes remapped.
+    delta = delta.set_axis(
+        pd.RangeIndex(launches.index.max() + 1, launches.index.max() + 1 + len(delta))
+    )
+    columns = dict()
+    for col in launches.columns:
+        if isinstance(launches[col].dtype, pd.CategoricalDtype):
+            values = union_categoricals([launches[col], delta[col]], sort_categories=True)
+            columns[col] = pd.Series(values, index=launches.index.append(delta.index))
+        else:
+            columns[col] = pd.concat([launches[col], delta[col]])
+    return pd.DataFrame(columns)
+
+
+class LaunchState:
+    # The cleaned launches and the aggregates the pages read from them, kept
+    # current by folding in deltas instead of rebuilding from the full CSV.
+
+    def __init__(self, launches):
+        self.launches = launches
+        self.cube = build_cube(launches)
+        self.profile = build_company_profile(launches)
+        self.costs = build_cost_sketches(launches)
+        self.keys = launch_keys(launches)
+        self.high_water = launches['date'].max()
+
+    def append(self, raw, after_high_water=False):
+        # raw is a frame read from a CSV in the dataset's layout. Returns how
+        # many rows were added, rejected as duplicates, or skipped as stale,
+        # and the accepted raw rows.
+        raw = raw.set_axis(RAW_COLUMNS, axis=1)
+        stale = pd.Series(False, index=raw.index)
+        if after_high_water:
+            dates, _ = parse_launch_dates(raw['Datum'])
+            stale = (dates <= self.high_water).fillna(False)
+        fresh = raw[~stale]
+
+        keys = launch_keys(fresh)
+        duplicate = keys.isin(self.keys) | keys.duplicated()
+        accepted = fresh[~duplicate]
+        report = {
+            'added': len(accepted),
+            'duplicates': int(duplicate.sum()),
+            'stale': int(stale.sum()),
+        }
+        if not len(accepted):
+            return report, accepted
+
+        delta = clean_launches(accepted.copy())
+        self.launches = concat_launches(self.launches, delta)
+        self.cube = merge_cubes(self.cube, build_cube(delta))
+        self.profile = merge_company_profiles(self.profile, build_company_profile(delta), self.cube)
+        self.costs = merge_cost_sketches(self.costs, build_cost_sketches(delta))
+        self.keys = self.keys.append(keys[~duplicate])
+        self.high_water = max(self.high_water, delta['date'].max())
+        return report, accepted
+
+
+def append_to_dataset(accepted, launches, path=DATASET_PATH, snapshot_path=None):
+    # Persists accepted raw rows: appended to the CSV, numbered on from its
+    # last row, and written to the snapshot partitions of their years.
+    from space_missions import snapshot
+
+    snapshot_path = snapshot_path or snapshot.SNAPSHOT_PATH
+    manifest = snapshot.read_manifest(snapshot_path)
+    was_fresh = snapshot.is_fresh(manifest, path)
+
+    added = launches.index[len(launches) - len(accepted):]
+    rows = accepted.copy()
+    rows[RAW_COLUMNS[0]] = added
+    rows[RAW_COLUMNS[1]] = added
+    rows.to_csv(path, mode='a', header=False, index=False)
+
+    if was_fresh:
+        years = launches.loc[added, 'year'].unique()
+        snapshot.write_partitions(launches[launches['year'].isin(years)], snapshot_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Append new launches to the dataset.')
+    parser.add_argument('delta', help='CSV of launches in the Space_Corrected.csv layout')
+    parser.add_argument('--csv', default=DATASET_PATH)
+    parser.add_argument('--snapshot', default=None)
+    parser.add_argument(
+        '--after-high-water',
+        action='store_true',
+        help='skip rows not newer than the latest launch already loaded'
+    )
+    args = parser.parse_args()
+
+    state = LaunchState(load_launches(path=args.csv, snapshot_path=args.snapshot))
+    report, accepted = state.append(read_raw(args.delta), args.after_high_water)
+    if len(accepted):
+        append_to_dataset(accepted, state.launches, args.csv, args.snapshot)
+    print('added %(added)d, duplicates %(duplicates)d, stale %(stale)d' % report)
+
+
+if __name__ == '__main__':
+    main()
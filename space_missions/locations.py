@@ -0,0 +1,102 @@
+# Location -> (site, country, alpha3, launch_site), resolved once per distinct
+# Location.
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from iso3166 import countries
+
+from space_missions.sites import find_site
+
+
+# last part of a Location that is not a country
+countries_dict = {
+    'Russia' : 'Russian Federation',
+    'New Mexico' : 'USA',
+    "Yellow Sea": 'China',
+    "Shahrud Missile Test Site": "Iran",
+    "Pacific Missile Range Facility": 'USA',
+    "Barents Sea": 'Russian Federation',
+    "Gran Canaria": 'USA'
+}
+
+# country names the dataset uses that are not ISO-3166 names
+alpha3_dict = {
+    'North Korea': 'PRK',
+    'South Korea': 'KOR',
+    'Iran': 'IRN',
+}
+
+_iso = None
+_memo = dict()
+
+
+def iso_alpha3():
+    # ISO-3166 name -> alpha3, plus every alpha3 code mapping to itself,
+    # built once per process
+    global _iso
+    if _iso is None:
+        iso = {c.name: c.alpha3 for c in countries}
+        iso.update({c.alpha3: c.alpha3 for c in countries})
+        iso.update(alpha3_dict)
+        _iso = iso
+    return _iso
+
+
+def resolve_location(location):
+    # 'LC-39A, Kennedy Space Center, Florida, USA'
+    #   -> ('LC-39A, Kennedy Space Center, Florida', 'USA', 'USA', 'Kennedy Space Center')
+    # alpha3 is None when the country has no ISO-3166 code, launch_site when
+    # the site is not in space_missions.sites
+    resolved = _memo.get(location)
+    if resolved is None:
+        parts = location.split(', ')
+        site = ', '.join(parts[:-1]) or location
+        country = countries_dict.get(parts[-1], parts[-1])
+        resolved = (site, country, iso_alpha3().get(country), find_site(location))
+        _memo[location] = resolved
+    return resolved
+
+
+def _broadcast(codes, values, index):
+    # values holds one entry per distinct location; codes maps rows onto them
+    cat = pd.Categorical(values)
+    row_codes = np.append(cat.codes, -1)[codes]
+    return pd.Series(pd.Categorical.from_codes(row_codes, cat.categories), index=index)
+
+
+def resolve_locations(location):
+    # Returns site/country/alpha3/launch_site columns for every row, the
+    # distinct locations whose country could not be mapped to an ISO-3166
+    # code, and those with no known launch site.
+    codes, uniques = pd.factorize(location)
+    resolved = [resolve_location(loc) for loc in uniques]
+    sites, names, codes3, launch_sites = zip(*resolved) if resolved else ((), (), (), ())
+
+    frame = pd.DataFrame({
+        'site': _broadcast(codes, sites, location.index),
+        'country': _broadcast(codes, names, location.index),
+        'alpha3': _broadcast(codes, codes3, location.index),
+        'launch_site': _broadcast(codes, launch_sites, location.index),
+    })
+    unresolved = [loc for loc, r in zip(uniques, resolved) if r[2] is None]
+    unplaced = [loc for loc, r in zip(uniques, resolved) if r[3] is None]
+    return frame, unresolved, unplaced
+
+
+def add_location_parts(df):
+    frame, unresolved, unplaced = resolve_locations(df['Location'])
+    if unresolved:
+        warnings.warn(
+            'no ISO-3166 code for %d launch locations, alpha3 left empty: %s'
+            % (len(unresolved), unresolved)
+        )
+    if unplaced:
+        warnings.warn(
+            'no known launch site for %d launch locations, launch_site left empty: %s'
+            % (len(unplaced), unplaced)
+        )
+    for col in frame.columns:
+        df[col] = frame[col]
+    return df
@@ -0,0 +1,40 @@
+# Sidebar pages in display order. Each page is a module in space_missions.views
+# with a render(page) function, imported the first time it is selected: a cold
+# start only pays for streamlit and the page being shown, not for pandas,
+# plotly and every page's dependencies up front.
+import importlib
+
+
+PAGES = [
+    ('Home', 'home'),
+    ('About Data', 'about_data'),
+    ('Dataset Overview', 'overview'),
+    ('Interesting Factors', 'factors'),
+    ('Launch Cadence', 'cadence'),
+    ('The Cold war', 'cold_war'),
+    ('Best Every Year', 'best_every_year'),
+    ('Rocket Families', 'rockets'),
+    ('Geo Analysis', 'geo'),
+    ('India`s Place', 'india'),
+    ('Time Series Decomposition', 'decomposition'),
+    ('Reference', 'reference'),
+]
+
+# pages without launch data draw no filters, and so load no data either
+UNFILTERED = ['home', 'reference']
+
+
+def page_module(page):
+    return importlib.import_module('space_missions.views.' + dict(PAGES)[page])
+
+
+def render_filters(page):
+    # (where, matching launches) from the sidebar filters, (None, None) on
+    # pages they do not apply to
+    if dict(PAGES)[page] in UNFILTERED:
+        return None, None
+    return importlib.import_module('space_missions.views.sidebar').filter_sidebar()
+
+
+def render_page(page, where=None):
+    page_module(page).render(page, where)
@@ -0,0 +1,29 @@
+TIES = ['first', 'label', 'all']
+
+
+def top_k_per_group(df, by, value, k=1, ties='first', label=None):
+    # Top k rows of each `by` group by descending `value`, in one sort and one
+    # cumcount/rank pass instead of a Python loop over the groups. Rows come
+    # back ordered by group then rank, with a 1-based 'rank' column.
+    #   ties='first'  equal values keep their input order
+    #   ties='label'  equal values are ordered by the `label` column
+    #   ties='all'    every row tied with the k-th one is kept, sharing its rank
+    if ties not in TIES:
+        raise ValueError('ties must be one of %s, got %r' % (TIES, ties))
+    if ties == 'label' and label is None:
+        raise ValueError("ties='label' needs the label column")
+    by = [by] if isinstance(by, str) else list(by)
+
+    columns = by + [value]
+    ascending = [True] * len(by) + [False]
+    if ties == 'label':
+        columns.append(label)
+        ascending.append(True)
+    ordered = df.sort_values(columns, ascending=ascending, kind='stable')
+
+    if ties == 'all':
+        rank = ordered.groupby(by, sort=False)[value].rank(method='min', ascending=False)
+    else:
+        rank = ordered.groupby(by, sort=False).cumcount() + 1
+    keep = (rank <= k).to_numpy()
+    return ordered[keep].assign(rank=rank[keep].astype('int64'))
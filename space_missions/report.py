@@ -0,0 +1,159 @@
+# Static export of the dashboard: every chart of every page, each page as one
+# self-contained HTML file with plotly.js inlined once, and each chart's
+# figure JSON on its own. Nothing is fetched from a CDN, so the report can be
+# built and opened offline.
+#
+# The inputs (cube, company profile, daily counts) are loaded once here and
+# handed to each worker of a process pool as it starts; the workers compute
+# the datasets and build and serialize the figures, timing each chart.
+#
+#   python -m space_missions report --out report --workers 4
+#
+# Geographic charts draw their base map from plotly's topojson files, which
+# plotly.js otherwise downloads from its CDN. The report points them at a
+# topojson/ directory next to the pages instead, filled from --topojson when
+# given a local copy (e.g. plotly.js's dist/topojson); without one the maps
+# stay blank rather than reach out to the network.
+import importlib
+import json
+import multiprocessing
+import os
+import shutil
+import time
+import warnings
+
+import pandas as pd
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+from space_missions import analytics
+from space_missions.data import current_source, dataset_version
+from space_missions.navigation import PAGES
+from space_missions.views import NO_DATA, figure_of
+
+
+TOPOJSON_DIR = 'topojson'
+PAGE_TEMPLATE = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>%(title)s</title>
+<script type="text/javascript">%(plotlyjs)s</script>
+</head>
+<body>
+<h1>%(title)s</h1>
+<p><a href="index.html">All pages</a> &middot; dataset %(version)s%(filters)s</p>
+%(charts)s
+</body>
+</html>
+'''
+
+_inputs = None
+
+
+def page_figures():
+    # [(page label, view module, {dataset name: figure function})] for the
+    # pages with charts, in navigation order
+    pages = []
+    for label, module in PAGES:
+        view = importlib.import_module('space_missions.views.' + module)
+        if getattr(view, 'FIGURES', None):
+            pages.append((label, module, view.FIGURES))
+    return pages
+
+
+def start_worker(inputs):
+    global _inputs
+    warnings.filterwarnings('ignore')
+    _inputs = inputs
+
+
+def build_chart(task):
+    # (name, figure JSON, HTML div, seconds per stage) for one chart
+    module, name = task
+    figures = importlib.import_module('space_missions.views.' + module).FIGURES
+    start = time.perf_counter()
+    data = analytics.compute(name, _inputs)
+    prepared = time.perf_counter()
+    fig = figure_of(data, figures[name])
+    built = time.perf_counter()
+    if fig is None:
+        # as on the pages, a note in place of a chart the filters left no data
+        spec = 'null'
+        div = '<p id="%s">%s</p>' % (name.replace('.', '-'), NO_DATA)
+    else:
+        spec = fig.to_json()
+        div = pio.to_html(
+            fig, include_plotlyjs=False, full_html=False, div_id=name.replace('.', '-'),
+            config={'topojsonURL': TOPOJSON_DIR + '/'}
+        )
+    done = time.perf_counter()
+    return name, spec, div, {'data': prepared - start, 'figure': built - prepared, 'serialize': done - built}
+
+
+def build_charts(tasks, inputs, workers):
+    # results in task order; workers=0 builds them in this process
+    if workers == 0:
+        start_worker(inputs)
+        return [build_chart(task) for task in tasks]
+    # the platform's default start method: on Linux the workers are forked
+    # with the inputs, plotly and the views already loaded
+    with multiprocessing.Pool(workers, initializer=start_worker, initargs=(inputs,)) as pool:
+        return pool.map(build_chart, tasks, chunksize=1)
+
+
+def write_report(out, where=None, workers=None, topojson=None):
+    # writes the pages, figures/ and report.json under out; returns the per
+    # chart timings as a DataFrame
+    started = time.perf_counter()
+    inputs = analytics.load_inputs(where=where)
+    loaded = time.perf_counter()
+
+    pages = page_figures()
+    tasks = [(module, name) for _, module, figures in pages for name in figures]
+    if workers is None:
+        # one per CPU, and none on a single CPU, where a pool only adds overhead
+        cpus = os.cpu_count() or 1
+        workers = min(len(tasks), cpus) if cpus > 1 else 0
+    results = {name: (spec, div, seconds) for name, spec, div, seconds in build_charts(tasks, inputs, workers)}
+    built = time.perf_counter()
+
+    os.makedirs(os.path.join(out, 'figures'), exist_ok=True)
+    version = dataset_version(current_source()[0])
+    filters = ' &middot; filters %s' % json.dumps(where) if where else ''
+    plotlyjs = get_plotlyjs()
+    links = []
+    for label, module, figures in pages:
+        for name in figures:
+            with open(os.path.join(out, 'figures', name + '.json'), 'w') as f:
+                f.write(results[name][0])
+        with open(os.path.join(out, module + '.html'), 'w', encoding='utf-8') as f:
+            f.write(PAGE_TEMPLATE % {
+                'title': label,
+                'plotlyjs': plotlyjs,
+                'version': version,
+                'filters': filters,
+                'charts': '\n'.join(results[name][1] for name in figures),
+            })
+        links.append('<li><a href="%s.html">%s</a></li>' % (module, label))
+    with open(os.path.join(out, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write('<!DOCTYPE html>\n<html>\n<head><meta charset="utf-8"><title>Space Missions Analysis</title></head>\n'
+                '<body>\n<h1>Space Missions Analysis</h1>\n<ul>\n%s\n</ul>\n</body>\n</html>\n' % '\n'.join(links))
+    if topojson:
+        shutil.copytree(topojson, os.path.join(out, TOPOJSON_DIR), dirs_exist_ok=True)
+
+    timings = pd.DataFrame.from_dict({name: seconds for name, (_, _, seconds) in results.items()}, orient='index')
+    timings = timings.reindex([name for _, name in tasks])
+    timings['total'] = timings.sum(axis=1)
+    timings.index.name = 'chart'
+    with open(os.path.join(out, 'report.json'), 'w') as f:
+        json.dump({
+            'dataset_version': version,
+            'where': where,
+            'workers': workers,
+            'load_seconds': loaded - started,
+            'build_seconds': built - loaded,
+            'write_seconds': time.perf_counter() - built,
+            'charts': timings.round(4).to_dict(orient='index'),
+        }, f, indent=1)
+    return timings
@@ -0,0 +1,225 @@
+# Rocket families, variants and payloads from the Detail column, e.g.
+#
+#   'Falcon 9 Block 5 | Starlink V1 L9 & BlackSky'
+#   -> family 'Falcon', variant 'Falcon 9 Block 5', payloads ['Starlink V1 L9', 'BlackSky']
+#
+# Detail repeats across launches, so each distinct value is parsed once, with
+# vectorized regular expressions, and remembered for later chunks and deltas.
+# The rows then carry integer codes only: an index built once per dataset
+# version maps each family to its row offsets, and the rocket cube of launch,
+# success and cost counts per (family, variant, year) is grouped on the codes,
+# never on the strings.
+#
+#   cube = load_rocket_cube(where={'year': (2000, None)})
+#   rollup(cube, ['family'])
+#   family_launches('Soyuz')
+import threading
+
+import numpy as np
+import pandas as pd
+
+from space_missions.data import DATASET_PATH, cached, current_source, load_launches
+from space_missions.filters import FILTER_COLUMNS, cached_for, filter_chunks, filtered_rows
+from space_missions.schema import compact
+
+
+ROCKET_COLUMNS = ['Detail', 'date', 'year', 'Company Name', 'Status Mission', 'Rocket']
+
+# the rocket, then the payloads after a '|'
+DETAIL_PATTERN = r'^\s*(?P<variant>[^|]*?)\s*(?:\|\s*(?P<payloads>.*?))?\s*$'
+# A family is the rocket's leading name, up to its first number, space,
+# hyphen, slash or bracket: 'Soyuz 2.1a/Fregat', 'Atlas-E/F Agena D' and
+# 'Long March 3B' are Soyuz, Atlas and Long March. Names of a single letter
+# keep their numeral: 'H-IIA 202' is H-II.
+FAMILY_PATTERN = (
+    r'^(?P<family>Long March|Space Shuttle|Black Arrow|Feng Bao|New Shepard|Super Stripy'
+    r'|[A-Z]-[IVX]+|[^\s/(-]+)'
+)
+# leading names that are not the family: 'Blue Scout II', 'Commercial Titan
+# III', 'Mercury-Redstone', 'SM-65B Atlas'
+FAMILY_ALIASES = {'Blue': 'Scout', 'Commercial': 'Titan', 'Mercury': 'Redstone', 'SM': 'Atlas'}
+UNKNOWN = 'Unknown'
+# between payloads, but not inside brackets: 'Brasilsat B3, Inmarsat-3 F5'
+PAYLOAD_SEPARATOR = r'\s*(?:,|&)\s*(?![^(]*\))'
+
+# columns of the rocket cube
+DIMENSIONS = ['family', 'variant', 'year']
+MEASURES = ['launches', 'successes', 'costed', 'cost_sum']
+# columns of family_launches, besides the variant and payloads
+LAUNCH_COLUMNS = ['date', 'Company Name', 'Status Mission', 'Rocket']
+
+# Detail -> (family, variant, payloads), for every value parsed so far
+_parsed = dict()
+_lock = threading.Lock()
+
+
+def parse_details(details):
+    # family, variant and the list of payloads of each value in details, as
+    # a frame indexed by the values; unseen values are parsed in one batch
+    distinct = pd.unique(np.asarray(details, dtype=object))
+    new = [d for d in distinct if d not in _parsed]
+    if new:
+        parts = pd.Series(new, dtype=object).fillna('').str.extract(DETAIL_PATTERN)
+        families = parts['variant'].str.extract(FAMILY_PATTERN)['family']
+        families = families.replace(FAMILY_ALIASES).fillna(UNKNOWN)
+        variants = parts['variant'].mask(parts['variant'] == '', UNKNOWN)
+        payloads = parts['payloads'].fillna('').str.split(PAYLOAD_SEPARATOR, regex=True)
+        with _lock:
+            for detail, family, variant, names in zip(new, families, variants, payloads):
+                _parsed[detail] = (family, variant, [name for name in names if name])
+    return pd.DataFrame(
+        [_parsed[d] for d in distinct],
+        index=pd.Index(distinct, name='Detail'),
+        columns=['family', 'variant', 'payloads'],
+    )
+
+
+def build_rocket_index(details):
+    # Integer codes per row, and each family's rows: with families sorted by
+    # name, the rows of family i are order[offsets[i]:offsets[i + 1]].
+    details = np.asarray(details, dtype=object)
+    codes, distinct = pd.factorize(details)
+    parsed = parse_details(distinct)
+    family_codes, families = pd.factorize(parsed['family'], sort=True)
+    variant_codes, variants = pd.factorize(parsed['variant'], sort=True)
+    variant_family = np.empty(len(variants), dtype='int64')
+    variant_family[variant_codes] = family_codes
+
+    family = family_codes[codes]
+    order = np.argsort(family, kind='stable')
+    offsets = np.zeros(len(families) + 1, dtype='int64')
+    np.cumsum(np.bincount(family, minlength=len(families)), out=offsets[1:])
+    return {
+        'families': pd.Index(families, name='family'),
+        'variants': pd.Index(variants, name='variant'),
+        'variant_family': variant_family,
+        'family': family,
+        'variant': variant_codes[codes],
+        'detail': codes,
+        'payloads': parsed['payloads'].to_numpy(),
+        'order': order,
+        'offsets': offsets,
+    }
+
+
+def family_rows(index, family):
+    # positions of the family's rows, in row order; none for an unknown family
+    i = index['families'].get_indexer([family])[0]
+    if i < 0:
+        return np.empty(0, dtype='int64')
+    return index['order'][index['offsets'][i]:index['offsets'][i + 1]]
+
+
+def build_rocket_cube(df, index, rows=None):
+    # launches, successes and known costs per (family, variant, year) over
+    # the rows of df, which are the index's rows at positions rows (all of
+    # them by default)
+    variant = index['variant'] if rows is None else index['variant'][rows]
+    cost = df['Rocket'].astype('float64')
+    values = pd.DataFrame({
+        'launches': 1,
+        'successes': (df['Status Mission'] == 'Success').to_numpy(),
+        'costed': cost.notna().to_numpy(),
+        'cost_sum': cost.fillna(0.0).to_numpy(),
+    })
+    cells = values.groupby([variant, df['year'].to_numpy()]).sum()
+    cells.index.names = ['variant', 'year']
+    cells = cells.reset_index()
+    codes = cells['variant'].to_numpy()
+    families = index['variant_family'][codes]
+    # categories are the names present, sorted, as compact() leaves them
+    cells['family'] = pd.Categorical.from_codes(families, index['families']).remove_unused_categories()
+    cells['variant'] = pd.Categorical.from_codes(codes, index['variants']).remove_unused_categories()
+    cells['year'] = cells['year'].astype(df['year'].dtype)
+    cells = compact(cells[DIMENSIONS + MEASURES])
+    return cells.astype({'successes': 'int64', 'costed': 'int64'})
+
+
+def merge_rocket_cubes(*cubes):
+    # cubes over different launches add up cell by cell; no cubes add up to
+    # an empty one
+    if not cubes:
+        return _empty_rocket_cube()
+    cells = compact(pd.concat(cubes, ignore_index=True))
+    # cubes with different families or variants concatenate to plain strings
+    for col in ['family', 'variant']:
+        cells[col] = pd.Categorical(cells[col].astype(object))
+    merged = cells.groupby(DIMENSIONS, observed=True)[MEASURES].sum().sort_index().reset_index()
+    return compact(merged)
+
+
+def _empty_rocket_cube():
+    df = pd.DataFrame({
+        'year': pd.Series(dtype='int16'),
+        'Status Mission': pd.Series(dtype=object),
+        'Rocket': pd.Series(dtype='Float32'),
+    })
+    return build_rocket_cube(df, build_rocket_index([]))
+
+
+def load_rocket_index(path=DATASET_PATH, snapshot_path=None):
+    source, _ = current_source(path, snapshot_path)
+    return cached(
+        source, 'rocket_index',
+        lambda: build_rocket_index(load_launches(['Detail'], None, path, snapshot_path)['Detail'])
+    )
+
+
+def _chunks(where, path, snapshot_path):
+    from space_missions.stream import iter_launches
+
+    columns = sorted(set(ROCKET_COLUMNS + FILTER_COLUMNS))
+    return filter_chunks(iter_launches(path, snapshot_path, columns=columns), where)
+
+
+def load_rocket_cube(path=DATASET_PATH, snapshot_path=None, where=None):
+    # built from the index's codes once per dataset version and filter state;
+    # in the chunked ingest mode folded chunk by chunk, each with an index of
+    # its own
+    from space_missions import stream
+
+    source, _ = current_source(path, snapshot_path)
+    if stream.ingest_mode() == 'chunked':
+        def build():
+            cubes = [build_rocket_cube(df, build_rocket_index(df['Detail'])) for df in _chunks(where, path, snapshot_path)]
+            return merge_rocket_cubes(*cubes)
+    else:
+        def build():
+            index = load_rocket_index(path, snapshot_path)
+            rows = filtered_rows(where, path, snapshot_path)
+            df = load_launches(ROCKET_COLUMNS, None, path, snapshot_path)
+            return build_rocket_cube(df if rows is None else df.iloc[rows], index, rows)
+    return cached_for(source, 'rocket_cube', where, build)
+
+
+def family_launches(family, path=DATASET_PATH, snapshot_path=None, where=None):
+    # the launches of one family matching where, newest first, with their
+    # variant and payloads
+    from space_missions import stream
+
+    if stream.ingest_mode() == 'chunked':
+        parts = []
+        for df in _chunks(where, path, snapshot_path):
+            index = build_rocket_index(df['Detail'])
+            rows = family_rows(index, family)
+            parts.append(_launch_table(df.iloc[rows], index, rows))
+        if not parts:
+            return pd.DataFrame(columns=LAUNCH_COLUMNS[:1] + ['variant', 'payloads'] + LAUNCH_COLUMNS[1:])
+        launches = pd.concat(parts, ignore_index=True)
+    else:
+        index = load_rocket_index(path, snapshot_path)
+        rows = family_rows(index, family)
+        selected = filtered_rows(where, path, snapshot_path)
+        if selected is not None:
+            rows = rows[np.isin(rows, selected, assume_unique=True)]
+        df = load_launches(LAUNCH_COLUMNS, None, path, snapshot_path)
+        launches = _launch_table(df.iloc[rows], index, rows)
+    launches = compact(launches.sort_values('date', ascending=False, kind='stable'))
+    return launches.reset_index(drop=True)
+
+
+def _launch_table(df, index, rows):
+    table = df[LAUNCH_COLUMNS].reset_index(drop=True)
+    table.insert(1, 'variant', index['variants'][index['variant'][rows]])
+    table.insert(2, 'payloads', [', '.join(names) for names in index['payloads'][index['detail'][rows]]])
+    return table
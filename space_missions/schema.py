@@ -0,0 +1,76 @@
+# Compact in-memory layout of the cleaned launch table.
+#
+#   python -m space_missions.schema    prints bytes per column, before/after
+import pandas as pd
+
+
+# low-cardinality strings, grouped on by the pages; Datum and Detail are
+# close to unique per launch and stay as plain strings
+CATEGORY_COLUMNS = [
+    'Company Name',
+    'Location',
+    'site',
+    'Status Rocket',
+    'Status Mission',
+    'country',
+    'alpha3',
+    'launch_site',
+]
+
+COMPACT_DTYPES = {
+    'year': 'int16',
+    'month': 'int8',
+    'weekday': 'int8',
+    'Rocket': 'Float32',
+}
+
+
+def compact(df):
+    # Categories are always the sorted set of values actually present, so the
+    # frame groups and sorts the same way whether it was built from the CSV,
+    # read back from Parquet or cut down to a year range.
+    # Group on these with observed=True, and follow with sort_index(): pandas
+    # 1.5 returns observed groups in order of appearance.
+    df = df.astype({c: t for c, t in COMPACT_DTYPES.items() if c in df.columns})
+    for col in CATEGORY_COLUMNS:
+        if col not in df.columns:
+            continue
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.cat.remove_unused_categories()
+            values = values.cat.reorder_categories(sorted(values.cat.categories))
+        else:
+            values = values.astype('category')
+        df[col] = values
+    return df
+
+
+def decode(df):
+    # Plain-string copy of a small aggregated frame for plotly, whose
+    # express functions group on every category, used or not.
+    cats = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    return df.astype({c: object for c in cats})
+
+
+def memory_report(before, after):
+    report = pd.DataFrame({
+        'before': before.memory_usage(index=False, deep=True),
+        'after': after.memory_usage(index=False, deep=True),
+    }).fillna(0).astype('int64')
+    report.loc['total'] = report.sum()
+    report['saved'] = report['before'] - report['after']
+    report['ratio'] = (report['before'] / report['after']).round(1)
+    return report
+
+
+def main():
+    from space_missions.data import clean_launches, read_raw
+
+    loose = clean_launches(read_raw(), compact_schema=False)
+    loose = loose.astype({'year': 'int64', 'month': 'int64', 'weekday': 'int64'})
+    loose = loose.astype({c: object for c in CATEGORY_COLUMNS})
+    print(memory_report(loose, compact(loose)).to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+# Launch sites on a pydeck map. Launches are rolled up here, from the cube's
+# launch_site dimension, into one point per site, or further into hexagons of
+# a few degrees, so the browser is sent a few dozen aggregates with their
+# counts and success rates rather than a point per launch:
+#
+#   table = load_site_table(where=where)
+#   st.pydeck_chart(site_deck(table))                 # one point per site
+#   st.pydeck_chart(site_deck(hex_bins(table, 5)))    # 5 degree hexagons
+#
+# Coordinates come from space_missions.sites, and the map has no base tiles,
+# only a graticule drawn here, so it renders without network access.
+import numpy as np
+import pandas as pd
+
+from space_missions.cube import load_cube, rollup
+from space_missions.data import DATASET_PATH, current_source
+from space_missions.filters import cached_for
+from space_missions.sites import site_coordinates
+
+
+# hexagon sizes offered, in degrees from centre to corner
+HEX_SIZES = [1, 2, 5, 10]
+GRATICULE_STEP = 30
+
+
+def build_site_table(cube):
+    # one row per launch site with a launch: launches, successes, success
+    # rate in percent, and its coordinates
+    table = rollup(cube, ['launch_site']).rename('launches').to_frame()
+    successes = rollup(cube, ['launch_site'], where={'Status Mission': 'Success'})
+    table['successes'] = successes.reindex(table.index, fill_value=0)
+    table = table[table['launches'] > 0]
+    table['success_rate'] = table['successes'] / table['launches'] * 100
+    table = table.join(site_coordinates(), how='inner')
+    return table.reset_index()
+
+
+def load_site_table(path=DATASET_PATH, snapshot_path=None, where=None):
+    source, _ = current_source(path, snapshot_path)
+    return cached_for(
+        source, 'site_table', where,
+        lambda: build_site_table(load_cube(path, snapshot_path, where))
+    )
+
+
+def hex_bins(table, size):
+    # The sites binned into pointy-top hexagons of the given size on the
+    # longitude/latitude plane: one row per hexagon with a site, its centre,
+    # corners, the sites in it and their summed launches and successes.
+    x = table['lon'].to_numpy() / size
+    y = table['lat'].to_numpy() / size
+    # fractional axial coordinates, rounded to the nearest hexagon through
+    # cube coordinates
+    q = np.sqrt(3) / 3 * x - y / 3
+    r = 2 / 3 * y
+    s = -q - r
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    # the coordinate rounded furthest is the one recomputed from the others
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    q = np.where(fix_q, -rr - rs, rq)
+    r = np.where(fix_r, -rq - rs, rr)
+
+    bins = table.assign(q=q.astype('int64'), r=r.astype('int64'))
+    hexes = bins.groupby(['q', 'r']).agg(
+        launches=('launches', 'sum'),
+        successes=('successes', 'sum'),
+        sites=('launch_site', lambda names: ', '.join(sorted(names))),
+    ).reset_index()
+    hexes['success_rate'] = hexes['successes'] / hexes['launches'] * 100
+    hexes['lon'] = size * np.sqrt(3) * (hexes['q'] + hexes['r'] / 2)
+    hexes['lat'] = size * 1.5 * hexes['r']
+    angles = np.radians(np.arange(6) * 60 - 30)
+    hexes['polygon'] = [
+        np.column_stack([lon + size * np.cos(angles), lat + size * np.sin(angles)]).round(4).tolist()
+        for lon, lat in zip(hexes['lon'], hexes['lat'])
+    ]
+    return hexes.drop(columns=['q', 'r'])
+
+
+def success_colors(rates):
+    # red at 0% success through to green at 100%, as RGBA lists
+    rates = np.clip(np.asarray(rates, dtype='float64') / 100, 0, 1)
+    return np.column_stack([
+        (230 * (1 - rates)).round(),
+        (190 * rates).round(),
+        np.full(len(rates), 60),
+        np.full(len(rates), 200),
+    ]).astype(int).tolist()
+
+
+def graticule(step=GRATICULE_STEP):
+    # meridians and parallels every step degrees, as paths
+    meridians = [[[lon, lat] for lat in range(-80, 81, 10)] for lon in range(-180, 181, step)]
+    parallels = [[[lon, lat] for lon in range(-180, 181, 10)] for lat in range(-60, 61, step)]
+    return pd.DataFrame({'path': meridians + parallels})
+
+
+def site_deck(table, height=500):
+    # a pydeck Deck of the sites, or of the hexagons when table comes from
+    # hex_bins; sized by launches, colored by success rate
+    import pydeck as pdk
+
+    data = table.assign(
+        color=success_colors(table['success_rate']),
+        rate=table['success_rate'].round(1),
+    )
+    layers = [pdk.Layer(
+        'PathLayer',
+        data=graticule(),
+        get_path='path',
+        get_color=[128, 128, 128, 80],
+        width_min_pixels=1,
+    )]
+    if 'polygon' in data.columns:
+        layers.append(pdk.Layer(
+            'PolygonLayer',
+            data=data[['polygon', 'sites', 'launches', 'rate', 'color']],
+            get_polygon='polygon',
+            get_fill_color='color',
+            get_line_color=[255, 255, 255, 120],
+            line_width_min_pixels=1,
+            pickable=True,
+        ))
+        tooltip = '<b>{sites}</b><br>{launches} launches, {rate}% successful'
+    else:
+        data['radius'] = np.sqrt(data['launches']) * 15000
+        layers.append(pdk.Layer(
+            'ScatterplotLayer',
+            data=data[['launch_site', 'lon', 'lat', 'launches', 'rate', 'color', 'radius']],
+            get_position=['lon', 'lat'],
+            get_radius='radius',
+            get_fill_color='color',
+            radius_min_pixels=3,
+            pickable=True,
+        ))
+        tooltip = '<b>{launch_site}</b><br>{launches} launches, {rate}% successful'
+    return pdk.Deck(
+        layers=layers,
+        initial_view_state=pdk.ViewState(latitude=25, longitude=20, zoom=0.8),
+        map_style=None,
+        map_provider=None,
+        tooltip={'html': tooltip},
+        height=height,
+    )
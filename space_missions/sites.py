@@ -0,0 +1,90 @@
+# Offline coordinates of the launch sites named in Location, keyed by
+# normalized site name. Nothing is geocoded: a Location resolves to the first
+# of its comma-separated parts that is in the table, e.g.
+#
+#   'LC-39A, Kennedy Space Center, Florida, USA'  -> 'Kennedy Space Center'
+#   'Site 31/6, Baikonur Cosmodrome, Kazakhstan'  -> 'Baikonur Cosmodrome'
+#
+# Coordinates are those of the site's main launch area, to about a kilometre;
+# pads of one site share its point.
+import re
+import unicodedata
+
+import pandas as pd
+
+
+# normalized name -> (site, latitude, longitude)
+SITES = {
+    'alcantara launch center': ('Alcantara Launch Center', -2.32, -44.37),
+    'baikonur cosmodrome': ('Baikonur Cosmodrome', 45.92, 63.34),
+    'barents sea launch area': ('Barents Sea Launch Area', 69.50, 35.00),
+    'base aerea de gando': ('Base Aerea de Gando', 27.93, -15.39),
+    'blue origin launch site': ('Blue Origin Launch Site', 31.42, -104.76),
+    'boca chica': ('Boca Chica', 25.99, -97.16),
+    'cape canaveral afs': ('Cape Canaveral AFS', 28.49, -80.57),
+    'edwards afb': ('Edwards AFB', 34.91, -117.88),
+    'guiana space centre': ('Guiana Space Centre', 5.24, -52.77),
+    'hammaguir': ('Hammaguir', 30.88, -3.04),
+    'jiuquan satellite launch center': ('Jiuquan Satellite Launch Center', 40.96, 100.29),
+    'kapustin yar': ('Kapustin Yar', 48.58, 45.77),
+    'kennedy space center': ('Kennedy Space Center', 28.61, -80.60),
+    'kiritimati launch area': ('Kiritimati Launch Area', 0.00, -154.00),
+    'mahia peninsula': ('Mahia Peninsula', -39.26, 177.86),
+    'mojave air and space port': ('Mojave Air and Space Port', 35.06, -118.15),
+    'naro space center': ('Naro Space Center', 34.43, 127.54),
+    'naval air station point mugu': ('Naval Air Station Point Mugu', 34.12, -119.12),
+    'pacific missile range facility': ('Pacific Missile Range Facility', 22.02, -159.78),
+    'pacific spaceport complex': ('Pacific Spaceport Complex', 57.44, -152.34),
+    'palmachim airbase': ('Palmachim Airbase', 31.88, 34.68),
+    'plesetsk cosmodrome': ('Plesetsk Cosmodrome', 62.93, 40.57),
+    'raaf woomera range complex': ('RAAF Woomera Range Complex', -30.96, 136.50),
+    'ronald reagan ballistic missile defense test site': ('Ronald Reagan Test Site', 9.05, 167.74),
+    'san marco launch platform': ('San Marco Launch Platform', -2.94, 40.21),
+    'satish dhawan space centre': ('Satish Dhawan Space Centre', 13.72, 80.23),
+    'semnan space center': ('Semnan Space Center', 35.23, 53.92),
+    'shahrud missile test site': ('Shahrud Missile Test Site', 36.20, 55.33),
+    'sohae satellite launching station': ('Sohae Satellite Launching Station', 39.66, 124.71),
+    'spaceport america': ('Spaceport America', 32.99, -106.97),
+    'svobodny cosmodrome': ('Svobodny Cosmodrome', 51.70, 128.00),
+    'taiyuan satellite launch center': ('Taiyuan Satellite Launch Center', 38.85, 111.61),
+    'tanegashima space center': ('Tanegashima Space Center', 30.40, 130.97),
+    'tonghae satellite launching ground': ('Tonghae Satellite Launching Ground', 40.86, 129.67),
+    'uchinoura space center': ('Uchinoura Space Center', 31.25, 131.08),
+    'vandenberg afb': ('Vandenberg AFB', 34.74, -120.57),
+    'vostochny cosmodrome': ('Vostochny Cosmodrome', 51.88, 128.33),
+    'wallops flight facility': ('Wallops Flight Facility', 37.84, -75.49),
+    'wenchang satellite launch center': ('Wenchang Satellite Launch Center', 19.61, 110.95),
+    'xichang satellite launch center': ('Xichang Satellite Launch Center', 28.25, 102.03),
+    'yasny cosmodrome': ('Yasny Cosmodrome', 51.09, 59.84),
+    'yellow sea': ('Yellow Sea', 34.90, 121.20),
+}
+
+# names as the CSV spells them, its accented letters lost in an old encoding
+# ('M?\x81hia Peninsula'), normalized -> normalized name in SITES
+SITE_ALIASES = {
+    'm hia peninsula': 'mahia peninsula',
+    'alc ntara launch center': 'alcantara launch center',
+}
+
+
+def normalize_site(name):
+    # lower case ASCII words separated by single spaces: accents dropped,
+    # anything else not a letter or digit is a separator
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    name = ' '.join(re.sub(r'[^0-9a-z]+', ' ', name.lower()).split())
+    return SITE_ALIASES.get(name, name)
+
+
+def find_site(location):
+    # the SITES name of a Location, None when no part of it is in the table
+    for part in location.split(', '):
+        site = SITES.get(normalize_site(part))
+        if site is not None:
+            return site[0]
+    return None
+
+
+def site_coordinates():
+    # one row per site with its latitude and longitude
+    table = pd.DataFrame(list(SITES.values()), columns=['launch_site', 'lat', 'lon'])
+    return table.set_index('launch_site').sort_index()
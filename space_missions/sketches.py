@@ -0,0 +1,125 @@
+# Launch cost distributions as mergeable quantile sketches. Each known cost
+# falls in a logarithmic bucket, and the sketch counts launches per bucket and
+# per filter dimension, like a cube cell:
+#
+#   sketches = load_cost_sketches()
+#   cost_quantiles(sketches, ['year'])                      # count, median, p90
+#   cost_quantiles(sketches, ['Company Name'], BOX)         # min, q1, median, q3, max
+#
+# A bucket's value is within ALPHA of every cost in it (relative error, as in
+# DDSketch), so any quantile read from the counts is too. Sketches built over
+# separate chunks, deltas or partitions add up bucket by bucket to the sketch
+# of all their rows, and a quantile is a cumulative sum over a group's
+# buckets, never a sort of the costs. Unknown costs are left out, not counted
+# as free.
+import numpy as np
+import pandas as pd
+
+from space_missions.cube import select
+from space_missions.data import DATASET_PATH, cached, current_source, load_launches
+from space_missions.filters import FILTER_COLUMNS, build_index, cached_for, filter_key, select_rows
+from space_missions.schema import compact, decode
+
+
+# relative accuracy of every quantile
+ALPHA = 0.01
+GAMMA = (1 + ALPHA) / (1 - ALPHA)
+# free launches, which have no logarithm, get a bucket of their own
+ZERO_BUCKET = np.iinfo('int32').min
+
+# the filter columns, so a filtered sketch is a selection of cells
+DIMENSIONS = FILTER_COLUMNS
+
+# quantile -> column name
+QUANTILES = {0.5: 'median', 0.9: 'p90'}
+BOX = {0.0: 'min', 0.25: 'q1', 0.5: 'median', 0.75: 'q3', 1.0: 'max'}
+
+
+def bucket_of(costs):
+    costs = np.asarray(costs, dtype='float64')
+    with np.errstate(divide='ignore'):
+        buckets = np.ceil(np.log(costs) / np.log(GAMMA))
+    return np.where(costs > 0, buckets, ZERO_BUCKET).astype('int32')
+
+
+def bucket_value(buckets):
+    # the point of the bucket equally far, relatively, from both its bounds
+    buckets = np.asarray(buckets)
+    return np.where(buckets == ZERO_BUCKET, 0.0, 2 * GAMMA ** buckets.astype('float64') / (GAMMA + 1))
+
+
+def _group_keys(df):
+    return [
+        df[d].cat.codes.rename(d) if isinstance(df[d].dtype, pd.CategoricalDtype) else df[d]
+        for d in DIMENSIONS
+    ] + [df['bucket']]
+
+
+def _restore_dimensions(cells, df):
+    for d in DIMENSIONS:
+        if isinstance(df[d].dtype, pd.CategoricalDtype):
+            cells[d] = pd.Categorical.from_codes(cells[d], df[d].cat.categories)
+        else:
+            cells[d] = cells[d].astype(df[d].dtype)
+    return cells
+
+
+def build_cost_sketches(df):
+    # one row per (dimensions, bucket) with the launches whose known cost
+    # falls in it; categories are those of the costed launches only
+    cost = df['Rocket'].astype('float64')
+    known = compact(df.loc[cost.notna(), DIMENSIONS]).assign(bucket=bucket_of(cost[cost.notna()]))
+    cells = known.groupby(_group_keys(known)).size().rename('count').reset_index()
+    return _restore_dimensions(cells, known)
+
+
+def merge_cost_sketches(*sketches):
+    cells = compact(pd.concat(sketches, ignore_index=True))
+    merged = cells['count'].groupby(_group_keys(cells)).sum().reset_index()
+    return _restore_dimensions(merged, cells)
+
+
+def load_cost_sketches(path=DATASET_PATH, snapshot_path=None, where=None):
+    # built once per dataset version, or folded chunk by chunk in the chunked
+    # ingest mode; where is a filter state as in space_missions.filters
+    from space_missions import stream
+
+    if stream.ingest_mode() == 'chunked':
+        return stream.load_aggregates(path, snapshot_path, where)[2]
+    source, _ = current_source(path, snapshot_path)
+    sketches = cached(
+        source, 'cost_sketches',
+        lambda: build_cost_sketches(load_launches(DIMENSIONS + ['Rocket'], None, path, snapshot_path))
+    )
+    if filter_key(where) is None:
+        return sketches
+    index = cached(source, 'cost_sketch_index', lambda: build_index(sketches))
+    return cached_for(
+        source, 'cost_sketches', where,
+        lambda: sketches.iloc[select_rows(index, where)].reset_index(drop=True)
+    )
+
+
+def cost_quantiles(sketches, by, quantiles=QUANTILES, where=None):
+    # One row per group of the `by` dimensions with a known cost: its count
+    # of costed launches and the cost at each quantile, named as in
+    # quantiles. The q quantile of n costs is the one at 0-based rank
+    # floor(q * (n - 1)).
+    cells = select(sketches, where)
+    counts = cells.groupby(by + ['bucket'], observed=True)['count'].sum().sort_index()
+    counts = counts[counts > 0]
+    groups = counts.groupby(level=list(range(len(by))), observed=True)
+    total = groups.transform('sum').to_numpy()
+    above = groups.cumsum().to_numpy()
+    below = above - counts.to_numpy()
+    buckets = counts.index.get_level_values('bucket').to_numpy()
+    keys = counts.index.droplevel('bucket')
+
+    result = pd.DataFrame({'count': groups.sum().sort_index()})
+    for q, column in quantiles.items():
+        rank = np.floor(q * (total - 1))
+        # the one bucket per group whose launches cover the rank
+        hit = (below <= rank) & (rank < above)
+        result[column] = pd.Series(bucket_value(buckets[hit]), index=keys[hit])
+    result = decode(result.reset_index())
+    return result.set_index(by)
@@ -0,0 +1,141 @@
+# Year-partitioned Parquet snapshot of the cleaned launch table.
+#
+#   python -m space_missions.snapshot [--csv dataset/Space_Corrected.csv]
+#
+# The app reads from the snapshot when it is present and up to date with the
+# CSV, projecting only the columns a page uses and skipping year partitions
+# outside the page's range.
+import argparse
+import json
+import os
+import shutil
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from space_missions.data import DATASET_PATH, ROOT_DIR, clean_launches, dataset_key, read_raw
+from space_missions.schema import compact
+
+
+SNAPSHOT_PATH = os.path.join(ROOT_DIR, 'dataset', 'launches.parquet')
+MANIFEST = '_manifest.json'
+INDEX_COLUMN = '__index_level_0__'
+# bump whenever clean_launches changes what it produces
+FORMAT_VERSION = 5
+
+partitioning = ds.partitioning(pa.schema([('year', pa.int16())]), flavor='hive')
+
+
+def read_manifest(path=SNAPSHOT_PATH):
+    try:
+        with open(os.path.join(path, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(manifest, source=DATASET_PATH):
+    # a snapshot without its CSV next to it is used as is
+    if manifest is None or manifest.get('format_version') != FORMAT_VERSION:
+        return False
+    if not os.path.exists(source):
+        return True
+    _, size, mtime = dataset_key(source)
+    return manifest['source_size'] == size and manifest['source_mtime_ns'] == mtime
+
+
+def _write_partitions(df, path):
+    ds.write_dataset(
+        pa.Table.from_pandas(df, preserve_index=True),
+        path,
+        format='parquet',
+        partitioning=partitioning,
+        existing_data_behavior='delete_matching'
+    )
+
+
+def _write_manifest(path, source, columns):
+    _, size, mtime = dataset_key(source)
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'source_size': size,
+        'source_mtime_ns': mtime,
+        'columns': list(columns),
+        'rows': ds.dataset(path, format='parquet', partitioning=partitioning).count_rows(),
+    }
+    with open(os.path.join(path, MANIFEST), 'w') as f:
+        json.dump(manifest, f)
+    return manifest
+
+
+def write_snapshot(df, path=SNAPSHOT_PATH, source=DATASET_PATH):
+    tmp = path + '.tmp'
+    shutil.rmtree(tmp, ignore_errors=True)
+    _write_partitions(df, tmp)
+    manifest = _write_manifest(tmp, source, df.columns)
+
+    old = path + '.old'
+    if os.path.exists(path):
+        os.replace(path, old)
+    os.replace(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+    return manifest
+
+
+def write_partitions(df, path=SNAPSHOT_PATH, source=DATASET_PATH):
+    # Rewrites just the year partitions df has rows for, e.g. after new
+    # launches were appended to the CSV, and marks the snapshot current again.
+    # df must hold every row of those years.
+    _write_partitions(df, path)
+    return _write_manifest(path, source, df.columns)
+
+
+def year_filter(years):
+    lo, hi = years
+    expr = None
+    if lo is not None:
+        expr = ds.field('year') >= lo
+    if hi is not None:
+        bound = ds.field('year') <= hi
+        expr = bound if expr is None else expr & bound
+    return expr
+
+
+def read_snapshot(path=SNAPSHOT_PATH, columns=None, years=None, manifest=None):
+    manifest = manifest or read_manifest(path)
+    order = manifest['columns']
+    columns = order if columns is None else [c for c in order if c in columns]
+    dataset = ds.dataset(path, format='parquet', partitioning=partitioning)
+    table = dataset.to_table(
+        columns=columns + [INDEX_COLUMN],
+        filter=None if years is None else year_filter(years)
+    )
+    # the stored index becomes the frame's index again; partitions come back
+    # in year order, so sorting on it restores the CSV's row order
+    return compact(table.to_pandas().sort_index()[columns])
+
+
+def iter_snapshot(path=SNAPSHOT_PATH, columns=None, batch_rows=100_000, manifest=None):
+    # the snapshot as compacted frames of at most batch_rows, in no set order
+    manifest = manifest or read_manifest(path)
+    order = manifest['columns']
+    columns = order if columns is None else [c for c in order if c in columns]
+    dataset = ds.dataset(path, format='parquet', partitioning=partitioning)
+    for batch in dataset.to_batches(columns=columns, batch_size=batch_rows):
+        if batch.num_rows:
+            yield compact(batch.to_pandas())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write the year-partitioned Parquet snapshot.')
+    parser.add_argument('--csv', default=DATASET_PATH)
+    parser.add_argument('--out', default=SNAPSHOT_PATH)
+    args = parser.parse_args()
+
+    df = clean_launches(read_raw(args.csv))
+    manifest = write_snapshot(df, args.out, args.csv)
+    print('wrote %d rows to %s' % (manifest['rows'], args.out))
+
+
+if __name__ == '__main__':
+    main()
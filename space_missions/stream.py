@@ -0,0 +1,83 @@
+# Bounded-memory ingestion. The launches are read a chunk at a time, each chunk
+# cleaned on its own and folded into the running cube, company profile and
+# cost sketches, so
+# memory holds one chunk plus the aggregates however large the file grows.
+# The pages only read those aggregates; the full launch table is never built.
+#
+#   SPACE_MISSIONS_INGEST=chunked streamlit run app.py
+#   SPACE_MISSIONS_CHUNK_ROWS=50000 ...
+#
+# The default, 'eager', loads the whole table once (space_missions.data).
+import os
+
+import pandas as pd
+
+from space_missions.companies import PROFILE_COLUMNS, build_company_profile, merge_company_profiles
+from space_missions.cube import DIMENSIONS, build_cube, merge_cubes
+from space_missions.data import DATASET_PATH, RAW_COLUMNS, clean_launches, current_source
+from space_missions.filters import cached_for, filter_chunks
+from space_missions.sketches import build_cost_sketches, merge_cost_sketches
+
+
+INGEST_MODES = ['eager', 'chunked']
+CHUNK_ROWS = 100_000
+# what the cube, the company profile and the cost sketches are built from
+AGGREGATE_COLUMNS = sorted(set(DIMENSIONS + PROFILE_COLUMNS + ['Rocket']))
+
+
+def ingest_mode():
+    mode = os.environ.get('SPACE_MISSIONS_INGEST', 'eager')
+    if mode not in INGEST_MODES:
+        raise ValueError('SPACE_MISSIONS_INGEST must be one of %s, not %r' % (INGEST_MODES, mode))
+    return mode
+
+
+def chunk_rows():
+    return int(os.environ.get('SPACE_MISSIONS_CHUNK_ROWS', CHUNK_ROWS))
+
+
+def iter_launches(path=DATASET_PATH, snapshot_path=None, rows=None, columns=None):
+    # Cleaned launches in chunks of at most rows: batches of the Parquet
+    # snapshot when it is current, otherwise the CSV read and cleaned a chunk
+    # at a time.
+    from space_missions import snapshot
+
+    rows = rows or chunk_rows()
+    snapshot_path = snapshot_path or snapshot.SNAPSHOT_PATH
+    _, manifest = current_source(path, snapshot_path)
+    if manifest is not None:
+        yield from snapshot.iter_snapshot(snapshot_path, columns, rows, manifest)
+        return
+    with pd.read_csv(path, chunksize=rows) as reader:
+        for raw in reader:
+            df = clean_launches(raw)
+            yield df if columns is None else df[[c for c in df.columns if c in columns]]
+
+
+def aggregate_launches(chunks):
+    # (cube, company profile, cost sketches) folded chunk by chunk; equal to
+    # build_cube, build_company_profile and build_cost_sketches over all the
+    # rows at once, and empty but of the same columns and dtypes without any
+    cube = profile = costs = None
+    for df in chunks:
+        if cube is None:
+            cube, profile, costs = build_cube(df), build_company_profile(df), build_cost_sketches(df)
+        else:
+            cube = merge_cubes(cube, build_cube(df))
+            profile = merge_company_profiles(profile, build_company_profile(df), cube)
+            costs = merge_cost_sketches(costs, build_cost_sketches(df))
+    if cube is None:
+        return aggregate_launches([clean_launches(pd.DataFrame(columns=RAW_COLUMNS))])
+    return cube, profile, costs
+
+
+def load_aggregates(path=DATASET_PATH, snapshot_path=None, where=None):
+    # a filter state takes one more pass over the chunks, each masked with a
+    # bitmap index of its own
+    source, _ = current_source(path, snapshot_path)
+    return cached_for(
+        source, 'aggregates', where,
+        lambda: aggregate_launches(
+            filter_chunks(iter_launches(path, snapshot_path, columns=AGGREGATE_COLUMNS), where)
+        )
+    )
@@ -0,0 +1,114 @@
+# Country -> company -> mission status sunburst with a node budget. Only the
+# top companies of each country keep their own node; the rest are folded into
+# one "Other" node per country, so every level still adds up to the exact
+# totals. A country's full subtree is built separately, when it is drilled into.
+#
+#   nodes = load_sunburst(top=5)
+#   fig = sunburst_figure(nodes)
+#   fig = sunburst_figure(country_subtree(load_sunburst_counts(), 'China'))
+import pandas as pd
+import plotly.graph_objects as go
+
+from space_missions.cube import load_cube, rollup
+from space_missions.data import DATASET_PATH, current_source
+from space_missions.filters import cached_for
+
+
+# companies kept per country in the precomputed trees
+BUDGETS = [3, 5, 10]
+OTHER = 'Other'
+LEVELS = ['country', 'company', 'status']
+
+
+def build_sunburst_counts(cube):
+    counts = rollup(cube, ['country', 'Company Name', 'Status Mission']).reset_index()
+    counts.columns = LEVELS + ['launches']
+    return counts
+
+
+def company_ranks(counts):
+    # 0 for each country's busiest company, ties broken by name
+    totals = counts.groupby(['country', 'company'], sort=False)['launches'].sum().reset_index()
+    totals = totals.sort_values(
+        ['country', 'launches', 'company'], ascending=[True, False, True], kind='stable'
+    )
+    totals['rank'] = totals.groupby('country', sort=False).cumcount()
+    return totals.set_index(['country', 'company'])['rank']
+
+
+def fold_companies(counts, top):
+    # counts with every company past the top ones of its country renamed to
+    # OTHER and summed up; a single company is never folded on its own
+    rank = company_ranks(counts)
+    folded_per_country = (rank >= top).groupby(level='country').sum()
+    fold = (rank >= top) & (folded_per_country.reindex(rank.index, level='country') > 1)
+    fold = fold.reindex(list(zip(counts['country'], counts['company']))).to_numpy()
+    if not fold.any():
+        return counts
+    counts = counts.assign(company=counts['company'].where(~fold, OTHER))
+    return counts.groupby(LEVELS, sort=True)['launches'].sum().reset_index()
+
+
+def id_parts(values):
+    # values as parts of a node id, which joins them with '/': a '/' in a
+    # value is escaped, so 'A/B' > 'C' and 'A' > 'B/C' stay two nodes
+    return values.astype(str).str.replace('\\', '\\\\', regex=False).str.replace('/', '\\/', regex=False)
+
+
+def sunburst_nodes(counts, top=None):
+    # id, label, parent and value of every node; a node's value is the sum of
+    # its children's, as go.Sunburst expects with branchvalues='total'
+    if top is not None:
+        counts = fold_companies(counts, top)
+    levels = []
+    for depth in range(1, len(LEVELS) + 1):
+        keys = LEVELS[:depth]
+        level = counts.groupby(keys, sort=True)['launches'].sum().reset_index()
+        level['parent'] = ''
+        level['id'] = id_parts(level[keys[0]])
+        for key in keys[1:]:
+            level['parent'] = level['id']
+            level['id'] = level['id'] + '/' + id_parts(level[key])
+        level['label'] = level[keys[-1]]
+        levels.append(level[['id', 'label', 'parent', 'launches']])
+    return pd.concat(levels, ignore_index=True)
+
+
+def country_subtree(counts, country):
+    # every company of one country, unpruned, rooted at the country
+    return sunburst_nodes(counts[counts['country'] == country])
+
+
+def load_sunburst_counts(path=DATASET_PATH, snapshot_path=None, where=None):
+    source, _ = current_source(path, snapshot_path)
+    return cached_for(
+        source, 'sunburst_counts', where,
+        lambda: build_sunburst_counts(load_cube(path, snapshot_path, where))
+    )
+
+
+def load_sunburst(top, path=DATASET_PATH, snapshot_path=None, where=None):
+    # the trees for all BUDGETS are built together the first time one is asked for
+    source, _ = current_source(path, snapshot_path)
+    counts = load_sunburst_counts(path, snapshot_path, where)
+    trees = cached_for(source, 'sunburst_trees', where, lambda: {n: sunburst_nodes(counts, n) for n in BUDGETS})
+    if top not in trees:
+        return sunburst_nodes(counts, top)
+    return trees[top]
+
+
+def sunburst_figure(nodes, title='Sunburst chart for all countries', width=800, height=500):
+    fig = go.Figure(go.Sunburst(
+        ids=nodes['id'],
+        labels=nodes['label'],
+        parents=nodes['parent'],
+        values=nodes['launches'],
+        branchvalues='total',
+    ))
+    fig.update_layout(
+        title=title,
+        width=width,
+        height=height,
+        margin=dict(l=0, r=0, t=30, b=0)
+    )
+    return fig
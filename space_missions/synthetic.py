@@ -0,0 +1,137 @@
+# Synthetic launches in the Space_Corrected.csv layout, for scale testing.
+#
+#   python -m space_missions.synthetic --scale 1000 --out dataset/synthetic_1000x.csv
+#
+# Rows are drawn from the real launches with replacement, so Company Name,
+# Location, Detail, Status Rocket, Status Mission and the sparse Rocket cost
+# keep their joint distribution, and every draw keeps its source launch's year
+# so all of them stay correlated with time as well. Only the launch moment is
+# redrawn within that year, clipped to the dataset's date range, and written
+# in the Datum format with or without the time of day as the source had it.
+#
+# Chunks are generated and written one at a time from per-chunk seeds: the
+# same seed and chunk size give the same file, and memory stays at one chunk
+# however many rows are asked for.
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as csv
+
+from space_missions.data import DATASET_PATH
+from space_missions.dates import parse_launch_dates
+
+
+CHUNK_ROWS = 1_000_000
+
+WEEKDAYS = np.array(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'], dtype=object)
+MONTHS = np.array(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+    dtype=object
+)
+TWO_DIGITS = np.array(['%02d' % i for i in range(100)], dtype=object)
+CLOCK = np.array([' %02d:%02d UTC' % (m // 60, m % 60) for m in range(1440)], dtype=object)
+MINUTE = pd.Timedelta(minutes=1).value
+
+
+def load_templates(path=DATASET_PATH):
+    # The raw rows as text, exactly as they will be written back, plus the
+    # window each row's launch moment is redrawn in (minutes since the epoch).
+    raw = pd.read_csv(path, dtype=str, keep_default_na=False)
+    dates, unparsed = parse_launch_dates(raw['Datum'])
+    if len(unparsed):
+        raise ValueError('%d launch dates could not be parsed' % len(unparsed))
+    with open(path) as f:
+        header = f.readline()
+
+    minutes = dates.dt.tz_localize(None).astype('int64') // MINUTE
+    year = dates.dt.year
+    year_start = pd.to_datetime(year.astype(str) + '-01-01').astype('int64') // MINUTE
+    year_end = pd.to_datetime((year + 1).astype(str) + '-01-01').astype('int64') // MINUTE - 1
+    return {
+        'raw': raw,
+        'header': header,
+        'lo': np.maximum(year_start, minutes.min()).to_numpy(),
+        'hi': np.minimum(year_end, minutes.max()).to_numpy(),
+        'with_time': raw['Datum'].str.endswith('UTC').to_numpy(),
+    }
+
+
+def format_datum(minutes, with_time):
+    # 'Fri Aug 07, 2020 05:12 UTC' or 'Fri Aug 07, 2020'. A chunk only spans
+    # a few thousand distinct days and there are 1440 clock times, so both
+    # halves are formatted once per distinct value and then looked up.
+    days, day_codes = np.unique(minutes // 1440, return_inverse=True)
+    stamps = pd.DatetimeIndex(days * 1440 * MINUTE)
+    dates = (
+        WEEKDAYS[stamps.dayofweek] + ' ' + MONTHS[stamps.month - 1] + ' '
+        + TWO_DIGITS[stamps.day] + ', ' + stamps.year.astype(str).to_numpy(dtype=object)
+    )[day_codes]
+    clock = CLOCK[minutes % 1440]
+    return np.where(with_time, dates + clock, dates)
+
+
+def generate_chunk(templates, start, rows, seed):
+    rng = np.random.default_rng(seed)
+    pick = rng.integers(0, len(templates['raw']), rows)
+    chunk = templates['raw'].iloc[pick].reset_index(drop=True)
+
+    lo = templates['lo'][pick]
+    hi = templates['hi'][pick]
+    minutes = lo + (rng.random(rows) * (hi - lo + 1)).astype('int64')
+    chunk['Datum'] = format_datum(minutes, templates['with_time'][pick])
+
+    # the two leading columns are running row numbers in the source file
+    index = np.arange(start, start + rows)
+    chunk[chunk.columns[0]] = index
+    chunk[chunk.columns[1]] = index
+    return chunk
+
+
+def generate(rows, seed=0, chunk_rows=CHUNK_ROWS, path=DATASET_PATH):
+    # Yields chunks of at most chunk_rows as read_csv would return them, ready
+    # for clean_launches: same rows as write_synthetic, but a missing cost is
+    # NaN rather than ''.
+    templates = load_templates(path)
+    cost = templates['raw'].columns[7]
+    for number, start in enumerate(range(0, rows, chunk_rows)):
+        chunk = generate_chunk(templates, start, min(chunk_rows, rows - start), [seed, number])
+        chunk[cost] = chunk[cost].mask(chunk[cost] == '')
+        yield chunk
+
+
+def write_synthetic(out, rows, seed=0, chunk_rows=CHUNK_ROWS, path=DATASET_PATH):
+    # written with pyarrow, an order of magnitude faster than to_csv here; it
+    # quotes every text field, which read_csv takes the same way
+    templates = load_templates(path)
+    options = csv.WriteOptions(include_header=False)
+    with open(out, 'wb') as f:
+        f.write(templates['header'].encode())
+        for number, start in enumerate(range(0, rows, chunk_rows)):
+            chunk = generate_chunk(templates, start, min(chunk_rows, rows - start), [seed, number])
+            csv.write_csv(pa.Table.from_pandas(chunk, preserve_index=False), f, options)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic launch dataset.')
+    size = parser.add_mutually_exclusive_group(required=True)
+    size.add_argument('--scale', type=float, help='multiple of the source row count, e.g. 10, 1000, 100000')
+    size.add_argument('--rows', type=int)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--csv', default=DATASET_PATH, help='launches to draw from')
+    parser.add_argument('--out', required=True)
+    args = parser.parse_args()
+
+    rows = args.rows
+    if rows is None:
+        rows = int(round(len(pd.read_csv(args.csv, usecols=['Datum'])) * args.scale))
+    write_synthetic(args.out, rows, args.seed, args.chunk_rows, args.csv)
+    print('wrote %d rows to %s (%.1f MB)' % (rows, args.out, os.path.getsize(args.out) / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+# What the pages share: a chart drawn from its dataset through the figure
+# cache, or a note in its place when the sidebar filters leave it no data.
+#
+#   plot_chart('best.countries', lambda: countries_data(cube, k), countries_figure, k=k, filters=state)
+import streamlit as st
+
+from space_missions.figures import cached_figure
+
+
+NO_DATA = 'No launches in the sidebar selection for this chart.'
+
+
+def figure_of(data, figure):
+    # figure(data), None when data has no rows
+    return figure(data) if len(data) else None
+
+
+def plot_chart(chart_id, data, figure, container=st, **params):
+    # figure(data()) through cached_figure, so data() only runs when the
+    # figure is not cached yet, and an st.info note instead of an empty chart
+    spec = cached_figure(chart_id, lambda: figure_of(data(), figure), **params)
+    if spec is None:
+        container.info(NO_DATA)
+    else:
+        container.plotly_chart(spec, use_container_width=True)
+    return spec
@@ -0,0 +1,31 @@
+import streamlit as st
+
+from space_missions.filters import filter_chunks, filtered_launches
+from space_missions.stream import ingest_mode, iter_launches
+
+
+def render(page, where=None):
+    st.title("📊" + page)
+    st.markdown(''' _The Space Missions Analysis dataset contains information on space missions launched by various countries around the world from 1957 to present. The data includes details such as the launch date, country of origin, rocket used, mission status, and more. The dataset provides valuable insights into the history and trends of space exploration, and can be used to analyze the involvement of different countries in space missions, the success rates of missions, and the evolution of rocket technology over time. Through data visualization, this dataset can help to provide a deeper understanding of the past, present, and future of space exploration._ ''')
+    st.write('## Data Frame')
+    if ingest_mode() == 'chunked':
+        # the full table is never loaded in this mode: show the first chunk
+        # with any matching launches
+        df = next(filter_chunks(iter_launches(), where))
+        st.caption('First %d matching launches' % len(df))
+    else:
+        df = filtered_launches(where)
+    st.dataframe(df)
+    st.markdown("""
+        ### Data Wrangling
+        Cleaning and wrangling the data involves several steps, including:
+
+        - Any duplicate or irrelevant data was removed to ensure that the dataset is accurate and relevant for analysis. In addition, any rows or columns that had null values in the rocket name column were removed since this information is important for analyzing the rocket technology used in each mission. 
+
+        - We have converted the date and time format in the data to a more suitable format that can be effectively analyzed and visualized. This conversion was carried out using the appropriate Python libraries and functions that ensure a professional and accurate handling of the data.
+
+        - In the data wrangling process, the date column was parsed to extract additional information such as month, year, and weekday. This was done to facilitate the visualization of the data by grouping it into different time periods and identifying trends and patterns. 
+
+        - We performed a scaling operation on the price data by multiplying the original values, which ranged from 0 to 1, by a factor of 1,000,000. This was done to convert the values into millions, enabling better comparability and analysis of the data.
+
+    """)
@@ -0,0 +1,106 @@
+import plotly.express as px
+import streamlit as st
+
+from space_missions.analytics.best_every_year import (
+    companies_data,
+    companies_success_data,
+    countries_data,
+    countries_success_data,
+)
+from space_missions.cube import load_cube
+from space_missions.filters import filter_key
+from space_missions.views import plot_chart
+
+
+def countries_figure(ds):
+    fig = px.bar(
+        ds, 
+        x="year", 
+        y="launches", 
+        color='country', 
+        hover_data=['rank'],
+        title='Leaders by launches for every year (countries)'
+    )
+    return fig
+
+
+def countries_success_figure(ds):
+    fig = px.bar(
+        ds, 
+        x="year", 
+        y="launches", 
+        color='country', 
+        hover_data=['rank'],
+        title='Leaders by success launches for every year (countries)',
+        width=800
+    )
+    return fig
+
+
+def companies_figure(ds):
+    fig = px.bar(
+        ds, 
+        x="year", 
+        y="launches", 
+        color='company', 
+        hover_data=['rank'],
+        title='Leaders by launches for every year (companies)',
+        width=800
+    )
+    return fig
+
+
+def companies_success_figure(ds):
+    fig = px.bar(
+        ds, 
+        x="year", 
+        y="launches", 
+        color='company', 
+        hover_data=['rank'],
+        title='Leaders by success launches for every year (companies)',
+        width=800
+    )
+    return fig
+
+
+# dataset name -> figure of it, as the page draws it by default
+FIGURES = {
+    'best.countries': countries_figure,
+    'best.countries_success': countries_success_figure,
+    'best.companies': companies_figure,
+    'best.companies_success': companies_success_figure,
+}
+
+
+def render(page, where=None):
+    st.title("🏆" + page)
+    k = st.slider('Leaders per year', min_value=1, max_value=5, value=1)
+    state = filter_key(where)
+    cube = load_cube(where=where)
+    plot_chart('best.countries', lambda: countries_data(cube, k), countries_figure, k=k, filters=state)
+
+    #-------------------------------------------------------------------------------------
+    plot_chart('best.countries_success', lambda: countries_success_data(cube, k), countries_success_figure, k=k, filters=state)
+    st.markdown('''
+    ##### Insights
+
+    - _The USSR was the first country to launch a satellite, Sputnik 1, in 1957, which sparked the space race between the USSR and the USA.The combination of government support, early achievements, and technical expertise helped the USSR establish dominance in space exploration during the 1960s to 1990s._
+
+    - _In recent years, the Chinese government has significantly increased its investment in space exploration, leading to rapid development and progress in China's space technology._
+
+    ''')
+
+    #----------------------------------------------------------------------------------------
+    plot_chart('best.companies', lambda: companies_data(cube, k), companies_figure, k=k, filters=state)
+
+    #---------------------------------------------------------------------------------------
+    plot_chart('best.companies_success', lambda: companies_success_data(cube, k), companies_success_figure, k=k, filters=state)
+
+
+    st.markdown('''
+    ##### Insights
+
+    - _The US and USSR had a head start in space exploration, with the US launching the first satellite in 1958 and the USSR launching the first human, Yuri Gagarin, into space in 1961. This early lead gave them a significant advantage in terms of experience and knowledge, which allowed them to develop more successful space programs. Additionally, both countries invested heavily in space exploration during the Cold War, which further advanced their programs._
+
+    - _In recent years, companies like SpaceX and CASC have dominated the space industry due to their focus on innovation, cost-cutting measures, and a willingness to take risks. SpaceX, for example, has been able to develop reusable rockets and spacecraft, which has drastically reduced the cost of launching payloads into space._
+    ''')
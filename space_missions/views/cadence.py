@@ -0,0 +1,60 @@
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from space_missions.cadence import FREQUENCIES, POINT_BUDGETS, cadence, load_daily_counts, window
+from space_missions.views import NO_DATA
+
+
+def cadence_figure(series, freq):
+    fig = go.Figure(go.Scatter(
+        x=series.index,
+        y=series.values,
+        mode='lines',
+        line=dict(width=1, color='#3c7ebf'),
+        hovertemplate='%{x|%a %b %d, %Y}<br>%{y} launches<extra></extra>'
+    ))
+    fig.update_layout(
+        title='Launches per %s' % ('day' if freq == 'D' else 'week'),
+        xaxis=dict(title=''),
+        yaxis=dict(
+            title='Launches',
+            showgrid=True,
+            gridcolor='#c0c0c0',
+            gridwidth=0.5
+        ),
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=450
+    )
+    return fig
+
+
+# dataset name -> figure of it, as the page draws it by default
+FIGURES = {
+    'cadence.daily': lambda data: cadence_figure(data.set_index('date')['launches'], 'D'),
+    'cadence.weekly': lambda data: cadence_figure(data.set_index('date')['launches'], 'W'),
+}
+
+
+def render(page, where=None):
+    st.title("📈" + page)
+    st.write('_Launch cadence at full date resolution. Long ranges are downsampled to the point budget with the Largest-Triangle-Three-Buckets method, which keeps peaks and quiet spells visible; narrowing the window re-aggregates it at full detail._')
+    daily = load_daily_counts(where=where)
+    if not len(daily):
+        st.info(NO_DATA)
+        return
+    first, last = daily.index[0].date(), daily.index[-1].date()
+
+    col1, col2 = st.columns(2)
+    with col1:
+        freq = st.radio('Resolution', list(FREQUENCIES), format_func=FREQUENCIES.get, horizontal=True)
+    with col2:
+        budget = st.select_slider('Point budget', options=POINT_BUDGETS, value=1000)
+    start, end = st.slider('Window', min_value=first, max_value=last, value=(first, last))
+
+    # not cached_figure: every window is a new figure, and building one from
+    # the cached daily counts takes milliseconds
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    series = cadence(daily, freq, start, end, budget)
+    st.plotly_chart(cadence_figure(series, freq), use_container_width=True)
+    st.caption('%d of %d points' % (len(series), len(window(daily, freq, start, end))))
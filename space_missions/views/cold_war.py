@@ -0,0 +1,163 @@
+import plotly.express as px
+import streamlit as st
+
+from space_missions.analytics.cold_war import (
+    companies_by_year_data,
+    failures_by_year_data,
+    launches_by_year_data,
+    launches_pie_data,
+)
+from space_missions.cube import load_cube
+from space_missions.filters import filter_key
+from space_missions.views import plot_chart
+
+
+def launches_pie_figure(ds):
+    colors = px.colors.qualitative.Dark24
+    title_font = dict(size=20, family='Arial')
+    fig = px.pie(ds, 
+                names='country', 
+                values='count', 
+                title='Number of Launches by Country',
+                hole=0.5, # Change hole size
+                color_discrete_sequence=colors, # Assign custom colors
+                labels={'country': 'Country', 'count': 'Number of Launches'}, # Rename labels
+                width=700, 
+                height=450)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(title_font=title_font)
+    return fig
+
+
+def launches_by_year_figure(ds):
+    colors = ['rgb(53, 83, 255)', 'rgb(255, 128, 0)']
+    fig = px.line(
+        ds, 
+        x="Year", 
+        y="Launches", 
+        color='Country', 
+        title='USA vs USSR: Launches Year by Year',
+        color_discrete_sequence=colors, # Set custom color palette
+        labels={'Year': 'Year', 'Launches': 'Number of Launches', 'Country': 'Country'}, # Rename labels
+        height=500, 
+        width=800
+    )
+    fig.update_xaxes(tickangle=45, tickfont=dict(size=10))
+    fig.update_layout(
+        legend=dict(
+            title=None,
+            orientation='h',
+            yanchor='top',
+            y=1.1,
+            xanchor='left',
+            x=0.15,
+            font=dict(size=12)
+        )
+    )
+    return fig
+
+
+def companies_by_year_figure(ds):
+    colors = ['rgb(53, 83, 255)', 'rgb(255, 128, 0)']
+    fig = px.bar(ds, 
+                x='Year', 
+                y='Companies', 
+                color='Country',
+                color_discrete_sequence=colors,
+                title='USA vs USSR: Number of Companies Year by Year',
+                labels={'Year': 'Year', 'Companies': 'Number of Companies', 'Country': 'Country'},
+                height=500, 
+                width=800)
+    fig.update_xaxes(tickangle=45, tickfont=dict(size=10))
+    fig.update_layout(
+        legend=dict(
+            title=None,
+            orientation='h',
+            yanchor='top',
+            y=1.1,
+            xanchor='left',
+            x=0.15,
+            font=dict(size=12)
+        ),
+        font=dict(size=14)
+    )
+    return fig
+
+
+def failures_by_year_figure(ds):
+    colors = ['rgb(53, 83, 255)', 'rgb(255, 128, 0)']
+    fig = px.line(
+        ds, 
+        x="Year", 
+        y="Failures", 
+        color='Country', 
+        title='USA vs USSR: Failures Year by Year',
+        color_discrete_sequence=colors, # Set custom color palette
+        labels={'Year': 'Year', 'Failures': 'Number of Failures', 'Country': 'Country'}, # Rename labels
+        height=500, 
+        width=800
+    )
+    fig.update_xaxes(tickangle=45, tickfont=dict(size=10))
+    fig.update_layout(
+        legend=dict(
+            title=None,
+            orientation='h',
+            yanchor='top',
+            y=1.1,
+            xanchor='left',
+            x=0.15,
+            font=dict(size=12)
+        )
+    )
+    return fig
+
+
+# dataset name -> figure of it, as the page draws it by default
+FIGURES = {
+    'coldwar.launches_pie': launches_pie_figure,
+    'coldwar.launches_by_year': launches_by_year_figure,
+    'coldwar.companies_by_year': companies_by_year_figure,
+    'coldwar.failures_by_year': failures_by_year_figure,
+}
+
+
+def render(page, where=None):
+    st.title("❄️" + page)
+    st.write(' _During the Cold War, the United States and the Soviet Union were engaged in intense competition across a wide range of areas, including space exploration. The Cold War between the United States and the Soviet Union had a significant impact on space exploration, driving a rapid advancement in space technology and an increase in space-related investments. Both countries saw space exploration as a way to demonstrate their technological and military superiority and to gain an advantage over the other._')
+    st.write('_Overall, the Cold War period saw a significant increase in the number of rockets launched and successful space missions by both the United States and the Soviet Union._ ')
+    state = filter_key(where)
+    cube = load_cube(where=where)
+    plot_chart('coldwar.launches_pie', lambda: launches_pie_data(cube), launches_pie_figure, filters=state)
+    st.write('- _The Cold War period saw a total of 2,332 successful space missions by both the United States and the Soviet Union. These missions included those related to satellite launches, human spaceflight, and planetary exploration._')
+
+    #----------------------------------------------------------------------------------------
+    plot_chart('coldwar.launches_by_year', lambda: launches_by_year_data(cube), launches_by_year_figure, filters=state)
+    st.markdown('''
+    ##### Insights
+
+    - _Between 1957 and 1991, the Soviet Union launched a total of 1770 rockets, including those for military and civilian purposes.The Soviet Union also had several successful missions to the Moon and developed a number of key space technologies, such as space stations and interplanetary probes._
+
+    - _Between 1958 and 2011, the United States launched a total of 1,736 rockets, including those for military and civilian purposes. The United States achieved several major milestones during the Cold War period, such as the successful landing of astronauts on the Moon and the development of the Space Shuttle program._
+    ''')
+
+    #------------------------------------------------------------------------------------------
+    plot_chart('coldwar.companies_by_year', lambda: companies_by_year_data(cube), companies_by_year_figure, filters=state)
+    st.markdown('''
+    ##### Insights
+
+    - _The fluctuations in the number of companies in both countries could also be due to changes in government policies or economic factors, which can have an impact on the funding and support available for space exploration._
+
+    - _The US has a strong history of investing in space exploration through NASA and private companies like SpaceX and Blue Origin. This has led to more companies involved in space exploration in the US than in other countries. However, changes in government policies and economic factors can impact the number of companies involved._
+
+    - _On the other hand, the number of companies involved in space exploration in the Soviet Union was more limited, with most space-related activities being controlled by the government. This could be a reason why the number of companies involved in space exploration in the Soviet Union did not increase as rapidly as in the US._
+    ''')
+
+    #-----------------------------------------------------------------------------------------
+    plot_chart('coldwar.failures_by_year', lambda: failures_by_year_data(cube), failures_by_year_figure, filters=state)
+    st.markdown('''
+    ##### Insights
+    ''')
+    st.write(''' _Overall, the higher success rate of the USSR's space program may have been due to a combination of factors-_''')
+    st.write("-  _The US was playing catch-up to the Soviet Union, which had achieved several milestones before the US, such as launching the first satellite (Sputnik) and sending the first human (Yuri Gagarin) into space. As a result, the US was under pressure to make rapid progress in space exploration, which led to some rushed and risky decisions._")
+    st.write("- _Secondly, the US was pushing the boundaries of technology and science in ways that had not been done before. This meant that there were more opportunities for things to go wrong._")
+    st.write("- _Thirdly, there were technical challenges with the early American rockets, particularly the early versions of the Saturn rockets, which were prone to failures._ ")
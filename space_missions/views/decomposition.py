@@ -0,0 +1,94 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from plotly.subplots import make_subplots
+
+from space_missions.data import current_source
+from space_missions.decomposition import FIT_ERRORS, FIT_TIMEOUT, FITS, ORDER, STEPS, load_monthly_counts, submit_fit
+from space_missions.figures import cached_figure
+from space_missions.filters import filter_key
+from space_missions.views import NO_DATA
+
+
+def components_figure(result):
+    fig = make_subplots(rows=4, cols=1, shared_xaxes=True,
+                        vertical_spacing=0.07, subplot_titles=("Observed", "Trend", "Seasonal", "Residual"),
+                        row_heights=[0.1, 0.1, 0.1, 0.1])
+    for i, trace_name in enumerate(['observed', 'trend', 'seasonal', 'resid']):
+        subplot = go.Scatter(x=result.index, y=result[trace_name].values, mode='lines', showlegend=False)
+        fig.add_trace(subplot, row=i+1, col=1)
+    fig.update_layout(
+        height=1300,
+        title=dict(text='Seasonal Decomposition of Time Series', font=dict(size=24, color='white')),
+        xaxis=dict(title='Date', showgrid=True, gridcolor='lightgray', gridwidth=0.1),
+        yaxis=dict(title='Value', showgrid=True, gridcolor='lightgray', gridwidth=0.1),
+        font=dict(family='Arial', size=16, color='white'),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+def forecast_figure(data):
+    fig = px.line(
+        data,
+        x="month",
+        y="launches",
+        color="kind",
+        title='Launches per month prediction'
+    )
+    return fig
+
+
+# dataset name -> figure of it, as the page draws it by default
+FIGURES = {
+    'decomposition.components': components_figure,
+    'decomposition.forecast': forecast_figure,
+}
+
+
+def render(page, where=None):
+    st.title("📉" + page)
+    st.write('_Launches per month split into a trend, a yearly seasonal pattern and what is left, followed by an ARIMA forecast of the coming months. The models are fitted in the background once per dataset and filter selection; the charts appear as their fits finish._')
+    state = filter_key(where)
+    monthly = load_monthly_counts(where=where)
+    if not len(monthly):
+        st.info(NO_DATA)
+        return
+    key = (current_source()[0], state)
+    jobs = {kind: submit_fit(kind, monthly, key) for kind in FITS}
+    builds = {
+        'decomposition': lambda result: cached_figure('decomposition.components', lambda: components_figure(result), filters=state),
+        'forecast': lambda result: cached_figure('decomposition.forecast', lambda: forecast_figure(result), filters=state),
+    }
+
+    slots = dict()
+    slots['decomposition'] = st.empty()
+    st.markdown('''
+             ### Simple ARIMA Model
+             _An ARIMA%s model of the monthly launch counts, forecast %d months ahead._
+             ''' % (ORDER, STEPS))
+    slots['forecast'] = st.empty()
+
+    # draw each fit as it finishes; until then its slot holds a placeholder
+    for kind, job in jobs.items():
+        if not job.done():
+            slots[kind].info('Fitting the %s model, this takes a few seconds the first time...' % kind)
+    pending = {job: kind for kind, job in jobs.items()}
+    deadline = time.monotonic() + FIT_TIMEOUT
+    while pending:
+        done, _ = wait(pending, timeout=max(deadline - time.monotonic(), 0), return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for job in done:
+            kind = pending.pop(job)
+            try:
+                slots[kind].plotly_chart(builds[kind](job.result()), use_container_width=True)
+            except FIT_ERRORS as e:
+                slots[kind].warning('No %s for this selection: %s' % (kind, e))
+    # a fit still running past the deadline is left to finish for a reload
+    for kind in pending.values():
+        slots[kind].warning('The %s model did not finish in %d seconds; reload the page to try again.' % (kind, FIT_TIMEOUT))
@@ -0,0 +1,90 @@
+import streamlit as st
+
+from space_missions.choropleth import METRICS, base_figure, color_by, load_country_status
+from space_missions.figures import cached_figure
+from space_missions.filters import filter_key
+from space_missions.sitemap import HEX_SIZES, hex_bins, load_site_table, site_deck
+from space_missions.sunburst import (
+    BUDGETS,
+    country_subtree,
+    load_sunburst,
+    load_sunburst_counts,
+    sunburst_figure,
+)
+from space_missions.views import NO_DATA, figure_of, plot_chart
+
+
+# dataset name -> figure of it, as the page draws it by default
+FIGURES = {
+    'geo.sunburst': sunburst_figure,
+    'geo.map': base_figure,
+}
+
+
+def render(page, where=None):
+    st.title("🗺️" + page)
+    st.write('_The sunburst chart visualizes the number of rockets launched by different companies in various countries, along with the mission status of each launch. The chart is divided into three concentric circles, with the innermost circle representing countries, the middle circle representing companies within each country, and the outer circle representing the mission status of each launch._')
+    state = filter_key(where)
+    counts = load_sunburst_counts(where=where)
+    col1, col2 = st.columns(2)
+    with col1:
+        top = st.select_slider('Companies per country', options=BUDGETS + ['All'], value=5)
+    with col2:
+        country = st.selectbox('Drill into a country', ['All countries'] + sorted(counts['country'].unique()))
+    if country == 'All countries':
+        budget = None if top == 'All' else top
+        plot_chart('geo.sunburst', lambda: load_sunburst(budget, where=where), sunburst_figure, top=top, filters=state)
+    else:
+        # only this country's subtree is built and sent, with all its companies
+        plot_chart(
+            'geo.sunburst_country',
+            lambda: country_subtree(counts, country),
+            lambda nodes: sunburst_figure(nodes, title='Sunburst chart for %s' % country),
+            country=country,
+            filters=state
+        )
+
+    st.markdown(''' 
+    ##### Insights
+      - _The disparity in the number of launches by the USSR and the US compared to other countries can be attributed to a combination of early development, budgetary constraints, technology transfer, and international cooperation. However, in recent years, other countries like China, India, and Japan have been investing heavily in their space programs and are catching up in terms of the number of launches and achievements in space exploration._
+    ''')
+
+
+    #--------------------------------------------------------------------------------------------     
+    table = load_country_status(where=where)
+    metric = st.radio('Color by', METRICS, horizontal=True)
+    spec = cached_figure('geo.map', lambda: figure_of(table, base_figure), filters=state)
+    if spec is None:
+        st.info(NO_DATA)
+    else:
+        st.plotly_chart(color_by(spec, table, metric), use_container_width=True)
+    st.markdown(''' 
+    ##### Insights
+    - _A world heat map that shows the number of space missions by country can provide valuable insights into the distribution of space exploration activity around the world.In this case, the map shows that the USSR and the US have had significantly more space missions than other countries.However, the map also shows that other countries like China, India, and Japan are becoming increasingly active in space exploration and are catching up to the US and the USSR in terms of the number of missions._
+
+    _The higher success rate of the USSR's space program may have been due to a combination of factors, including factors such as_
+
+    - _The Soviet Union's space program was often characterized by a focus on simplicity and reliability._
+
+    - _The Soviet Union was known for placing a high priority on the safety of its cosmonauts and spacecraft._
+
+    - _The Soviet Union invested heavily in its launch infrastructure, building a network of launch facilities and associated infrastructure that could support a wide range of missions._
+
+    ''')
+
+
+    #--------------------------------------------------------------------------------------------
+    st.subheader('Launch sites')
+    sites = load_site_table(where=where)
+    if not len(sites):
+        st.info(NO_DATA)
+        return
+    col1, col2 = st.columns(2)
+    with col1:
+        binning = st.radio('Show', ['Sites', 'Hexagons'], horizontal=True)
+    with col2:
+        size = st.select_slider('Hexagon size (degrees)', options=HEX_SIZES, value=5, disabled=binning == 'Sites')
+    # one point per site, or per hexagon, is all the browser receives
+    table = sites if binning == 'Sites' else hex_bins(sites, size)
+    st.pydeck_chart(site_deck(table))
+    st.caption('Circle area follows the number of launches, and hovering shows the counts; color goes from red to green with the success rate.')
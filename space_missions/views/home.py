@@ -0,0 +1,25 @@
+import streamlit as st
+from PIL import Image
+
+
+def render(page, where=None):
+    st.title("🏠" + page)
+    st.header(' **Data Analytics and Visualization Project** ')
+    st.write('')
+    st.write('')
+    st.write('')
+    image = Image.open("space_rocket.png")
+
+    col1,col2  = st.columns(2)
+    with col1:
+        st.markdown(''' 
+    #### Members
+    1. **Alex Tamboli** - 202011071
+    2. **Ashish Gupta** - 202011013
+    3. **Chinmay Bhalodia** - 202011016
+    4. **Nishesh Jain** - 202011050
+    5. **Prashant Kumar** - 202011058
+    ''')
+
+    with col2:
+        st.image(image)
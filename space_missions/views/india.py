@@ -0,0 +1,136 @@
+import plotly.express as px
+import streamlit as st
+
+from space_missions.analytics.india import launches_by_year_data, launches_pie_data, success_pct_data
+from space_missions.cube import load_cube
+from space_missions.filters import filter_key
+from space_missions.views import plot_chart
+
+
+def launches_pie_figure(ds):
+    colors = ['#1f77b4', '#ff7f0e']
+    title_font = dict(size=20, color='#444444', family='Arial')
+
+    fig = px.pie(ds, 
+                names='country', 
+                values='count', 
+                title='Number of Launches',
+                hole=0.5,
+                color_discrete_sequence=colors,
+                labels={'count': 'Number of Launches'},
+                width=700, 
+                height=500)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(title_font=dict(size=20, color='white', family='Arial'))
+    return fig
+
+
+def launches_by_year_figure(ds):
+    colors = ['rgb(255, 128, 0)', 'rgb(53, 83, 255)']
+    fig = px.line(
+        ds, 
+        x="year", 
+        y="Launches", 
+        color='country', 
+        title='USA vs India: Launches Year by Year',
+        color_discrete_sequence=colors, # Set custom color palette
+        labels={'year': 'Year', 'Launches': 'Number of Launches', 'country': 'Country'}, # Rename labels
+        height=500, 
+        width=800
+    )
+    fig.update_xaxes(tickfont=dict(size=10))
+    fig.update_layout(
+        legend=dict(
+            title=None,
+            orientation='h',
+            yanchor='top',
+            y=1.1,
+            xanchor='left',
+            x=0.75,
+            font=dict(size=14),
+            title_font=dict(size=20, color='white', family='Arial')
+        )
+    )
+    return fig
+
+
+def success_pct_figure(ds_mean):
+    fig = px.pie(ds_mean, 
+         values='Success_pct', 
+         names='country',
+         title='Mean Success Percentage for USA vs India',
+         color_discrete_sequence=['#1f77b4', '#ff7f0e'], 
+         hole=0.5,
+         labels={'country': 'Country', 'Success_pct': 'Mean Success Percentage'},
+         width=700, 
+         height=500)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(title_font=dict(size=20, color='white', family='Arial'))
+    return fig
+
+
+# dataset name -> figure of it, as the page draws it by default
+FIGURES = {
+    'india.launches_pie': launches_pie_figure,
+    'india.launches_by_year': launches_by_year_figure,
+    'india.success_pct': success_pct_figure,
+}
+
+
+def render(page, where=None):
+    st.title("" + page)
+    st.markdown('''
+
+    - _India and the United States have different histories and circumstances that have impacted their respective space exploration programs. The US has been a pioneer in space exploration, with NASA being established in 1958 and playing a significant role in space exploration since then._
+
+    - _In contrast, India's space program started much later, with the establishment of the Indian Space Research Organisation (ISRO) in 1969. ISRO has faced challenges due to limited funding, technology, and infrastructure, which have hindered its progress in space exploration compared to the US._
+
+    ''')
+
+    state = filter_key(where)
+    cube = load_cube(where=where)
+    plot_chart('india.launches_pie', lambda: launches_pie_data(cube), launches_pie_figure, filters=state)
+
+    #-----------------------------------------------------------------------------------
+    plot_chart('india.launches_by_year', lambda: launches_by_year_data(cube), launches_by_year_figure, filters=state)
+    st.markdown('''
+    ##### Insights
+
+    -  _India, on the other hand, has faced political and economic instability, which has affected its ability to invest in space exploration._
+
+    - _Additionally, the geographic location of the two countries also plays a role. The US has easy access to space, with the presence of several launch sites. In contrast, India's location farther from the equator and lack of launch sites has made it more challenging to launch and access space._
+    ''')
+
+    #-----------------------------------------------------------------------------------------
+    plot_chart('india.success_pct', lambda: success_pct_data(cube), success_pct_figure, filters=state)
+    st.markdown('''
+    ##### Insights
+
+    -  _India has a higher failure rate than the United States when it comes to space missions. This can be attributed to several factors, including the fact that India is still relatively new to the field of space exploration and is still developing its capabilities in this area._
+
+    - _Additionally, India operates on a much smaller budget than the United States, which can impact the quality and reliability of its space missions._
+
+    - _India's space exploration program has faced numerous political and geographic challenges over the years. For example, India has faced sanctions from other countries due to its nuclear program, which has impacted its ability to access certain technologies and resources needed for space exploration._
+    ''')
+
+    #---------------------------------------------------------------------------------------
+    # trace1 = go.Scatter(
+    #     x=ds_f[ds_f['country'] == 'USA']['year'],
+    #     y=ds_f[ds_f['country'] == 'USA']['Success_pct'],
+    #     name='USA',
+    #     line=dict(color='#1f77b4', width=2)
+    # )
+    # trace2 = go.Scatter(
+    #     x=ds_f[ds_f['country'] == 'India']['year'],
+    #     y=ds_f[ds_f['country'] == 'India']['Success_pct'],
+    #     name='India',
+    #     line=dict(color='#ff7f0e', width=2)
+    # )
+    # data = [trace1, trace2]
+    # layout = go.Layout(
+    #     title='Success Percentage by Year and Country',
+    #     xaxis=dict(title='Year'),
+    #     yaxis=dict(title='Success Percentage')
+    # )
+    # fig = go.Figure(data=data, layout=layout)
+    # st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,16 @@
+import streamlit as st
+
+
+def render(page, where=None):
+    url1 = "https://www.arianespace.com/press-release/ariane-5-successful-launch-webb-space-telescope/ "
+    url2 = "https://chinapower.csis.org/china-space-launch/"
+    url3 = "https://escholarship.org/content/qt0kj1q52j/qt0kj1q52j_noSplash_c9b2ab6f54dac13b34007979f3a8dd95.pdf?t=prfwji"
+    url4 = "https://www.forbes.com/sites/startswithabang/2019/07/11/this-is-why-the-soviet-union-lost-the-space-race-to-the-usa/?sh=61cad0141925 "
+    url5 = "https://www.nasa.gov/sites/default/files/files/SEINSI.pdf"
+
+    st.markdown('''# Reference''')
+    st.write(" - Arianespace Successful Launch[link](%s)" % url1 )
+    st.write(" - China space launch [link](%s)" % url2 )
+    st.write(" - Soviet union lost the space race [link](%s)" % url3 )
+    st.write(" - The post Cold War issues [link](%s)" % url4 )
+    st.write(" - Nasa Website [link](%s)" % url5 )
@@ -0,0 +1,75 @@
+import plotly.express as px
+import streamlit as st
+
+from space_missions.analytics.rockets import families_data, family_years_data, variants_data
+from space_missions.filters import filter_key
+from space_missions.rockets import family_launches, load_rocket_cube
+from space_missions.views import plot_chart
+
+
+def families_figure(data):
+    fig = px.bar(
+        data,
+        x='family',
+        y='launches',
+        color='success_rate',
+        hover_data=['variants', 'first_year', 'last_year', 'cost_mean'],
+        title='Most launched rocket families',
+        color_continuous_scale=px.colors.sequential.RdBu,
+        range_color=(0, 1)
+    )
+    fig.update_layout(coloraxis_colorbar=dict(title='Success rate'))
+    return fig
+
+
+def family_years_figure(data):
+    fig = px.line(
+        data,
+        x='year',
+        y='launches',
+        color='family',
+        title='Launches per year of the leading families'
+    )
+    return fig
+
+
+def variants_figure(data):
+    fig = px.bar(
+        data,
+        x='variant',
+        y='launches',
+        color='success_rate',
+        hover_data=['first_year', 'last_year', 'cost_mean'],
+        title='Variants of %s' % (data['family'].iloc[0] if len(data) else 'the family'),
+        color_continuous_scale=px.colors.sequential.RdBu,
+        range_color=(0, 1)
+    )
+    fig.update_layout(coloraxis_colorbar=dict(title='Success rate'))
+    return fig
+
+
+# dataset name -> figure of it, as the page draws it by default
+FIGURES = {
+    'rockets.families': families_figure,
+    'rockets.family_years': family_years_figure,
+    'rockets.variants': variants_figure,
+}
+
+
+def render(page, where=None):
+    st.title("🚀" + page)
+    st.write('_Rocket families and variants as named in each launch\'s Detail, e.g. "Falcon 9 Block 5 | Starlink V1 L9 & BlackSky" is a Falcon 9 Block 5 of the Falcon family, carrying Starlink V1 L9 and BlackSky._')
+    state = filter_key(where)
+    rockets = load_rocket_cube(where=where)
+    plot_chart('rockets.families', lambda: families_data(rockets), families_figure, filters=state)
+    plot_chart('rockets.family_years', lambda: family_years_data(rockets), family_years_figure, filters=state)
+
+    #-----------------------------------------------------------------------------------------
+    families = families_data(rockets, top=None)['family'].tolist()
+    if not families:
+        return
+    family = st.selectbox('Family', families)
+    plot_chart('rockets.variants', lambda: variants_data(rockets, family), variants_figure, family=family, filters=state)
+    launches = family_launches(family, where=where)
+    st.write('%d launches of the %s family' % (len(launches), family))
+    st.dataframe(launches, use_container_width=True)
@@ -0,0 +1,38 @@
+import streamlit as st
+
+from space_missions.filters import VALUE_COLUMNS, count_launches, load_filter_options
+
+
+LABELS = {
+    'country': 'Countries',
+    'Company Name': 'Companies',
+    'Status Mission': 'Mission status',
+    'Status Rocket': 'Rocket status',
+}
+
+
+def filter_sidebar():
+    # (where, number of matching launches). Only narrowed filters go into
+    # where, so the full selection shares the unfiltered caches. The values are
+    # kept in session state as well: Streamlit forgets a widget's value on a
+    # run that does not draw it, e.g. on the Home page.
+    options = load_filter_options()
+    saved = st.session_state.get('filters', {})
+    st.subheader('Filters')
+
+    where = {}
+    first, last = options['year']
+    lo, hi = saved.get('year', (first, last))
+    years = st.slider('Years', min_value=first, max_value=last, value=(max(lo, first), min(hi, last)))
+    if years != (first, last):
+        where['year'] = years
+    for col in VALUE_COLUMNS:
+        default = [v for v in saved.get(col, []) if v in options[col]]
+        values = st.multiselect(LABELS[col], options[col], default=default)
+        if values:
+            where[col] = values
+    st.session_state['filters'] = where
+
+    matched = count_launches(where)
+    st.caption('%d launches match' % matched)
+    return where, matched
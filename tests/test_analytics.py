@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from space_missions import analytics
+from space_missions.__main__ import main
+
+
+NOTHING = {'country': ['Nowhere']}
+
+
+@pytest.mark.parametrize('name', list(analytics.datasets()))
+def test_no_match_gives_an_empty_dataset(name, tmp_path):
+    df = analytics.dataset(name, where=NOTHING)
+    assert isinstance(df, pd.DataFrame)
+    assert len(df) == 0
+    for fmt in analytics.FORMATS:
+        analytics.write(df, str(tmp_path / ('%s.%s' % (name, fmt))))
+
+
+def test_unknown_parameters_are_rejected():
+    with pytest.raises(TypeError):
+        analytics.dataset('best.countries', kk=3)
+
+
+@pytest.mark.parametrize('argv', [
+    ['show', 'best.countries', '--param', 'kk=3'],
+    ['export', 'cadence.daily', '--param', 'k=3'],
+    ['show', 'best.countries', '--param', 'k=abc'],
+    ['show', 'cadence.daily', '--param', 'budget=None'],
+    ['export', 'best.countries', 'rockets.families', '--param', 'k=1.5'],
+])
+def test_command_line_rejects_unknown_parameters_and_bad_values(argv, monkeypatch, capsys):
+    monkeypatch.setattr('sys.argv', ['space-missions'] + argv)
+    with pytest.raises(SystemExit) as raised:
+        main()
+    assert raised.value.code == 2
+    assert argv[-1].split('=')[0] in capsys.readouterr().err
+
+
+def test_show_takes_a_known_parameter(monkeypatch, capsys):
+    monkeypatch.setattr('sys.argv', ['space-missions', 'show', 'best.countries', '--param', 'k=2', '--years', '1990', '1990'])
+    main()
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+
+
+def test_show_takes_none_where_it_means_no_limit(monkeypatch, capsys):
+    monkeypatch.setattr('sys.argv', ['space-missions', 'show', 'rockets.families', '--param', 'top=None'])
+    main()
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) - 1 == len(analytics.dataset('rockets.families', top=None)) > 20
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from space_missions.cadence import cadence, daily_counts, lttb, window
+
+
+def launch_dates(*dates):
+    return pd.Series(pd.to_datetime(list(dates), utc=True), dtype='datetime64[ns, UTC]')
+
+
+def test_daily_counts_fill_the_days_between_launches():
+    daily = daily_counts(launch_dates('2020-01-01 10:00', '2020-01-01 23:00', '2020-01-04'))
+    assert daily.tolist() == [2, 0, 0, 1]
+    assert daily.index[0] == pd.Timestamp('2020-01-01')
+    assert daily.index.freq == 'D'
+
+
+def test_no_launches_give_an_empty_daily_series():
+    daily = daily_counts(launch_dates())
+    assert len(daily) == 0
+    assert daily.dtype == 'int64'
+    assert daily.index.name == 'date'
+    assert daily.index.freq == 'D'
+    for freq in ['D', 'W']:
+        assert len(window(daily, freq, '1960-01-01', '1970-12-31')) == 0
+        assert len(cadence(daily, freq, budget=250)) == 0
+    assert len(lttb(daily, 250)) == 0
+
+
+def test_lttb_keeps_the_ends_and_the_budget():
+    days = pd.date_range('2020-01-01', periods=1000, freq='D')
+    series = pd.Series(np.random.default_rng(0).integers(0, 5, 1000), index=days)
+    keep = lttb(series, 100)
+    assert len(keep) == 100
+    assert keep[0] == 0 and keep[-1] == 999
+    assert (np.diff(keep) > 0).all()
+
+
+def test_chunked_mode_without_chunks_gives_an_empty_daily_series(monkeypatch, tmp_path):
+    from space_missions.cadence import load_daily_counts
+    from space_missions.data import read_raw
+
+    monkeypatch.setenv('SPACE_MISSIONS_INGEST', 'chunked')
+    monkeypatch.setattr('space_missions.stream.iter_launches', lambda *args, **kwargs: iter(()))
+    # a source of its own, so nothing cached for the dataset is reused
+    path = str(tmp_path / 'launches.csv')
+    read_raw().head(0).to_csv(path, index=False)
+    daily = load_daily_counts(path, str(tmp_path))
+    assert len(daily) == 0
+    assert daily.dtype == 'int64'
+    assert isinstance(daily.index, pd.DatetimeIndex)
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from space_missions.companies import build_company_profile, merge_company_profiles
+from space_missions.cube import build_cube
+from space_missions.data import clean_launches, read_raw
+
+
+def test_cost_mean_of_known_costs_only():
+    dates = pd.to_datetime(['2019-01-05', '2020-03-01', '2020-06-01', '2018-02-01'], utc=True)
+    df = pd.DataFrame({
+        'Company Name': ['A', 'A', 'A', 'B'],
+        'date': dates,
+        'year': dates.year.astype('int16'),
+        'Status Mission': ['Success', 'Failure', 'Success', 'Success'],
+        'Rocket': [50e6, np.nan, 0.0, np.nan],
+    })
+    profile = build_company_profile(df)
+    assert profile.loc['A', 'costed'] == 2
+    assert profile.loc['A', 'cost_mean'] == 25e6
+    # no known cost: no mean, rather than a free launch or a division by zero
+    assert profile.loc['B', 'costed'] == 0
+    assert np.isnan(profile.loc['B', 'cost_mean'])
+    assert profile['failures'].tolist() == [1, 0]
+    assert profile['active_years'].tolist() == [2, 1]
+    assert profile['years_since_last'].tolist() == [0, 2]
+
+
+def test_merged_profiles_match_a_rebuild():
+    launches = clean_launches(read_raw())
+    newer = (launches['date'] >= pd.Timestamp('2019-01-01', tz='UTC')).to_numpy()
+    merged = merge_company_profiles(
+        build_company_profile(launches[~newer]), build_company_profile(launches[newer]), build_cube(launches)
+    )
+    pd.testing.assert_frame_equal(merged, build_company_profile(launches))
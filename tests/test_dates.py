@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+from space_missions.data import clean_launches, read_raw
+from space_missions.dates import parse_launch_dates
+
+
+def test_both_formats():
+    datum = pd.Series(['Fri Aug 07, 2020 05:12 UTC', 'Thu Aug 29, 2019', 'Fri Aug 07, 2020 05:12 UTC'], index=[5, 6, 7])
+    dates, unparsed = parse_launch_dates(datum)
+    assert dates.tolist() == [
+        pd.Timestamp('2020-08-07 05:12', tz='UTC'),
+        pd.Timestamp('2019-08-29', tz='UTC'),
+        pd.Timestamp('2020-08-07 05:12', tz='UTC'),
+    ]
+    assert dates.index.tolist() == [5, 6, 7]
+    assert str(dates.dtype) == 'datetime64[ns, UTC]'
+    assert not len(unparsed)
+
+
+def test_unparsed_strings_are_returned():
+    datum = pd.Series(['Thu Aug 29, 2019', '2019-08-29', 'Aug 2019'])
+    dates, unparsed = parse_launch_dates(datum)
+    assert dates.isna().tolist() == [False, True, True]
+    assert unparsed.to_dict() == {1: '2019-08-29', 2: 'Aug 2019'}
+
+
+def test_clean_launches_rejects_an_unparsed_row():
+    raw = read_raw().head(5)
+    raw.loc[3, 'Datum'] = 'sometime in 2020'
+    with pytest.raises(ValueError, match="1 launch dates could not be parsed, e.g. rows \\[3\\]"):
+        clean_launches(raw)
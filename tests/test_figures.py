@@ -0,0 +1,23 @@
+import plotly.graph_objects as go
+
+from space_missions import figures
+
+
+def test_figure_cache_keeps_the_most_recently_used(monkeypatch):
+    monkeypatch.setattr(figures, 'MAX_ENTRIES', 3)
+    figures.clear_figures()
+    builds = []
+
+    def build(k):
+        builds.append(k)
+        return go.Figure(go.Bar(x=[k], y=[k]))
+
+    for k in range(3):
+        figures.cached_figure('chart', lambda: build(k), version='v', k=k)
+    figures.cached_figure('chart', lambda: build(0), version='v', k=0)
+    figures.cached_figure('chart', lambda: build(3), version='v', k=3)
+    # k=1 was the least recently used, so it is the one dropped
+    assert [key[2] for key in figures._figures] == [(('k', 2),), (('k', 0),), (('k', 3),)]
+    figures.cached_figure('chart', lambda: build(2), version='v', k=2)
+    assert builds == [0, 1, 2, 3]
+    figures.clear_figures()
@@ -0,0 +1,101 @@
+# The bitmap selection of space_missions.filters against one boolean mask per
+# condition over the launch columns, and the LRU of filter states.
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+from space_missions import filters
+from space_missions.data import clean_launches, load_launches, read_raw
+from space_missions.filters import FILTER_COLUMNS, build_index, cached_for, filtered_rows, select_rows
+
+
+WHERES = {
+    'years': {'year': (1970, 1991)},
+    'from a year': {'year': (2010, None)},
+    'up to a year': {'year': (None, 1960)},
+    'countries': {'country': ['USA', 'China', 'India']},
+    'cold war': {'year': (None, 1991), 'country': ['USA', 'Kazakhstan', 'Russian Federation']},
+    'all five': {
+        'year': (1990, 2020),
+        'country': ['USA', 'China', 'France'],
+        'Company Name': ['SpaceX', 'CASC', 'Arianespace', 'ULA'],
+        'Status Mission': ['Success', 'Partial Failure'],
+        'Status Rocket': ['StatusActive'],
+    },
+    'some values unknown': {'country': ['USA', 'Nowhere'], 'Status Mission': ['Failure']},
+    'no such value': {'country': ['Nowhere']},
+    'no such year': {'year': (3000, 3100), 'country': ['USA']},
+    'empty lists': {'country': [], 'Company Name': []},
+}
+
+
+def mask_rows(df, where):
+    # the same selection with one boolean mask per condition
+    mask = np.ones(len(df), dtype=bool)
+    for col, cond in where.items():
+        if col == 'year':
+            lo, hi = cond
+            if lo is not None:
+                mask &= (df['year'] >= lo).to_numpy()
+            if hi is not None:
+                mask &= (df['year'] <= hi).to_numpy()
+        elif cond:
+            mask &= df[col].isin(cond).to_numpy()
+    return np.flatnonzero(mask)
+
+
+@pytest.fixture(scope='module')
+def launches():
+    return clean_launches(read_raw())[FILTER_COLUMNS]
+
+
+@pytest.mark.parametrize('name', list(WHERES))
+def test_bitmaps_match_masks(name, launches):
+    where = WHERES[name]
+    expected = mask_rows(launches, where)
+    assert np.array_equal(select_rows(build_index(launches), where), expected)
+    # value columns of plain strings are factorized instead
+    plain = launches.astype({col: object for col in FILTER_COLUMNS[1:]})
+    assert np.array_equal(select_rows(build_index(plain), where), expected)
+
+
+@pytest.mark.parametrize('name', list(WHERES))
+def test_filtered_rows_match_masks(name):
+    df = load_launches(FILTER_COLUMNS)
+    rows = filtered_rows(WHERES[name])
+    # None when where filters nothing
+    assert np.array_equal(np.arange(len(df)) if rows is None else rows, mask_rows(df, WHERES[name]))
+
+
+def test_no_filter_selects_every_row(launches):
+    assert filtered_rows(None) is None
+    assert filtered_rows({'year': (None, None), 'country': []}) is None
+    assert np.array_equal(select_rows(build_index(launches), {}), np.arange(len(launches)))
+
+
+def test_cached_for_drops_the_least_recently_used(monkeypatch):
+    monkeypatch.setattr(filters, '_states', OrderedDict())
+    monkeypatch.setattr(filters, 'MAX_ENTRIES', 2)
+    source = ('launches.csv', 1, 1)
+    builds = []
+
+    def get(country):
+        return cached_for(source, 'rows', {'country': [country]}, lambda: builds.append(country) or country)
+
+    assert [get('USA'), get('China'), get('USA'), get('India')] == ['USA', 'China', 'USA', 'India']
+    assert builds == ['USA', 'China', 'India']
+    # China was used least recently, so it is built again
+    get('USA')
+    get('China')
+    assert builds == ['USA', 'China', 'India', 'China']
+    assert len(filters._states) == 2
+
+
+def test_cached_for_drops_older_versions_of_a_source(monkeypatch):
+    monkeypatch.setattr(filters, '_states', OrderedDict())
+    where = {'country': ['USA']}
+    cached_for(('launches.csv', 1, 1), 'rows', where, lambda: 'old')
+    cached_for(('other.csv', 1, 1), 'rows', where, lambda: 'other')
+    assert cached_for(('launches.csv', 2, 2), 'rows', where, lambda: 'new') == 'new'
+    assert [key[0] for key in filters._states] == [('other.csv', 1, 1), ('launches.csv', 2, 2)]
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from space_missions.forecasting import BASELINE_MONTHS, MIN_ACTIVE_MONTHS, MIN_MONTHS, fit_series, forecast_entities
+
+
+def busy_series(months=72):
+    return np.random.default_rng(0).poisson(6, months)
+
+
+def test_short_series_get_the_baseline():
+    values = np.arange(MIN_MONTHS - 1)
+    result = fit_series(values, (2, 1, 1), 4, 5.0)
+    assert (result['model'], result['reason']) == ('baseline', 'short')
+    assert result['forecast'] == [float(np.mean(values[-BASELINE_MONTHS:]))] * 4
+
+
+def test_sparse_series_get_the_baseline():
+    values = np.zeros(MIN_MONTHS * 2)
+    values[::7] = 3
+    assert np.count_nonzero(values) < MIN_ACTIVE_MONTHS
+    result = fit_series(values, (2, 1, 1), 4, 5.0)
+    assert (result['model'], result['reason']) == ('baseline', 'sparse')
+
+
+def test_fit_and_timeout():
+    values = busy_series()
+    result = fit_series(values, (2, 1, 1), 4, 30.0)
+    assert result['model'] == 'arima'
+    assert len(result['forecast']) == 4
+    assert min(result['forecast']) >= 0
+    result = fit_series(values, (2, 1, 1), 4, 0.0)
+    assert (result['model'], result['reason']) == ('baseline', 'timeout')
+
+
+def test_results_are_reused_from_disk(tmp_path):
+    start = pd.Period('2010-01', freq='M')
+    series = {'country:A': (start, busy_series()), 'country:B': (start, np.ones(12, dtype='int64'))}
+    forecasts, fits = forecast_entities(series, steps=4, workers=1, directory=str(tmp_path))
+    assert fits['cached'].tolist() == [False, False]
+    assert len(list(tmp_path.iterdir())) == 2
+
+    again, fits = forecast_entities(series, steps=4, workers=1, directory=str(tmp_path))
+    assert fits['cached'].tolist() == [True, True]
+    pd.testing.assert_frame_equal(again, forecasts)
+
+    # a changed history is fitted again; a fit out of time is not stored
+    series['country:A'] = (start, busy_series(73))
+    _, fits = forecast_entities(series, steps=4, budget=0.0, workers=1, directory=str(tmp_path))
+    assert fits['cached'].tolist() == [False, True]
+    assert fits['reason'].tolist() == ['timeout', 'short']
+    assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,71 @@
+# LaunchState.append against a full rebuild: the dataset is split at a date,
+# built from the older launches, and the newer ones appended along with rows
+# re-sent from the older part.
+import pandas as pd
+import pytest
+
+from space_missions.companies import build_company_profile
+from space_missions.cube import build_cube
+from space_missions.data import RAW_COLUMNS, clean_launches, read_raw
+from space_missions.dates import parse_launch_dates
+from space_missions.ingest import LAUNCH_KEY, LaunchState
+from space_missions.sketches import BOX, build_cost_sketches, cost_quantiles
+
+
+SPLIT = '2019-01-01'
+
+
+@pytest.fixture(scope='module')
+def split():
+    raw = read_raw().set_axis(RAW_COLUMNS, axis=1)
+    dates, _ = parse_launch_dates(raw['Datum'])
+    newer = (dates >= pd.Timestamp(SPLIT, tz='UTC')).to_numpy()
+    return raw, raw[~newer], raw[newer]
+
+
+def by_key(df):
+    # launches in key order with plain values, as row numbers and categories
+    # differ between an appended table and a rebuilt one
+    df = df.astype({c: object for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)})
+    return df.sort_values(LAUNCH_KEY + ['date']).reset_index(drop=True)
+
+
+def test_append_matches_full_rebuild(split):
+    raw, old, new = split
+    resent = old.sample(20, random_state=0)
+    state = LaunchState(clean_launches(old.copy()))
+    report, accepted = state.append(pd.concat([new, resent]))
+    assert report == {'added': len(new), 'duplicates': 20, 'stale': 0}
+    assert len(accepted) == len(new)
+
+    launches = clean_launches(raw.copy())
+    pd.testing.assert_frame_equal(by_key(state.launches), by_key(launches))
+    pd.testing.assert_frame_equal(state.cube, build_cube(launches))
+    pd.testing.assert_frame_equal(state.profile, build_company_profile(launches))
+    costs = build_cost_sketches(launches)
+    pd.testing.assert_frame_equal(state.costs, costs)
+    for by in [['year'], ['Company Name'], ['country']]:
+        pd.testing.assert_frame_equal(cost_quantiles(state.costs, by, BOX), cost_quantiles(costs, by, BOX))
+    assert state.high_water == launches['date'].max()
+
+
+def test_append_in_pieces_matches_one_append(split):
+    _, old, new = split
+    whole = LaunchState(clean_launches(old.copy()))
+    whole.append(new)
+    pieces = LaunchState(clean_launches(old.copy()))
+    for lo in range(0, len(new), 50):
+        pieces.append(new.iloc[lo:lo + 50])
+    pd.testing.assert_frame_equal(pieces.cube, whole.cube)
+    pd.testing.assert_frame_equal(pieces.profile, whole.profile)
+    pd.testing.assert_frame_equal(pieces.costs, whole.costs)
+
+
+def test_rows_not_newer_than_high_water_are_stale(split):
+    _, old, new = split
+    state = LaunchState(clean_launches(old.copy()))
+    report, accepted = state.append(pd.concat([old.tail(5), new.head(3)]), after_high_water=True)
+    assert report == {'added': 3, 'duplicates': 0, 'stale': 5}
+    report, accepted = state.append(new.head(3))
+    assert report == {'added': 0, 'duplicates': 3, 'stale': 0}
+    assert not len(accepted)
@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from space_missions.locations import add_location_parts, resolve_location, resolve_locations
+
+
+@pytest.mark.parametrize('location, resolved', [
+    ('LC-39A, Kennedy Space Center, Florida, USA',
+     ('LC-39A, Kennedy Space Center, Florida', 'USA', 'USA', 'Kennedy Space Center')),
+    ('Sohae Satellite Launching Station, North Korea',
+     ('Sohae Satellite Launching Station', 'North Korea', 'PRK', 'Sohae Satellite Launching Station')),
+    ('Naro Space Center, South Korea', ('Naro Space Center', 'South Korea', 'KOR', 'Naro Space Center')),
+    ('Launch Plateform, Shahrud Missile Test Site', ('Launch Plateform', 'Iran', 'IRN', 'Shahrud Missile Test Site')),
+    ('Tai Rui Barge, Yellow Sea', ('Tai Rui Barge', 'China', 'CHN', 'Yellow Sea')),
+    ('Somewhere, Atlantis', ('Somewhere', 'Atlantis', None, None)),
+])
+def test_resolve_location(location, resolved):
+    assert resolve_location(location) == resolved
+
+
+def test_resolve_locations_per_row():
+    location = pd.Series(['Naro Space Center, South Korea', 'Somewhere, Atlantis', 'Naro Space Center, South Korea'])
+    frame, unresolved, unplaced = resolve_locations(location)
+    assert frame['country'].tolist() == ['South Korea', 'Atlantis', 'South Korea']
+    assert frame['alpha3'].tolist()[::2] == ['KOR', 'KOR']
+    assert frame['alpha3'].isna().tolist() == [False, True, False]
+    assert unresolved == unplaced == ['Somewhere, Atlantis']
+
+
+def test_unplaced_locations_are_warned_about():
+    df = pd.DataFrame({'Location': ['Naro Space Center, South Korea', 'Pad 1, Kennedy Space Center, Florida, Atlantis']})
+    with pytest.warns(UserWarning) as warned:
+        df = add_location_parts(df)
+    messages = [str(w.message) for w in warned]
+    assert any(m.startswith('no ISO-3166 code for 1 launch locations') for m in messages)
+    assert not any(m.startswith('no known launch site') for m in messages)
+    assert df['launch_site'].tolist() == ['Naro Space Center', 'Kennedy Space Center']
+
+    with pytest.warns(UserWarning, match="no known launch site for 1 launch locations.*Nowhere Pad, USA"):
+        add_location_parts(pd.DataFrame({'Location': ['Nowhere Pad, USA']}))
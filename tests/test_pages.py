@@ -0,0 +1,60 @@
+# Every page rendered outside a streamlit server, where its st calls draw
+# nothing, under sidebar selections that leave some or all charts no data.
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+import streamlit as st
+
+from space_missions.decomposition import FITS
+from space_missions.navigation import PAGES, render_page
+
+
+WHERES = [
+    None,
+    {'year': (2000, 2020)},
+    {'country': ['India']},
+    {'Status Mission': ['Failure']},
+    {'country': ['Brazil'], 'Status Mission': ['Success']},
+]
+
+
+def fit_here(kind, monthly, key):
+    # the fit run in this process rather than the worker pool
+    job = Future()
+    job.set_result(FITS[kind](monthly))
+    return job
+
+
+@pytest.fixture(autouse=True)
+def bare_streamlit(monkeypatch):
+    monkeypatch.setattr(st, 'slider', lambda label, min_value=None, max_value=None, value=None, **kw: value)
+    monkeypatch.setattr('space_missions.views.decomposition.submit_fit', fit_here)
+
+
+@pytest.mark.parametrize('where', WHERES, ids=str)
+@pytest.mark.parametrize('page', [page for page, _ in PAGES])
+def test_page_renders(page, where):
+    render_page(page, where)
+
+
+class Slot:
+    # an st.empty() that records what is drawn in it
+    def __init__(self, drawn):
+        self.drawn = drawn
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.drawn.append(name)
+
+
+def test_failed_and_hung_fits_leave_a_warning(monkeypatch):
+    failed = Future()
+    failed.set_exception(np.linalg.LinAlgError('Schur decomposition solver error.'))
+    hung = Future()
+    jobs = {'decomposition': failed, 'forecast': hung}
+    drawn = []
+    monkeypatch.setattr('space_missions.views.decomposition.submit_fit', lambda kind, monthly, key: jobs[kind])
+    monkeypatch.setattr('space_missions.views.decomposition.FIT_TIMEOUT', 0.1)
+    monkeypatch.setattr(st, 'empty', lambda: Slot(drawn))
+    render_page('Time Series Decomposition')
+    assert drawn == ['info', 'warning', 'warning']
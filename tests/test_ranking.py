@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from space_missions.ranking import top_k_per_group
+
+
+@pytest.fixture
+def df():
+    # in 2001 B and C tie for first, behind them D and E tie for third
+    return pd.DataFrame({
+        'year': [2000, 2000, 2000, 2001, 2001, 2001, 2001],
+        'name': ['A', 'B', 'C', 'C', 'B', 'E', 'D'],
+        'launches': [5, 9, 7, 4, 4, 1, 1],
+    })
+
+
+def test_first(df):
+    top = top_k_per_group(df, 'year', 'launches', k=2)
+    assert top[['year', 'name', 'rank']].values.tolist() == [
+        [2000, 'B', 1], [2000, 'C', 2], [2001, 'C', 1], [2001, 'B', 2],
+    ]
+
+
+def test_label(df):
+    top = top_k_per_group(df, 'year', 'launches', k=3, ties='label', label='name')
+    assert top['name'].tolist() == ['B', 'C', 'A', 'B', 'C', 'D']
+    assert top['rank'].tolist() == [1, 2, 3, 1, 2, 3]
+
+
+def test_all(df):
+    top = top_k_per_group(df, ['year'], 'launches', k=3, ties='all')
+    assert top[top['year'] == 2001][['name', 'rank']].values.tolist() == [['C', 1], ['B', 1], ['E', 3], ['D', 3]]
+    assert top_k_per_group(df, 'year', 'launches', k=1, ties='all')['name'].tolist() == ['B', 'C', 'B']
+
+
+def test_bad_ties(df):
+    with pytest.raises(ValueError):
+        top_k_per_group(df, 'year', 'launches', ties='dense')
+    with pytest.raises(ValueError):
+        top_k_per_group(df, 'year', 'launches', ties='label')
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from space_missions.analytics.rockets import families_data, family_years_data, variants_data
+from space_missions.rockets import DIMENSIONS, MEASURES, build_rocket_cube, build_rocket_index, merge_rocket_cubes, parse_details
+
+
+def test_parse_details():
+    parsed = parse_details(['Falcon 9 Block 5 | Starlink V1 L9 & BlackSky', 'H-IIA 202 | Michibiki 3'])
+    assert parsed['family'].tolist() == ['Falcon', 'H-II']
+    assert parsed['variant'].tolist() == ['Falcon 9 Block 5', 'H-IIA 202']
+    assert parsed['payloads'].tolist() == [['Starlink V1 L9', 'BlackSky'], ['Michibiki 3']]
+
+
+def test_merged_cubes_match_one_cube():
+    df = pd.DataFrame({
+        'Detail': ['Soyuz 2.1a | A', 'Falcon 9 | B', 'Soyuz U | C', 'Soyuz 2.1a | D'],
+        'year': pd.Series([2000, 2000, 2001, 2001], dtype='int16'),
+        'Status Mission': ['Success', 'Failure', 'Success', 'Success'],
+        'Rocket': pd.Series([10.0, None, None, 12.5], dtype='Float32'),
+    })
+    whole = build_rocket_cube(df, build_rocket_index(df['Detail']))
+    parts = [build_rocket_cube(part, build_rocket_index(part['Detail'])) for part in (df.iloc[:2], df.iloc[2:])]
+    pd.testing.assert_frame_equal(merge_rocket_cubes(*parts), merge_rocket_cubes(whole))
+
+
+def test_no_cubes_merge_to_an_empty_one():
+    cube = merge_rocket_cubes()
+    assert cube.columns.tolist() == DIMENSIONS + MEASURES
+    assert len(cube) == 0
+    assert len(families_data(cube)) == 0
+    assert len(family_years_data(cube)) == 0
+    variants = variants_data(cube)
+    assert len(variants) == 0
+    assert variants.columns[:2].tolist() == ['family', 'variant']
+
+
+def test_chunked_rocket_cube_matches_eager(tmp_path):
+    from space_missions.data import DATASET_PATH, clean_launches, read_raw
+    from space_missions.stream import iter_launches
+
+    df = clean_launches(read_raw())
+    eager = build_rocket_cube(df, build_rocket_index(df['Detail']))
+    # no snapshot in tmp_path, so the chunks are read from the CSV
+    chunks = iter_launches(DATASET_PATH, str(tmp_path), 500)
+    chunked = merge_rocket_cubes(*[build_rocket_cube(c, build_rocket_index(c['Detail'])) for c in chunks])
+    # a built cube is in variant order, a merged one in family order
+    pd.testing.assert_frame_equal(chunked, merge_rocket_cubes(eager))
@@ -0,0 +1,37 @@
+import pytest
+
+from space_missions.cube import load_cube
+from space_missions.sitemap import build_site_table, hex_bins
+from space_missions.sites import find_site, normalize_site
+
+
+@pytest.mark.parametrize('location, site', [
+    ('LC-39A, Kennedy Space Center, Florida, USA', 'Kennedy Space Center'),
+    ('Site 31/6, Baikonur Cosmodrome, Kazakhstan', 'Baikonur Cosmodrome'),
+    # as the CSV spells them, and with the accents restored
+    ('Rocket Lab LC-1A, M?\x81hia Peninsula, New Zealand', 'Mahia Peninsula'),
+    ('VLS Pad, Alc?›ntara Launch Center, Maranh?œo, Brazil', 'Alcantara Launch Center'),
+    ('Rocket Lab LC-1A, Māhia Peninsula, New Zealand', 'Mahia Peninsula'),
+    ('VLS Pad, Alcântara Launch Center, Maranhão, Brazil', 'Alcantara Launch Center'),
+    ('Pad 1, Nowhere Spaceport, Atlantis', None),
+])
+def test_find_site(location, site):
+    assert find_site(location) == site
+
+
+def test_normalize_site():
+    assert normalize_site('  Cape  Canaveral AFS ') == 'cape canaveral afs'
+    assert normalize_site('Ronald-Reagan Ballistic/Missile Defense Test Site') == \
+        'ronald reagan ballistic missile defense test site'
+
+
+def test_every_launch_has_a_site():
+    cube = load_cube()
+    table = build_site_table(cube)
+    assert table['launches'].sum() == cube['launches'].sum()
+    assert table['launch_site'].is_unique
+    assert table[['lat', 'lon']].notna().all().all()
+    assert {'Mahia Peninsula', 'Alcantara Launch Center'} <= set(table['launch_site'])
+    assert table['success_rate'].between(0, 100).all()
+    hexes = hex_bins(table, 2)
+    assert hexes['launches'].sum() == table['launches'].sum()
@@ -0,0 +1,78 @@
+# The chunked ingest mode against the eager load: the cube, company profile
+# and cost sketches folded chunk by chunk from the CSV equal those built over
+# the whole launch table, with or without a filter, and a filter matching no
+# launch gives empty aggregates of the same columns and dtypes.
+import pandas as pd
+import pytest
+
+from space_missions.companies import build_company_profile
+from space_missions.cube import build_cube
+from space_missions.data import DATASET_PATH, clean_launches, read_raw
+from space_missions.filters import build_index, filter_chunks, select_rows
+from space_missions.schema import compact
+from space_missions.sketches import build_cost_sketches
+from space_missions.stream import AGGREGATE_COLUMNS, aggregate_launches, iter_launches, load_aggregates
+
+
+CHUNK_ROWS = 500
+WHERES = [
+    {'year': (1990, 2005)},
+    {'country': ['USA', 'China'], 'Status Mission': ['Success']},
+    {'Company Name': ['SpaceX']},
+]
+NOTHING = {'country': ['Nowhere']}
+
+
+@pytest.fixture(scope='module')
+def launches():
+    return clean_launches(read_raw())
+
+
+def chunked(where, tmp_path):
+    # no snapshot in tmp_path, so the chunks are read from the CSV
+    chunks = iter_launches(DATASET_PATH, str(tmp_path), CHUNK_ROWS, AGGREGATE_COLUMNS)
+    return aggregate_launches(filter_chunks(chunks, where))
+
+
+def eager(launches, where=None):
+    if where:
+        launches = launches.iloc[select_rows(build_index(launches), where)]
+    return build_cube(launches), build_company_profile(launches), build_cost_sketches(launches)
+
+
+def test_chunked_aggregates_match_eager(launches, tmp_path):
+    for got, expected in zip(chunked(None, tmp_path), eager(launches)):
+        pd.testing.assert_frame_equal(got, expected)
+
+
+@pytest.mark.parametrize('where', WHERES)
+def test_filtered_chunked_aggregates_match_eager(launches, tmp_path, where):
+    cube, profile, costs = chunked(where, tmp_path)
+    expected_cube, expected_profile, expected_costs = eager(launches, where)
+    # a cube over a selection keeps every category, a merged one only those used
+    pd.testing.assert_frame_equal(compact(cube), compact(expected_cube))
+    pd.testing.assert_frame_equal(profile, expected_profile)
+    pd.testing.assert_frame_equal(costs, expected_costs)
+
+
+def dtypes(df):
+    return {col: dtype.name for col, dtype in df.dtypes.items()}
+
+
+def test_no_match_gives_empty_aggregates(launches, tmp_path):
+    for got, expected in zip(chunked(NOTHING, tmp_path), eager(launches, NOTHING)):
+        assert len(got) == 0
+        assert dtypes(got) == dtypes(expected)
+
+
+def test_no_chunks_gives_empty_aggregates(launches):
+    for got, expected in zip(aggregate_launches([]), eager(launches)):
+        assert len(got) == 0
+        assert dtypes(got) == dtypes(expected)
+
+
+def test_chunked_mode_loads_empty_aggregates(monkeypatch):
+    monkeypatch.setenv('SPACE_MISSIONS_INGEST', 'chunked')
+    cube, profile, costs = load_aggregates(where=NOTHING)
+    assert (len(cube), len(profile), len(costs)) == (0, 0, 0)
+    assert int(cube['launches'].sum()) == 0
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+from space_missions.sunburst import OTHER, fold_companies, load_sunburst_counts, sunburst_nodes
+
+
+def counts_of(rows):
+    return pd.DataFrame(rows, columns=['country', 'company', 'status', 'launches'])
+
+
+def check_tree(nodes):
+    # unique ids, every parent a node, and every parent's value the sum of
+    # its children's
+    assert nodes['id'].is_unique
+    parents = nodes[nodes['parent'] != '']
+    assert parents['parent'].isin(nodes['id']).all()
+    children = parents.groupby('parent')['launches'].sum()
+    assert (nodes.set_index('id')['launches'].reindex(children.index) == children).all()
+
+
+@pytest.mark.parametrize('top', [1, 3, 5, 10])
+def test_folding_keeps_the_totals(top):
+    counts = load_sunburst_counts()
+    folded = fold_companies(counts, top)
+    for by in [['country'], ['country', 'status']]:
+        pd.testing.assert_series_equal(
+            folded.groupby(by)['launches'].sum(), counts.groupby(by)['launches'].sum()
+        )
+    # top companies where there is an OTHER, at most one more where there is not
+    kept = folded[folded['company'] != OTHER].groupby('country')['company'].nunique()
+    other = folded[folded['company'] == OTHER]['country'].unique()
+    assert (kept[kept.index.isin(other)] == top).all()
+    assert (kept[~kept.index.isin(other)] <= top + 1).all()
+    check_tree(sunburst_nodes(counts, top))
+
+
+def test_a_single_company_is_not_folded_alone():
+    counts = counts_of([
+        ('X', 'A', 'Success', 5),
+        ('X', 'B', 'Success', 3),
+        ('X', 'B', 'Failure', 1),
+        ('Y', 'C', 'Success', 4),
+        ('Y', 'D', 'Success', 2),
+        ('Y', 'E', 'Failure', 1),
+    ])
+    folded = fold_companies(counts, 1)
+    assert folded[folded['country'] == 'X']['company'].tolist() == ['A', 'B', 'B']
+    assert sorted(folded[folded['country'] == 'Y']['company'].unique()) == ['C', OTHER]
+    assert folded[folded['company'] == OTHER]['launches'].sum() == 3
+
+
+def test_slashes_in_names_do_not_merge_nodes():
+    counts = counts_of([
+        ('X', 'A/B', 'C', 1),
+        ('X', 'A', 'B/C', 2),
+    ])
+    nodes = sunburst_nodes(counts)
+    assert len(nodes) == 5
+    check_tree(nodes)
+    assert nodes['label'].tolist() == ['X', 'A', 'A/B', 'B/C', 'C']